@@ -0,0 +1,45 @@
+"""
+Compares parsing every response twice, as the services used to do when
+checking for errors, with parsing it once through XmlUtils.parse.
+
+Run from the repository root:
+
+    python -m benchmarks.parse_benchmark
+"""
+
+from libtad.common import FakeTransport, XmlUtils
+import xml.etree.ElementTree as ET
+import timeit
+import tracemalloc
+
+def parse_twice(result: str) -> ET.Element:
+    XmlUtils.check_for_errors(result)
+    return ET.fromstring(result)
+
+def parse_once(result: str) -> ET.Element:
+    return XmlUtils.parse(result)
+
+def peak_memory(function, result: str) -> int:
+    tracemalloc.start()
+    function(result)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def main():
+    transport = FakeTransport(size=20000)
+    documents = {
+        "places": transport.get("https://api.xmltime.com/places?geo=1").decode("utf-8"),
+        "dstlist": transport.get("https://api.xmltime.com/dstlist?listplaces=1&timechanges=1").decode("utf-8"),
+    }
+
+    for name, result in documents.items():
+        print(f"{name} ({len(result) / 1024 / 1024:.1f} MiB)")
+        for label, function in (("parse twice", parse_twice), ("parse once", parse_once)):
+            seconds = min(timeit.repeat(lambda: function(result), number=1, repeat=5))
+            peak = peak_memory(function, result)
+            print(f"  {label:<12} {seconds * 1000:8.1f} ms  {peak / 1024 / 1024:8.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
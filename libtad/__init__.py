@@ -8,6 +8,24 @@ __all__ = [
         "TimeService", 
         "BusinessDateService", 
         "BusinessDurationService",
+        "HolidaysOptions",
+        "AstronomyOptions",
+        "AstrodataOptions",
+        "DSTOptions",
+        "ConvertTimeOptions",
+        "PlacesOptions",
+        "TimeOptions",
+        "BusinessDateOptions",
+        "BusinessDurationOptions",
+        "AsyncHolidaysService",
+        "AsyncAstronomyService",
+        "AsyncAstrodataService",
+        "AsyncDSTService",
+        "AsyncConvertTimeService",
+        "AsyncPlacesService",
+        "AsyncTimeService",
+        "AsyncBusinessDateService",
+        "AsyncBusinessDurationService",
         "datatypes.astro",
         "datatypes.business",
         "datatypes.converted_times",
@@ -21,15 +39,26 @@ from .datatypes import *
 from . import common
 from . import constants
 
-from libtad.holidays_service import HolidaysService
-from libtad.astrodata_service import AstrodataService
-from libtad.astronomy_service import AstronomyService
-from libtad.dst_service import DSTService
-from libtad.convert_time_service import ConvertTimeService
-from libtad.places_service import PlacesService
-from libtad.time_service import TimeService
-from libtad.business_date_service import BusinessDateService
-from libtad.business_duration_service import BusinessDurationService
+from libtad.holidays_service import HolidaysService, HolidaysOptions
+from libtad.astrodata_service import AstrodataService, AstrodataOptions
+from libtad.astronomy_service import AstronomyService, AstronomyOptions
+from libtad.dst_service import DSTService, DSTOptions
+from libtad.convert_time_service import ConvertTimeService, ConvertTimeOptions
+from libtad.places_service import PlacesService, PlacesOptions
+from libtad.time_service import TimeService, TimeOptions
+from libtad.business_date_service import BusinessDateService, BusinessDateOptions
+from libtad.business_duration_service import BusinessDurationService, BusinessDurationOptions
+from libtad.async_services import (
+        AsyncHolidaysService,
+        AsyncAstronomyService,
+        AsyncAstrodataService,
+        AsyncDSTService,
+        AsyncConvertTimeService,
+        AsyncPlacesService,
+        AsyncTimeService,
+        AsyncBusinessDateService,
+        AsyncBusinessDurationService,
+        )
 
 def __dir__():
         return __all__
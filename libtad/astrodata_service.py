@@ -2,13 +2,42 @@ from libtad.base_service import BaseService
 from libtad.datatypes.time import TADDateTime
 from libtad.datatypes.astro import AstronomyLocation, AstronomyObjectType
 from libtad.datatypes.places import LocationId
-from libtad.common import XmlUtils
+from libtad.common import XmlUtils, Transport, chunked, get_expiry
 import libtad.constants as Constants
-from typing import List, Dict, Union
+from typing import List, Dict, Iterator, NamedTuple, Tuple, Union
 import xml.etree.ElementTree as ET
-from urllib.parse import urlencode
-from urllib.request import urlopen, Request
-from ssl import SSLContext
+
+class AstrodataOptions(NamedTuple):
+    """
+    Immutable options of AstrodataService, which can be passed to a single
+    call.
+
+    Options that are not given take their default values. The options of a
+    service can be changed for a single call with e.g.
+    ``service.options._replace(is_localtime=True)``.
+
+    ...
+
+    Attributes
+    ----------
+    language : tuple of str
+        Languages of the returned texts.
+    is_localtime : bool
+        Whether the points in time are given in local time of the place
+        instead of UTC.
+    include_isotime : bool
+        Adds time stamps in ISO 8601 format.
+    include_utctime : bool
+        Adds UTC time stamps.
+    radius : int
+        Search radius in kilometers for translating coordinates to locations.
+    """
+
+    language: Tuple[str, ...] = (Constants.DEFAULTLANGUAGE,)
+    is_localtime: bool = False
+    include_isotime: bool = False
+    include_utctime: bool = False
+    radius: int = None
 
 class AstrodataService(BaseService):
     """
@@ -52,15 +81,29 @@ class AstrodataService(BaseService):
 
         Example:
         ``service.language.append("de")``
+    chunk_size : int
+        Maximum number of points in time queried in a single request. Longer
+        intervals are split into batches which are fetched concurrently, to
+        keep the request URLs within safe limits.
+    max_workers : int
+        Maximum number of batches fetched at the same time.
+    options : AstrodataOptions
+        The attributes above as immutable options, which calls use unless
+        options are passed to them. Assigning options sets the attributes.
 
     Methods
     -------
-    get_astrodata(object_type, place_id, interval)
+    get_astrodata(object_type, place_id, interval, deadline=None, options=None)
         Gets astronomical data for an object at a specific place on specific 
         points in time.
+    iter_astrodata(object_type, place_id, interval, deadline=None, options=None)
+        Gets astronomical data for an object at a specific place on specific
+        points in time, yielding the data batch by batch.
     """
 
-    def __init__(self, access_key: str, secret_key: str):
+    _options_type: type = AstrodataOptions
+
+    def __init__(self, access_key: str, secret_key: str, transport: Transport = None, options: AstrodataOptions = None):
         """
         Parameters
         ----------
@@ -68,19 +111,34 @@ class AstrodataService(BaseService):
             Access key.
         secret_key : str
             Secret key.
+        transport : Transport, optional
+            Transport used to send requests to the API.
+            Uses pooled keep-alive connections by default.
+        options : AstrodataOptions, optional
+            Options to set the attributes from.
+            Uses the default values by default.
         """
 
-        super().__init__(access_key, secret_key, "astrodata")
+        super().__init__(access_key, secret_key, "astrodata", transport)
         self.is_localtime: bool = False
         self.include_isotime: bool = False
         self.include_utctime: bool = False
         self.radius: int = None
+        self.chunk_size: int = 100
+        self.max_workers: int = 8
 
-    def get_astrodata(self, object_type: AstronomyObjectType, place_id: LocationId, interval: Union[TADDateTime, List[TADDateTime]]) -> List[AstronomyLocation]:
+        if options is not None:
+            self.options = options
+
+    def get_astrodata(self, object_type: AstronomyObjectType, place_id: LocationId, interval: Union[TADDateTime, List[TADDateTime]], deadline: float = None, options: AstrodataOptions = None) -> List[AstronomyLocation]:
         """
         Gets astronomical data for an object at a specific place on specific 
         points in time.
 
+        Intervals with more than `chunk_size` points in time are split into
+        several requests, which are sent concurrently. The results are
+        returned in the order of `interval` regardless.
+
         Parameters
         ----------
         object_type : AstronomyObjectType
@@ -90,6 +148,12 @@ class AstrodataService(BaseService):
         interval : TADDateTime or list of TADDateTime
             Points in time to query for, using comma to separate multiple 
             timestamps, in ISO 8601 timestamp format.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : AstrodataOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
 
         Returns
         -------
@@ -98,6 +162,49 @@ class AstrodataService(BaseService):
 
         """
 
+        options = self._get_options(options)
+        batches: List[List[TADDateTime]] = self.__get_batches(object_type, place_id, interval)
+        arguments: List[Dict[str, object]] = [self.__get_arguments(object_type, place_id, batch, options) for batch in batches]
+        return self._execute_all(arguments, self.__from_xml, self.__merge, self.max_workers, get_expiry(deadline))
+
+    def iter_astrodata(self, object_type: AstronomyObjectType, place_id: LocationId, interval: Union[TADDateTime, List[TADDateTime]], deadline: float = None, options: AstrodataOptions = None) -> Iterator[Tuple[List[TADDateTime], List[AstronomyLocation]]]:
+        """
+        Gets astronomical data for an object at a specific place on specific
+        points in time, yielding the data batch by batch.
+
+        The batches of at most `chunk_size` points in time are requested
+        concurrently and yielded in the order of `interval`, each as soon as
+        it and all batches before it have been received.
+
+        Parameters
+        ----------
+        object_type : AstronomyObjectType
+            The astronomical object type.
+        place_id : LocationId
+            Place identifier.
+        interval : TADDateTime or list of TADDateTime
+            Points in time to query for.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : AstrodataOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
+
+        Returns
+        -------
+        astronomy_locations : iterator of tuple
+            Pairs of the points in time of a batch and the astronomical data
+            for them.
+
+        """
+
+        options = self._get_options(options)
+        batches: List[List[TADDateTime]] = self.__get_batches(object_type, place_id, interval)
+        arguments: List[Dict[str, object]] = [self.__get_arguments(object_type, place_id, batch, options) for batch in batches]
+        return self._execute_iter(batches, arguments, self.__from_xml, self.max_workers, ordered=True, expires=get_expiry(deadline))
+
+    def __get_batches(self, object_type: AstronomyObjectType, place_id: LocationId, interval: Union[TADDateTime, List[TADDateTime]]) -> List[List[TADDateTime]]:
         if type(interval) is TADDateTime:
             interval = [interval]
 
@@ -109,44 +216,36 @@ class AstrodataService(BaseService):
         if not ID:
             raise ValueError("An argument is invalid")
 
-        args: Dict[str, object] = self._authentication_options.copy()
+        return chunked(interval, self.chunk_size)
+
+    def __get_arguments(self, object_type: AstronomyObjectType, place_id: LocationId, interval: List[TADDateTime], options: AstrodataOptions) -> Dict[str, object]:
+        args: Dict[str, object] = self._authentication_options
         args["placeid"] = place_id
         args["object"] = object_type.name.lower()
         args["interval"] = ",".join([i._get_second_precision_str() for i in interval])
 
-        return self.__retrieve_astrodata(args)
-
-    def __retrieve_astrodata(self, args: Dict[str, object]) -> List[AstronomyLocation]:
-        arguments: Dict[str, object] = self.__get_optional_arguments(args)
-        url: str = Constants.ENTRYPOINT + "/" + self._service_name + "?" + urlencode(arguments)
-        req = Request(
-            url,
-            headers = { "User-Agent": "libtad-py"}
-            )
-
-        with urlopen(req, context=SSLContext()) as f:
-            result: str = f.read().decode("utf-8")
+        return self._apply_template(args, self.__get_optional_arguments, options)
 
-        return self.__from_xml(result)
+    def __merge(self, results: List[List[AstronomyLocation]]) -> List[AstronomyLocation]:
+        return AstronomyLocation._merge(results, "result")
 
-    def __get_optional_arguments(self, args: Dict[str, object]) -> Dict[str, object]:
-        optional_args: Dict[str, str] = args
+    def __get_optional_arguments(self, options: AstrodataOptions) -> Dict[str, object]:
+        optional_args: Dict[str, object] = {}
         
-        optional_args["localtime"] = int(self.is_localtime)
-        optional_args["isotime"] = int(self.include_isotime)
-        optional_args["lang"] = ",".join(self.language)
-        optional_args["utctime"] = int(self.include_utctime)
+        optional_args["localtime"] = int(options.is_localtime)
+        optional_args["isotime"] = int(options.include_isotime)
+        optional_args["lang"] = ",".join(options.language)
+        optional_args["utctime"] = int(options.include_utctime)
         optional_args["out"] = Constants.DEFAULTRETURNFORMAT
         optional_args["verbosetime"] = str(Constants.DEFAULTVERBOSETIMEVALUE)
         optional_args["version"] = str(self._version)
 
-        if self.radius is not None:
-            optional_args["radius"] = str(self.radius)
+        if options.radius is not None:
+            optional_args["radius"] = str(options.radius)
 
         return optional_args
 
     def __from_xml(self, result: str) -> List[AstronomyLocation]:
-        XmlUtils.check_for_errors(result)
-        xml: ET.Element = ET.fromstring(result)
-        return [AstronomyLocation(location) for location in xml.findall("location")]
+        xml: ET.Element = XmlUtils.parse(result)
+        return [AstronomyLocation(location, self.lazy_parsing) for location in xml.findall("location")]
 
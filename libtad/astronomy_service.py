@@ -3,13 +3,45 @@ from libtad.datatypes.astro import AstronomyEventClass, AstronomyObjectType, Ast
 from libtad.datatypes.places import LocationId
 from libtad.datatypes.time import TADDateTime
 from libtad.common.exceptions import QueriedDateOutOfRangeException
-from libtad.common import XmlUtils
+from libtad.common import XmlUtils, Transport, get_expiry
 import libtad.constants as Constants
-from typing import List, Dict
+from typing import List, Dict, Iterator, NamedTuple, Tuple
+from datetime import date, timedelta
 import xml.etree.ElementTree as ET
-from urllib.parse import urlencode
-from urllib.request import urlopen, Request
-from ssl import SSLContext
+
+class AstronomyOptions(NamedTuple):
+    """
+    Immutable options of AstronomyService, which can be passed to a single
+    call.
+
+    Options that are not given take their default values. The options of a
+    service can be changed for a single call with e.g.
+    ``service.options._replace(types=AstronomyEventClass.Phase)``.
+
+    ...
+
+    Attributes
+    ----------
+    language : tuple of str
+        Languages of the returned texts.
+    types : AstronomyEventClass
+        Event classes to include.
+    include_coordinates : bool
+        Return coordinates for the Geography object.
+    include_isotime : bool
+        Adds time stamps in ISO 8601 format to all events.
+    include_utctime : bool
+        Adds UTC time stamps to all events.
+    radius : int
+        Search radius in kilometers for translating coordinates to locations.
+    """
+
+    language: Tuple[str, ...] = (Constants.DEFAULTLANGUAGE,)
+    types: AstronomyEventClass = AstronomyEventClass(0)
+    include_coordinates: bool = True
+    include_isotime: bool = False
+    include_utctime: bool = False
+    radius: int = None
 
 class AstronomyService(BaseService):
     """
@@ -55,14 +87,28 @@ class AstronomyService(BaseService):
 
         Example:
         ``service.language.append("de")``
-    
+    window_days : int
+        Maximum number of days queried in a single request. Longer date
+        ranges are split into windows of this many days, e.g. 31 for about
+        monthly or 366 for yearly windows, which are fetched concurrently.
+    max_workers : int
+        Maximum number of windows fetched at the same time.
+    options : AstronomyOptions
+        The attributes above as immutable options, which calls use unless
+        options are passed to them. Assigning options sets the attributes.
+
     Methods
     -------
-    get_astronomical_info(object_type, place_id, start_date, end_date=None)
+    get_astronomical_info(object_type, place_id, start_date, end_date=None, deadline=None, options=None)
         Gets the specified object type for a specified place by start date.        
+    iter_astronomical_info(object_type, place_id, start_date, end_date=None, deadline=None, options=None)
+        Gets the specified object type for a specified place by date range,
+        yielding the information window by window.
     """
 
-    def __init__(self, access_key: str, secret_key: str):
+    _options_type: type = AstronomyOptions
+
+    def __init__(self, access_key: str, secret_key: str, transport: Transport = None, options: AstronomyOptions = None):
         """
         Parameters
         ----------
@@ -70,19 +116,34 @@ class AstronomyService(BaseService):
             Access key.
         secret_key : str
             Secret key.
+        transport : Transport, optional
+            Transport used to send requests to the API.
+            Uses pooled keep-alive connections by default.
+        options : AstronomyOptions, optional
+            Options to set the attributes from.
+            Uses the default values by default.
         """
 
-        super().__init__(access_key, secret_key, "astronomy")
+        super().__init__(access_key, secret_key, "astronomy", transport)
         self.types: AstronomyEventClass = AstronomyEventClass(0)
         self.include_coordinates: bool = True
         self.include_isotime: bool = False
         self.include_utctime: bool = False
         self.radius: int = None
+        self.window_days: int = 366
+        self.max_workers: int = 8
+
+        if options is not None:
+            self.options = options
 
-    def get_astronomical_info(self, object_type: AstronomyObjectType, place_id: LocationId, start_date: TADDateTime, end_date: TADDateTime = None) -> List[AstronomyLocation]:
+    def get_astronomical_info(self, object_type: AstronomyObjectType, place_id: LocationId, start_date: TADDateTime, end_date: TADDateTime = None, deadline: float = None, options: AstronomyOptions = None) -> List[AstronomyLocation]:
         """
         Gets the specified object type for a specified place by start date.
 
+        Date ranges longer than `window_days` are split into several
+        requests, which are sent concurrently. The days are returned in date
+        order regardless.
+
         Parameters
         ----------
         object_type : AstronomyObjectType
@@ -93,6 +154,12 @@ class AstronomyService(BaseService):
             Start date.
         end_date : TADDateTime, optional
             End date.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : AstronomyOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
         
         Returns
         -------
@@ -101,6 +168,48 @@ class AstronomyService(BaseService):
 
         """
 
+        arguments: List[Dict[str, object]] = self.__get_window_arguments(object_type, place_id, start_date, end_date, self._get_options(options))
+        return self._execute_all(arguments, self.__from_xml, self.__merge, self.max_workers, get_expiry(deadline))
+
+    def iter_astronomical_info(self, object_type: AstronomyObjectType, place_id: LocationId, start_date: TADDateTime, end_date: TADDateTime = None, deadline: float = None, options: AstronomyOptions = None) -> Iterator[Tuple[Tuple[TADDateTime, TADDateTime], List[AstronomyLocation]]]:
+        """
+        Gets the specified object type for a specified place by date range,
+        yielding the information window by window.
+
+        The windows of at most `window_days` days are requested concurrently
+        and yielded in date order, each as soon as it and all windows before
+        it have been received.
+
+        Parameters
+        ----------
+        object_type : AstronomyObjectType
+            The astronomical object type.
+        place_id : LocationId
+            Place identifier.
+        start_date : TADDateTime
+            Start date.
+        end_date : TADDateTime, optional
+            End date.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : AstronomyOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
+
+        Returns
+        -------
+        astronomy_locations : iterator of tuple
+            Pairs of the (start date, end date) window and the astronomical
+            information for the days in it.
+
+        """
+
+        arguments: List[Dict[str, object]] = self.__get_window_arguments(object_type, place_id, start_date, end_date, self._get_options(options))
+        windows: List[Tuple[TADDateTime, TADDateTime]] = [(args["startdt"], args.get("enddt", args["startdt"])) for args in arguments]
+        return self._execute_iter(windows, arguments, self.__from_xml, self.max_workers, ordered=True, expires=get_expiry(deadline))
+
+    def __get_window_arguments(self, object_type: AstronomyObjectType, place_id: LocationId, start_date: TADDateTime, end_date: TADDateTime, options: AstronomyOptions) -> List[Dict[str, object]]:
         if type(place_id) is not LocationId or start_date.year == 0 or not object_type:
             raise ValueError("An argument is invalid")
 
@@ -109,58 +218,72 @@ class AstronomyService(BaseService):
             raise ValueError("An argument is invalid")
 
         if end_date and end_date < start_date:
-            QueriedDateOutOfRangeException("End date cannot be before start date")
+            raise QueriedDateOutOfRangeException("End date cannot be before start date")
 
-        args: Dict[str, object] = self._authentication_options.copy()
-        args["placeid"] = place_id
-        args["object"] = object_type.name.lower()
-        args["startdt"] = str(start_date)
-        if end_date:
-            args["enddt"] = str(end_date)
+        windows: List[Tuple[TADDateTime, TADDateTime]] = self.__get_windows(start_date, end_date) if end_date else [(start_date, None)]
+        arguments: List[Dict[str, object]] = []
 
-        return self.__retrieve_astronomical_info(args)
+        for window_start, window_end in windows:
+            args: Dict[str, object] = self._authentication_options
+            args["placeid"] = place_id
+            args["object"] = object_type.name.lower()
+            args["startdt"] = window_start
+            if window_end:
+                args["enddt"] = window_end
 
-    def __retrieve_astronomical_info(self, args: Dict[str, object]) -> List[AstronomyLocation]:
-        arguments: Dict[str, object] = self.__get_optional_arguments(args)
-        url: str = Constants.ENTRYPOINT + "/" + self._service_name + "?" + urlencode(arguments)
-        req = Request(
-                url,
-                headers = {"User-Agent": "libtad-py"}
-                )
+            arguments.append(self._apply_template(args, self.__get_optional_arguments, options))
 
-        with urlopen(req, context=SSLContext()) as f:
-            result: str = f.read().decode("utf-8")
+        return arguments
 
-        return self.__from_xml(result)
-        
-    def __get_optional_arguments(self, args: Dict[str, object]) -> Dict[str, object]:
-        optional_args: Dict[str, str] = args
-        types: int = self.__get_astronomy_event_types()
-
-        optional_args["geo"] = int(self.include_coordinates)
-        optional_args["isotime"] = int(self.include_isotime)
-        optional_args["lang"] = ",".join(self.language)
-        optional_args["utctime"] = int(self.include_utctime)
+    def __get_windows(self, start_date: TADDateTime, end_date: TADDateTime) -> List[Tuple[TADDateTime, TADDateTime]]:
+        if self.window_days <= 0:
+            raise ValueError("window_days must be positive")
+
+        start: date = date(start_date.year, start_date.month, start_date.day)
+        end: date = date(end_date.year, end_date.month, end_date.day)
+        length: timedelta = timedelta(days=self.window_days)
+        windows: List[Tuple[TADDateTime, TADDateTime]] = []
+
+        window_start: TADDateTime = start_date
+        while end - start >= length:
+            start += length
+            last: date = start - timedelta(days=1)
+            windows.append((window_start, TADDateTime(last.year, last.month, last.day)))
+            window_start = TADDateTime(start.year, start.month, start.day)
+
+        windows.append((window_start, end_date))
+        return windows
+
+    def __merge(self, results: List[List[AstronomyLocation]]) -> List[AstronomyLocation]:
+        return AstronomyLocation._merge(results, "days")
+
+    def __get_optional_arguments(self, options: AstronomyOptions) -> Dict[str, object]:
+        optional_args: Dict[str, object] = {}
+        types: int = self.__get_astronomy_event_types(options)
+
+        optional_args["geo"] = int(options.include_coordinates)
+        optional_args["isotime"] = int(options.include_isotime)
+        optional_args["lang"] = ",".join(options.language)
+        optional_args["utctime"] = int(options.include_utctime)
         optional_args["out"] = Constants.DEFAULTRETURNFORMAT
         optional_args["verbosetime"] = str(Constants.DEFAULTVERBOSETIMEVALUE)
         optional_args["version"] = str(self._version)
 
-        if self.radius is not None:
-            optional_args["radius"] = str(self.radius)
+        if options.radius is not None:
+            optional_args["radius"] = str(options.radius)
         if types:
             optional_args["types"] = types
 
         return optional_args
 
     def __from_xml(self, result: str) -> List[AstronomyLocation]:
-        XmlUtils.check_for_errors(result)
-        xml: ET.Element = ET.fromstring(result)
-        return [AstronomyLocation(location) for location in xml.findall("location")]
+        xml: ET.Element = XmlUtils.parse(result)
+        return [AstronomyLocation(location, self.lazy_parsing) for location in xml.findall("location")]
 
-    def __get_astronomy_event_types(self) -> str:
+    def __get_astronomy_event_types(self, options: AstronomyOptions) -> str:
         included_strings: List[str] = []
         for astro_item in AstronomyEventClass:
-            if astro_item & self.types:
+            if astro_item & options.types:
                 included_strings.append(AstronomyEventClass.resolve(astro_item)[1])
         included: str = ",".join(included_strings)
         return included
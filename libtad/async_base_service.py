@@ -0,0 +1,136 @@
+from libtad.base_service import BaseService
+from libtad.common import AsyncTransport, AsyncPooledTransport, AsyncSingleFlight, CircuitBreaker, XmlUtils, get_remaining
+from libtad.common.exceptions import CircuitOpenException
+import libtad.constants as Constants
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Set, Tuple
+from functools import partial
+import asyncio
+import time
+import xml.etree.ElementTree as ET
+
+class AsyncBaseService(BaseService):
+    """
+    Base class for the asynchronous services.
+
+    An asynchronous service derives from this class and from its synchronous
+    counterpart, so argument building and XML parsing are shared between
+    both. Only the request itself is replaced by a coroutine, which makes
+    every service method return an awaitable, and every streaming method an
+    asynchronous iterator. Invalid arguments are still reported immediately
+    with a ValueError.
+    """
+
+    _requests_in_flight: AsyncSingleFlight = AsyncSingleFlight()
+    _refresh_tasks: Set[asyncio.Future] = set()
+
+    def _default_transport(self) -> AsyncTransport:
+        return AsyncPooledTransport.shared()
+
+    async def _get_response(self, arguments: Dict[str, object], expires: float = None) -> str:
+        result: bytes = await self._transport.get(self._get_url(arguments), {"User-Agent": Constants.USERAGENT}, timeout=get_remaining(expires))
+        return result.decode("utf-8")
+
+    async def _execute(self, arguments: Dict[str, object], parser: Callable[[str], object], expires: float = None) -> object:
+        key: str = self._get_cache_key(arguments)
+        cached = self._get_cached(arguments, parser, key)
+        if cached is not None:
+            return cached
+
+        if not self.coalesce_requests:
+            return await self.__fetch(arguments, parser, key, expires)
+
+        return await self._requests_in_flight.do(self._get_flight_key(arguments), lambda: self.__fetch(arguments, parser, key, expires), get_remaining(expires))
+
+    async def _execute_all(self, arguments: List[Dict[str, object]], parser: Callable[[str], object], merge: Callable[[List[object]], object], max_workers: int, expires: float = None) -> object:
+        semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+        async def execute(args: Dict[str, object]) -> object:
+            async with semaphore:
+                return await self._execute(args, parser, expires)
+
+        results: List[object] = await asyncio.gather(*[execute(args) for args in arguments])
+        return merge(results)
+
+    async def _execute_iter(self, keys: List[object], arguments: List[Dict[str, object]], parser: Callable[[str], object], max_workers: int, ordered: bool = False, expires: float = None) -> AsyncIterator[Tuple[object, object]]:
+        semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+        async def execute(key: object, args: Dict[str, object]) -> Tuple[object, object]:
+            async with semaphore:
+                return key, await self._execute(args, parser, expires)
+
+        tasks: List[asyncio.Task] = [asyncio.ensure_future(execute(key, args)) for key, args in zip(keys, arguments)]
+        try:
+            for task in (tasks if ordered else asyncio.as_completed(tasks)):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _refresh(self, arguments: Dict[str, object], parser: Callable[[str], object], key: str) -> None:
+        refresh_key: tuple = self._begin_refresh(key)
+        if refresh_key is None:
+            return
+
+        task: asyncio.Future = asyncio.ensure_future(self.__fetch(arguments, parser, key, None))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(partial(self.__refreshed, refresh_key))
+
+    def __refreshed(self, refresh_key: tuple, task: asyncio.Future) -> None:
+        self._refresh_tasks.discard(task)
+        self._end_refresh(refresh_key)
+        # The stale entry is kept after a failed refresh, and refreshed
+        # again on the next read.
+        if not task.cancelled():
+            task.exception()
+
+    async def __fetch(self, arguments: Dict[str, object], parser: Callable[[str], object], key: str, expires: float) -> object:
+        try:
+            if self.retry_policy is not None:
+                response: str = await self.retry_policy.call_async(lambda: self.__request(arguments, expires), get_remaining(expires))
+            else:
+                response = await self.__request(arguments, expires)
+        except CircuitOpenException:
+            stale = self._get_stale(key, parser)
+            if stale is None:
+                raise
+            return stale
+
+        result = parser(response)
+        if key is not None:
+            self.cache.set(self._service_name, key, response if self.cache.stores_response else result)
+
+        return result
+
+    async def __request(self, arguments: Dict[str, object], expires: float) -> str:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(get_remaining(expires))
+
+        return await self.__guard(lambda: self._get_response(arguments, expires))
+
+    async def __guard(self, function: Callable[[], object]) -> object:
+        breaker: CircuitBreaker = self.circuit_breaker
+        if breaker is None:
+            return await function()
+
+        ticket: int = breaker.before_request()
+        start: float = time.monotonic()
+        try:
+            result = await function()
+        except BaseException as exception:
+            breaker.record_failure(time.monotonic() - start, exception, ticket)
+            raise
+
+        breaker.record_success(time.monotonic() - start, ticket)
+        return result
+
+    def _stream(self, arguments: Dict[str, object], tag: str, factory: Callable[[ET.Element], object], expires: float = None) -> AsyncIterator[object]:
+        return self.__stream(self._get_url(arguments), tag, factory, expires)
+
+    async def __stream(self, url: str, tag: str, factory: Callable[[ET.Element], object], expires: float) -> AsyncIterator[object]:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(get_remaining(expires))
+
+        body: bytes = await self.__guard(lambda: self._transport.get(url, {"User-Agent": Constants.USERAGENT}, timeout=get_remaining(expires)))
+        chunks: Iterator[bytes] = (body[i:i + XmlUtils.CHUNK_SIZE] for i in range(0, len(body), XmlUtils.CHUNK_SIZE))
+        for node in XmlUtils.iterparse(chunks, tag):
+            yield factory(node)
@@ -0,0 +1,174 @@
+from libtad.async_base_service import AsyncBaseService
+from libtad.holidays_service import HolidaysService
+from libtad.astronomy_service import AstronomyService
+from libtad.astrodata_service import AstrodataService
+from libtad.dst_service import DSTService
+from libtad.convert_time_service import ConvertTimeService
+from libtad.places_service import PlacesService
+from libtad.time_service import TimeService
+from libtad.business_date_service import BusinessDateService
+from libtad.business_duration_service import BusinessDurationService
+
+class AsyncHolidaysService(AsyncBaseService, HolidaysService):
+    """
+    Asynchronous variant of HolidaysService.
+
+    Supports the same attributes and arguments as HolidaysService, but
+    requests are sent without blocking the event loop and the methods below
+    must be awaited.
+
+    ...
+
+    Methods
+    -------
+    holidays_for_country(country_code, year=datetime.now().year, deadline=None, options=None)
+        Awaitable variant of HolidaysService.holidays_for_country.
+    holidays_for_countries(queries, deadline=None, options=None)
+        Awaitable variant of HolidaysService.holidays_for_countries.
+    iter_holidays_for_countries(queries, deadline=None, options=None)
+        Asynchronous iterator variant of
+        HolidaysService.iter_holidays_for_countries.
+    """
+
+class AsyncAstronomyService(AsyncBaseService, AstronomyService):
+    """
+    Asynchronous variant of AstronomyService.
+
+    Supports the same attributes and arguments as AstronomyService, but
+    requests are sent without blocking the event loop and the methods below
+    must be awaited.
+
+    ...
+
+    Methods
+    -------
+    get_astronomical_info(object_type, place_id, start_date, end_date=None, deadline=None, options=None)
+        Awaitable variant of AstronomyService.get_astronomical_info.
+    iter_astronomical_info(object_type, place_id, start_date, end_date=None, deadline=None, options=None)
+        Asynchronous iterator variant of
+        AstronomyService.iter_astronomical_info.
+    """
+
+class AsyncAstrodataService(AsyncBaseService, AstrodataService):
+    """
+    Asynchronous variant of AstrodataService.
+
+    Supports the same attributes and arguments as AstrodataService, but
+    requests are sent without blocking the event loop and the methods below
+    must be awaited.
+
+    ...
+
+    Methods
+    -------
+    get_astrodata(object_type, place_id, interval, deadline=None, options=None)
+        Awaitable variant of AstrodataService.get_astrodata.
+    iter_astrodata(object_type, place_id, interval, deadline=None, options=None)
+        Asynchronous iterator variant of AstrodataService.iter_astrodata.
+    """
+
+class AsyncDSTService(AsyncBaseService, DSTService):
+    """
+    Asynchronous variant of DSTService.
+
+    Supports the same attributes and arguments as DSTService, but requests
+    are sent without blocking the event loop and the methods below must be
+    awaited.
+
+    ...
+
+    Methods
+    -------
+    get_daylight_saving_time(country_code=None, year=None, deadline=None, options=None)
+        Awaitable variant of DSTService.get_daylight_saving_time.
+    iter_daylight_saving_time(country_code=None, year=None, deadline=None, options=None)
+        Asynchronous iterator variant of DSTService.iter_daylight_saving_time.
+    """
+
+class AsyncConvertTimeService(AsyncBaseService, ConvertTimeService):
+    """
+    Asynchronous variant of ConvertTimeService.
+
+    Supports the same attributes and arguments as ConvertTimeService, but
+    requests are sent without blocking the event loop and the methods below
+    must be awaited.
+
+    ...
+
+    Methods
+    -------
+    convert_time(from_id, time, to_ids=None, deadline=None, options=None)
+        Awaitable variant of ConvertTimeService.convert_time.
+    convert_times(from_id, times, to_ids=None, deadline=None, options=None)
+        Awaitable variant of ConvertTimeService.convert_times.
+    """
+
+class AsyncPlacesService(AsyncBaseService, PlacesService):
+    """
+    Asynchronous variant of PlacesService.
+
+    Supports the same attributes and arguments as PlacesService, but
+    requests are sent without blocking the event loop and the methods below
+    must be awaited.
+
+    ...
+
+    Methods
+    -------
+    get_places(deadline=None, options=None)
+        Awaitable variant of PlacesService.get_places.
+    iter_places(deadline=None, options=None)
+        Asynchronous iterator variant of PlacesService.iter_places.
+    """
+
+class AsyncTimeService(AsyncBaseService, TimeService):
+    """
+    Asynchronous variant of TimeService.
+
+    Supports the same attributes and arguments as TimeService, but requests
+    are sent without blocking the event loop and the methods below must be
+    awaited.
+
+    ...
+
+    Methods
+    -------
+    current_time_for_place(place_id, deadline=None, options=None)
+        Awaitable variant of TimeService.current_time_for_place.
+    """
+
+class AsyncBusinessDateService(AsyncBaseService, BusinessDateService):
+    """
+    Asynchronous variant of BusinessDateService.
+
+    Supports the same attributes and arguments as BusinessDateService, but
+    requests are sent without blocking the event loop and the methods below
+    must be awaited.
+
+    ...
+
+    Methods
+    -------
+    get_business_date_for_place(place_id, start_date, days, deadline=None, options=None)
+        Awaitable variant of BusinessDateService.get_business_date_for_place.
+    get_business_date_for_country(country_iso, start_date, days, state_iso=None, deadline=None, options=None)
+        Awaitable variant of BusinessDateService.get_business_date_for_country.
+    """
+
+class AsyncBusinessDurationService(AsyncBaseService, BusinessDurationService):
+    """
+    Asynchronous variant of BusinessDurationService.
+
+    Supports the same attributes and arguments as BusinessDurationService,
+    but requests are sent without blocking the event loop and the methods
+    below must be awaited.
+
+    ...
+
+    Methods
+    -------
+    get_business_duration_for_place(place_id, start_date, end_date, deadline=None, options=None)
+        Awaitable variant of BusinessDurationService.get_business_duration_for_place.
+    get_business_duration_for_country(country_iso, start_date, end_date, state_iso=None, deadline=None, options=None)
+        Awaitable variant of BusinessDurationService.get_business_duration_for_country.
+    """
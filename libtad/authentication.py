@@ -1,22 +1,98 @@
-import base64, datetime, hashlib, hmac, urllib
+import base64, hashlib, hmac, threading, time
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Tuple
 
 class Authentication:
-    def __init__(self, service: str, access_key: str, secret_key: str):
+    """
+    Signs the requests of a service.
+
+    The HMAC key is prepared once, and a signature is reused for all
+    requests until it reaches `max_age`. The next request after that signs
+    a new timestamp, so long-lived services never send stale signatures.
+    Signing is thread-safe, and reusing a signature only costs a clock read.
+
+    ...
+
+    Attributes
+    ----------
+    max_age : float
+        Number of seconds a signature is reused before a new one is made.
+
+    Methods
+    -------
+    get_authentication_args(seed=None)
+        Gets the authentication arguments of a request.
+    refresh()
+        Makes a new signature for the following requests.
+    """
+
+    def __init__(self, service: str, access_key: str, secret_key: str, max_age: float = 60.0):
+        """
+        Parameters
+        ----------
+        service : str
+            Name of the service the requests are sent to.
+        access_key : str
+            The access key of the account.
+        secret_key : str
+            The secret key of the account.
+        max_age : float, optional
+            Number of seconds a signature is reused.
+        """
+
+        self.max_age: float = max_age
         self.__service: str = service
         self.__access_key: str = access_key
-        self.__secret_key: str = secret_key
+        self.__digester = hmac.new(bytes(secret_key, encoding="utf8"), digestmod=hashlib.sha1)
+        self.__signed: Tuple[Dict[str, object], float] = None
+        self.__lock = threading.Lock()
 
     def get_authentication_args(self, seed: Dict[str, object] = None) -> Dict[str, object]:
-        timestamp = datetime.utcnow().isoformat()
-        message = self.__access_key + self.__service + timestamp;
-        digester = hmac.new(bytes(self.__secret_key, encoding="utf8"), bytes(message, encoding="utf8"), hashlib.sha1)
+        """
+        Gets the authentication arguments of a request.
+
+        Parameters
+        ----------
+        seed : dict, optional
+            Arguments to add the authentication arguments to.
+
+        Returns
+        -------
+        args : dict
+            `seed`, or a new dictionary, with the access key, timestamp and
+            signature set.
+
+        """
+
+        signed = self.__signed
+        if signed is None or time.monotonic() - signed[1] >= self.max_age:
+            with self.__lock:
+                signed = self.__signed
+                if signed is None or time.monotonic() - signed[1] >= self.max_age:
+                    signed = self.__sign()
 
         args: Dict[str, object] = seed if seed is not None else {}
+        args.update(signed[0])
+        return args
+
+    def refresh(self) -> None:
+        """
+        Makes a new signature for the following requests.
+        """
+
+        with self.__lock:
+            self.__sign()
+
+    def __sign(self) -> Tuple[Dict[str, object], float]:
+        timestamp = datetime.utcnow().isoformat()
+        message = self.__access_key + self.__service + timestamp
+        digester = self.__digester.copy()
+        digester.update(bytes(message, encoding="utf8"))
+
+        args: Dict[str, object] = {}
         args["accesskey"] = self.__access_key
         args["timestamp"] = timestamp
         args["signature"] = base64.b64encode(digester.digest())
 
-        return args
-
+        self.__signed = (args, time.monotonic())
+        return self.__signed
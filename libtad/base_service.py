@@ -1,14 +1,81 @@
 from libtad.authentication import Authentication
+from libtad.common import Transport, PooledTransport, XmlUtils, QueryTemplate, QueryArguments, Cache, SingleFlight, RateLimiter, RetryPolicy, CircuitBreaker, map_concurrently, iter_concurrently, get_remaining
+from libtad.common.exceptions import CircuitOpenException
 import libtad.constants as Constants
-from typing import Dict, List
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Set, Tuple
+import threading
+import time
+import xml.etree.ElementTree as ET
 
 class BaseService:
-    def __init__(self, access_key: str, secret_key: str, service_name: str):
+    _requests_in_flight: SingleFlight = SingleFlight()
+    _refreshes: Set[tuple] = set()
+    _refreshes_lock = threading.Lock()
+    __refresh_executor: ThreadPoolExecutor = None
+
+    _options_type: type = None
+
+    def __init__(self, access_key: str, secret_key: str, service_name: str, transport: Transport = None):
+        self._options: tuple = None
+        self._templates: Dict[tuple, QueryTemplate] = {}
         self._version: int = 3
         self.__language: List[str] = [Constants.DEFAULTLANGUAGE]
         self._service_name: str = service_name
-        auth = Authentication(service_name, access_key, secret_key)
-        self._authentication_options: Dict[str, object] = auth.get_authentication_args()
+        self._transport: Transport = transport if transport is not None else self._default_transport()
+        self.cache: Cache = None
+        self.coalesce_requests: bool = True
+        self.lazy_parsing: bool = False
+        self.rate_limiter: RateLimiter = RateLimiter.shared()
+        self.retry_policy: RetryPolicy = RetryPolicy()
+        self.circuit_breaker: CircuitBreaker = None
+        self.authentication: Authentication = Authentication(service_name, access_key, secret_key)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        # Calls read the settings from an immutable snapshot, which is taken
+        # again on the next call after a change.
+        if not name.startswith("_"):
+            self._options = None
+
+    @property
+    def options(self) -> tuple:
+        options: tuple = self._options
+        # List settings, such as the languages, may be changed in place, e.g.
+        # by appending to them.
+        if options is None or self.__lists_changed(options):
+            options = self._options_type(*[self.__freeze(getattr(self, name)) for name in self._options_type._fields])
+            self._options = options
+        return options
+
+    @options.setter
+    def options(self, value: tuple):
+        if not isinstance(value, self._options_type):
+            raise ValueError("An argument is invalid")
+
+        for name, option in zip(value._fields, value):
+            setattr(self, name, list(option) if isinstance(option, tuple) else option)
+
+    def _get_options(self, options: tuple = None) -> tuple:
+        if options is None:
+            return self.options
+        if not isinstance(options, self._options_type):
+            raise ValueError("An argument is invalid")
+        return self._options_type(*[self.__freeze(option) for option in options])
+
+    def __lists_changed(self, options: tuple) -> bool:
+        for name, option in zip(options._fields, options):
+            if isinstance(option, tuple):
+                value = getattr(self, name)
+                if isinstance(value, list) and tuple(value) != option:
+                    return True
+        return False
+
+    @staticmethod
+    def __freeze(value: object) -> object:
+        # Lists are stored as tuples, so options can key the templates.
+        return tuple(value) if isinstance(value, list) else value
 
     @property
     def language(self):
@@ -21,3 +88,188 @@ class BaseService:
         else:
             self.__language = value
 
+    @property
+    def _authentication_options(self) -> Dict[str, object]:
+        return self.authentication.get_authentication_args()
+
+    @property
+    def transport(self) -> Transport:
+        return self._transport
+
+    @transport.setter
+    def transport(self, value: Transport):
+        self._transport = value if value is not None else self._default_transport()
+
+    def _default_transport(self) -> Transport:
+        return PooledTransport.shared()
+
+    def _get_url(self, arguments: Dict[str, object]) -> str:
+        if isinstance(arguments, QueryArguments):
+            return Constants.ENTRYPOINT + "/" + self._service_name + "?" + arguments.get_query()
+        return Constants.ENTRYPOINT + "/" + self._service_name + "?" + urlencode(arguments)
+
+    def _apply_template(self, arguments: Dict[str, object], build: Callable[[tuple], Dict[str, object]], options: tuple) -> QueryArguments:
+        templates: Dict[tuple, QueryTemplate] = self._templates
+        key: tuple = (build.__name__, options)
+        template: QueryTemplate = templates.get(key)
+        if template is None:
+            # Templates of options that are no longer used are dropped once
+            # there are many of them.
+            if len(templates) >= 64:
+                templates.clear()
+            template = QueryTemplate(build(options))
+            templates[key] = template
+        return template.bind(arguments)
+
+    def _get_response(self, arguments: Dict[str, object], expires: float = None) -> str:
+        result: bytes = self._transport.get(self._get_url(arguments), {"User-Agent": Constants.USERAGENT}, timeout=get_remaining(expires))
+        return result.decode("utf-8")
+
+    def _get_cache_key(self, arguments: Dict[str, object]) -> str:
+        if self.cache is None:
+            return None
+        return self.cache.make_key(self._service_name, arguments)
+
+    def _get_cached(self, arguments: Dict[str, object], parser: Callable[[str], object], key: str) -> object:
+        if key is None or Cache.is_refreshing():
+            return None
+
+        cached = self.cache.get(self._service_name, key)
+        if cached is None and self.cache.stale_while_revalidate is not None:
+            cached = self.cache.get_stale(self._service_name, key, self.cache.stale_while_revalidate)
+            if cached is not None:
+                self._refresh(arguments, parser, key)
+
+        if cached is None:
+            return None
+        return parser(cached) if self.cache.stores_response else cached
+
+    def _begin_refresh(self, key: str) -> tuple:
+        # Entries are refreshed once at a time, however often they are read
+        # while the refresh is running.
+        refresh_key: tuple = (id(self.cache), key)
+        with self._refreshes_lock:
+            if refresh_key in self._refreshes:
+                return None
+            self._refreshes.add(refresh_key)
+        return refresh_key
+
+    def _end_refresh(self, refresh_key: tuple) -> None:
+        with self._refreshes_lock:
+            self._refreshes.discard(refresh_key)
+
+    def _refresh(self, arguments: Dict[str, object], parser: Callable[[str], object], key: str) -> None:
+        refresh_key: tuple = self._begin_refresh(key)
+        if refresh_key is None:
+            return
+
+        with self._refreshes_lock:
+            if BaseService.__refresh_executor is None:
+                BaseService.__refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="libtad-refresh")
+            executor: ThreadPoolExecutor = BaseService.__refresh_executor
+
+        executor.submit(self.__refresh, arguments, parser, key, refresh_key)
+
+    def __refresh(self, arguments: Dict[str, object], parser: Callable[[str], object], key: str, refresh_key: tuple) -> None:
+        try:
+            self.__fetch(arguments, parser, key, None)
+        except Exception:
+            # The stale entry is kept, and refreshed again on the next read.
+            pass
+        finally:
+            self._end_refresh(refresh_key)
+
+    def _get_stale(self, key: str, parser: Callable[[str], object]) -> object:
+        if key is None or not self.circuit_breaker.serve_stale:
+            return None
+
+        stale = self.cache.get_stale(self._service_name, key)
+        if stale is None:
+            return None
+        return parser(stale) if self.cache.stores_response else stale
+
+    def _get_flight_key(self, arguments: Dict[str, object]) -> tuple:
+        return (self._transport, arguments.get("accesskey"), Cache.make_key(self._service_name, arguments))
+
+    def _execute(self, arguments: Dict[str, object], parser: Callable[[str], object], expires: float = None) -> object:
+        key: str = self._get_cache_key(arguments)
+        cached = self._get_cached(arguments, parser, key)
+        if cached is not None:
+            return cached
+
+        if not self.coalesce_requests:
+            return self.__fetch(arguments, parser, key, expires)
+
+        return self._requests_in_flight.do(self._get_flight_key(arguments), lambda: self.__fetch(arguments, parser, key, expires), get_remaining(expires))
+
+    def _execute_all(self, arguments: List[Dict[str, object]], parser: Callable[[str], object], merge: Callable[[List[object]], object], max_workers: int, expires: float = None) -> object:
+        results: List[object] = map_concurrently(self.__bind(parser, expires), arguments, max_workers)
+        return merge(results)
+
+    def _execute_iter(self, keys: List[object], arguments: List[Dict[str, object]], parser: Callable[[str], object], max_workers: int, ordered: bool = False, expires: float = None) -> Iterator[Tuple[object, object]]:
+        for index, result in iter_concurrently(self.__bind(parser, expires), arguments, max_workers, ordered):
+            yield keys[index], result
+
+    def __bind(self, parser: Callable[[str], object], expires: float) -> Callable[[Dict[str, object]], object]:
+        if not Cache.is_refreshing():
+            return lambda args: self._execute(args, parser, expires)
+
+        # Requests sent from worker threads bypass the cache as well when
+        # the caller is refreshing it.
+        def execute(args: Dict[str, object]) -> object:
+            with Cache.refreshing():
+                return self._execute(args, parser, expires)
+
+        return execute
+
+    def __fetch(self, arguments: Dict[str, object], parser: Callable[[str], object], key: str, expires: float) -> object:
+        try:
+            if self.retry_policy is not None:
+                response: str = self.retry_policy.call(lambda: self.__request(arguments, expires), get_remaining(expires))
+            else:
+                response = self.__request(arguments, expires)
+        except CircuitOpenException:
+            stale = self._get_stale(key, parser)
+            if stale is None:
+                raise
+            return stale
+
+        result = parser(response)
+        if key is not None:
+            self.cache.set(self._service_name, key, response if self.cache.stores_response else result)
+
+        return result
+
+    def __request(self, arguments: Dict[str, object], expires: float) -> str:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(get_remaining(expires))
+
+        return self.__guard(lambda: self._get_response(arguments, expires))
+
+    def __guard(self, function: Callable[[], object]) -> object:
+        breaker: CircuitBreaker = self.circuit_breaker
+        if breaker is None:
+            return function()
+
+        ticket: int = breaker.before_request()
+        start: float = time.monotonic()
+        try:
+            result = function()
+        except BaseException as exception:
+            breaker.record_failure(time.monotonic() - start, exception, ticket)
+            raise
+
+        breaker.record_success(time.monotonic() - start, ticket)
+        return result
+
+    def _stream(self, arguments: Dict[str, object], tag: str, factory: Callable[[ET.Element], object], expires: float = None) -> Iterator[object]:
+        return self.__stream(self._get_url(arguments), tag, factory, expires)
+
+    def __stream(self, url: str, tag: str, factory: Callable[[ET.Element], object], expires: float) -> Iterator[object]:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(get_remaining(expires))
+
+        with self.__guard(lambda: self._transport.open(url, {"User-Agent": Constants.USERAGENT}, timeout=get_remaining(expires))) as response:
+            chunks: Iterator[bytes] = iter(lambda: response.read(XmlUtils.CHUNK_SIZE), b"")
+            for node in XmlUtils.iterparse(chunks, tag):
+                yield factory(node)
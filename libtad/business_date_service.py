@@ -3,12 +3,40 @@ from libtad.base_service import BaseService
 from libtad.datatypes.business import BusinessDaysOperatorType, BusinessDaysFilterType, BusinessDates
 from libtad.datatypes.places import LocationId
 from libtad.datatypes.time import TADDateTime
-from libtad.common import XmlUtils
+from libtad.common import XmlUtils, Transport, get_expiry
 import xml.etree.ElementTree as ET
-from urllib.parse import urlencode
-from urllib.request import urlopen, Request
-from ssl import SSLContext
-from typing import List, Dict, Union
+from typing import List, Dict, NamedTuple, Tuple, Union
+
+class BusinessDateOptions(NamedTuple):
+    """
+    Immutable options of BusinessDateService, which can be passed to a
+    single call.
+
+    Options that are not given take their default values. The options of a
+    service can be changed for a single call with e.g.
+    ``service.options._replace(operator=BusinessDaysOperatorType.Subtract)``.
+
+    ...
+
+    Attributes
+    ----------
+    language : tuple of str
+        Languages of the returned texts.
+    include : bool
+        Whether to include or exclude the days matching the filter.
+    filter : BusinessDaysFilterType or tuple of BusinessDaysFilterType
+        The days to include or exclude.
+    operator : BusinessDaysOperatorType
+        Whether to add or subtract the days.
+    repeat : int
+        Number of times the calculation is repeated for a single day count.
+    """
+
+    language: Tuple[str, ...] = (Constants.DEFAULTLANGUAGE,)
+    include: bool = False
+    filter: Union[BusinessDaysFilterType, Tuple[BusinessDaysFilterType, ...]] = BusinessDaysFilterType.Weekendholidays
+    operator: BusinessDaysOperatorType = BusinessDaysOperatorType.Add
+    repeat: int = 1
 
 class BusinessDateService(BaseService):
     """
@@ -55,16 +83,21 @@ class BusinessDateService(BaseService):
 
         Example:
         ``service.language.append("de")``
+    options : BusinessDateOptions
+        The attributes above as immutable options, which calls use unless
+        options are passed to them. Assigning options sets the attributes.
 
     Methods
     -------
-    get_business_date_for_place(place_id, start_date, days)
+    get_business_date_for_place(place_id, start_date, days, deadline=None, options=None)
         Gets the business dates by place id.   
-    get_business_date_for_country(country_iso, start_date, days, state_iso=None)
+    get_business_date_for_country(country_iso, start_date, days, state_iso=None, deadline=None, options=None)
         Gets the business dates by country and an optional state.   
     """
 
-    def __init__(self, access_key: str, secret_key: str):
+    _options_type: type = BusinessDateOptions
+
+    def __init__(self, access_key: str, secret_key: str, transport: Transport = None, options: BusinessDateOptions = None):
         """
         Parameters
         ----------
@@ -72,15 +105,24 @@ class BusinessDateService(BaseService):
             Access key.
         secret_key : str
             Secret key.
+        transport : Transport, optional
+            Transport used to send requests to the API.
+            Uses pooled keep-alive connections by default.
+        options : BusinessDateOptions, optional
+            Options to set the attributes from.
+            Uses the default values by default.
         """
 
-        super().__init__(access_key, secret_key, "businessdate")
+        super().__init__(access_key, secret_key, "businessdate", transport)
         self.include: bool = False
         self.filter: Union[BusinessDaysFilterType, List[BusinessDaysFilterType]] = BusinessDaysFilterType.Weekendholidays
         self.operator: BusinessDaysOperatorType = BusinessDaysOperatorType.Add
         self.repeat: int = 1
 
-    def get_business_date_for_place(self, place_id: LocationId, start_date: TADDateTime, days: Union[int, List[int]]) -> BusinessDates:
+        if options is not None:
+            self.options = options
+
+    def get_business_date_for_place(self, place_id: LocationId, start_date: TADDateTime, days: Union[int, List[int]], deadline: float = None, options: BusinessDateOptions = None) -> BusinessDates:
         """
         Gets the business dates by place id.   
 
@@ -92,6 +134,12 @@ class BusinessDateService(BaseService):
             The first date to count.
         days : int or list of int
             How many business days to count.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : BusinessDateOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
 
         Returns
         -------
@@ -109,9 +157,9 @@ class BusinessDateService(BaseService):
             raise ValueError("An argument is invalid")
 
         args: Dict[str, object] = {"placeid": ID}
-        return self.__get_business_date(args, start_date, days)
+        return self.__get_business_date(args, start_date, days, self._get_options(options), get_expiry(deadline))
 
-    def get_business_date_for_country(self, country_iso: str, start_date: TADDateTime, days: Union[int, List[int]], state_iso: str = None) -> BusinessDates:
+    def get_business_date_for_country(self, country_iso: str, start_date: TADDateTime, days: Union[int, List[int]], state_iso: str = None, deadline: float = None, options: BusinessDateOptions = None) -> BusinessDates:
         """
         Gets the business dates by country and an optional state.   
 
@@ -126,6 +174,12 @@ class BusinessDateService(BaseService):
         state_iso : str, optional
             The state in the given country you want to calculate the business date.
             Uses no states as default.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : BusinessDateOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
 
         Returns
         -------
@@ -142,9 +196,9 @@ class BusinessDateService(BaseService):
         if (state_iso):
             args["state"] = state_iso
 
-        return self.__get_business_date(args, start_date, days)
+        return self.__get_business_date(args, start_date, days, self._get_options(options), get_expiry(deadline))
 
-    def __get_business_date(self, args: Dict[str, object], start_date: TADDateTime, days: Union[int, List[int]]) -> BusinessDates:
+    def __get_business_date(self, args: Dict[str, object], start_date: TADDateTime, days: Union[int, List[int]], options: BusinessDateOptions, expires: float) -> BusinessDates:
         if not isinstance(start_date, TADDateTime):
             raise ValueError("An argument is invalid")
 
@@ -156,48 +210,38 @@ class BusinessDateService(BaseService):
             raise ValueError("An argument is invalid")
 
         if isinstance(days, int) or len(days) == 1:
-            args["repeat"] = self.repeat
+            args["repeat"] = options.repeat
 
         args.update(self._authentication_options)
         args["startdt"] = str(start_date)
         args["days"] = days_str
 
-        return self.__retrieve_business_date(args)
-
-    def __retrieve_business_date(self, args: Dict[str, object]) -> BusinessDates:
-        arguments: Dict[str, object] = self.__get_optional_arguments(args)
-        url: str = Constants.ENTRYPOINT + "/" + self._service_name + "?" + urlencode(arguments)
-        req = Request(
-                url,
-                headers = {"User-Agent": "libtad-py"}
-                )
-
-        with urlopen(req, context=SSLContext()) as f:
-            result: str = f.read().decode("utf-8")
+        return self.__retrieve_business_date(args, options, expires)
 
-        return self.__from_xml(result)
+    def __retrieve_business_date(self, args: Dict[str, object], options: BusinessDateOptions, expires: float) -> BusinessDates:
+        arguments: Dict[str, object] = self._apply_template(args, self.__get_optional_arguments, options)
+        return self._execute(arguments, self.__from_xml, expires)
 
-    def __get_optional_arguments(self, args: Dict[str, object]) -> Dict[str, object]:
-        optional_args: Dict[str, str] = args
+    def __get_optional_arguments(self, options: BusinessDateOptions) -> Dict[str, object]:
+        optional_args: Dict[str, object] = {}
 
-        optional_args["include"] = int(self.include)
-        optional_args["lang"] = ",".join(self.language)
+        optional_args["include"] = int(options.include)
+        optional_args["lang"] = ",".join(options.language)
         optional_args["out"] = Constants.DEFAULTRETURNFORMAT
         optional_args["verbosetime"] = str(Constants.DEFAULTVERBOSETIMEVALUE)
         optional_args["version"] = str(self._version)
 
-        if isinstance(self.filter, BusinessDaysFilterType):
-            optional_args["filter"] = str(self.filter)
-        elif isinstance(self.filter, list) and all(isinstance(filter, BusinessDaysFilterType) for filter in self.filter):
-            optional_args["filter"] = ",".join(map(str, self.filter))
+        if isinstance(options.filter, BusinessDaysFilterType):
+            optional_args["filter"] = str(options.filter)
+        elif isinstance(options.filter, tuple) and all(isinstance(filter, BusinessDaysFilterType) for filter in options.filter):
+            optional_args["filter"] = ",".join(map(str, options.filter))
 
-        if isinstance(self.operator, BusinessDaysOperatorType):
-            optional_args["op"] = self.operator.name.lower()
+        if isinstance(options.operator, BusinessDaysOperatorType):
+            optional_args["op"] = options.operator.name.lower()
 
         return optional_args
 
     def __from_xml(self, result: str) -> BusinessDates:
-        XmlUtils.check_for_errors(result)
-        xml: ET.Element = ET.fromstring(result)
+        xml: ET.Element = XmlUtils.parse(result)
         return BusinessDates(xml.find("geo"), [period for period in xml.findall("period")])
 
@@ -3,12 +3,37 @@ from libtad.base_service import BaseService
 from libtad.datatypes.business import BusinessDaysOperatorType, BusinessDaysFilterType, BusinessDates
 from libtad.datatypes.places import LocationId
 from libtad.datatypes.time import TADDateTime
-from libtad.common import XmlUtils
+from libtad.common import XmlUtils, Transport, get_expiry
 import xml.etree.ElementTree as ET
-from urllib.parse import urlencode
-from urllib.request import urlopen, Request
-from ssl import SSLContext
-from typing import List, Dict, Union
+from typing import List, Dict, NamedTuple, Tuple, Union
+
+class BusinessDurationOptions(NamedTuple):
+    """
+    Immutable options of BusinessDurationService, which can be passed to a
+    single call.
+
+    Options that are not given take their default values. The options of a
+    service can be changed for a single call with e.g.
+    ``service.options._replace(include_last_date=True)``.
+
+    ...
+
+    Attributes
+    ----------
+    language : tuple of str
+        Languages of the returned texts.
+    include : bool
+        Whether to include or exclude the days matching the filter.
+    filter : BusinessDaysFilterType or tuple of BusinessDaysFilterType
+        The days to include or exclude.
+    include_last_date : bool
+        Whether to count the end date.
+    """
+
+    language: Tuple[str, ...] = (Constants.DEFAULTLANGUAGE,)
+    include: bool = False
+    filter: Union[BusinessDaysFilterType, Tuple[BusinessDaysFilterType, ...]] = BusinessDaysFilterType.Weekendholidays
+    include_last_date: bool = False
 
 class BusinessDurationService(BaseService):
     """
@@ -51,16 +76,21 @@ class BusinessDurationService(BaseService):
 
         Example:
         ``service.language.append("de")``
+    options : BusinessDurationOptions
+        The attributes above as immutable options, which calls use unless
+        options are passed to them. Assigning options sets the attributes.
 
     Methods
     -------
-    get_business_duration_for_place(place_id, start_date, days)
+    get_business_duration_for_place(place_id, start_date, days, deadline=None, options=None)
         Gets the business dates by place id.
-    get_business_duration_for_country(country_iso, start_date, days, state_iso=None)
+    get_business_duration_for_country(country_iso, start_date, days, state_iso=None, deadline=None, options=None)
         Gets the business dates by country and an optional state.
     """
 
-    def __init__(self, access_key: str, secret_key: str):
+    _options_type: type = BusinessDurationOptions
+
+    def __init__(self, access_key: str, secret_key: str, transport: Transport = None, options: BusinessDurationOptions = None):
         """
         Parameters
         ----------
@@ -68,14 +98,23 @@ class BusinessDurationService(BaseService):
             Access key.
         secret_key : str
             Secret key.
+        transport : Transport, optional
+            Transport used to send requests to the API.
+            Uses pooled keep-alive connections by default.
+        options : BusinessDurationOptions, optional
+            Options to set the attributes from.
+            Uses the default values by default.
         """
 
-        super().__init__(access_key, secret_key, "businessduration")
+        super().__init__(access_key, secret_key, "businessduration", transport)
         self.include: bool = False
         self.filter: Union[BusinessDaysFilterType, List[BusinessDaysFilterType]] = BusinessDaysFilterType.Weekendholidays
         self.include_last_date: bool = False
 
-    def get_business_duration_for_place(self, place_id: LocationId, start_date: TADDateTime, end_date: TADDateTime) -> BusinessDates:
+        if options is not None:
+            self.options = options
+
+    def get_business_duration_for_place(self, place_id: LocationId, start_date: TADDateTime, end_date: TADDateTime, deadline: float = None, options: BusinessDurationOptions = None) -> BusinessDates:
         """
         Gets the business dates by place id.
 
@@ -87,6 +126,12 @@ class BusinessDurationService(BaseService):
             The first date to count.
         end_date : TADDateTime
             The last date to count.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : BusinessDurationOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
 
         Returns
         -------
@@ -104,9 +149,9 @@ class BusinessDurationService(BaseService):
             raise ValueError("An argument is invalid")
 
         args: Dict[str, object] = {"placeid": ID}
-        return self.__get_business_duration(args, start_date, end_date)
+        return self.__get_business_duration(args, start_date, end_date, self._get_options(options), get_expiry(deadline))
 
-    def get_business_duration_for_country(self, country_iso: str, start_date: TADDateTime, end_date: TADDateTime, state_iso: str = None) -> BusinessDates:
+    def get_business_duration_for_country(self, country_iso: str, start_date: TADDateTime, end_date: TADDateTime, state_iso: str = None, deadline: float = None, options: BusinessDurationOptions = None) -> BusinessDates:
         """
         Gets the business dates by country and an optional state.
 
@@ -121,6 +166,12 @@ class BusinessDurationService(BaseService):
         state_iso : str, optional
             The state in the given country you want to calculate the business date.
             Uses no states as default.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : BusinessDurationOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
 
         Returns
         -------
@@ -137,9 +188,9 @@ class BusinessDurationService(BaseService):
         if (state_iso):
             args["state"] = state_iso
 
-        return self.__get_business_duration(args, start_date, end_date)
+        return self.__get_business_duration(args, start_date, end_date, self._get_options(options), get_expiry(deadline))
 
-    def __get_business_duration(self, args: Dict[str, object], start_date: TADDateTime, end_date: TADDateTime) -> BusinessDates:
+    def __get_business_duration(self, args: Dict[str, object], start_date: TADDateTime, end_date: TADDateTime, options: BusinessDurationOptions, expires: float) -> BusinessDates:
         if not isinstance(start_date, TADDateTime) or not isinstance(end_date, TADDateTime):
             raise ValueError("An argument is invalid")
 
@@ -150,40 +201,30 @@ class BusinessDurationService(BaseService):
         args["startdt"] = str(start_date)
         args["enddt"] = str(end_date)
 
-        return self.__retrieve_business_duration(args)
-
-    def __retrieve_business_duration(self, args: Dict[str, object]) -> BusinessDates:
-        arguments: Dict[str, object] = self.__get_optional_arguments(args)
-        url: str = Constants.ENTRYPOINT + "/" + self._service_name + "?" + urlencode(arguments)
-        req = Request(
-                url,
-                headers = {"User-Agent": "libtad-py"}
-                )
-
-        with urlopen(req, context=SSLContext()) as f:
-            result: str = f.read().decode("utf-8")
+        return self.__retrieve_business_duration(args, options, expires)
 
-        return self.__from_xml(result)
+    def __retrieve_business_duration(self, args: Dict[str, object], options: BusinessDurationOptions, expires: float) -> BusinessDates:
+        arguments: Dict[str, object] = self._apply_template(args, self.__get_optional_arguments, options)
+        return self._execute(arguments, self.__from_xml, expires)
 
-    def __get_optional_arguments(self, args: Dict[str, object]) -> Dict[str, object]:
-        optional_args: Dict[str, str] = args
+    def __get_optional_arguments(self, options: BusinessDurationOptions) -> Dict[str, object]:
+        optional_args: Dict[str, object] = {}
 
-        optional_args["include"] = int(self.include)
-        optional_args["includelastdate"] = int(self.include_last_date)
-        optional_args["lang"] = ",".join(self.language)
+        optional_args["include"] = int(options.include)
+        optional_args["includelastdate"] = int(options.include_last_date)
+        optional_args["lang"] = ",".join(options.language)
         optional_args["out"] = Constants.DEFAULTRETURNFORMAT
         optional_args["verbosetime"] = str(Constants.DEFAULTVERBOSETIMEVALUE)
         optional_args["version"] = str(self._version)
 
-        if isinstance(self.filter, BusinessDaysFilterType):
-            optional_args["filter"] = str(self.filter)
-        elif isinstance(self.filter, list) and all(isinstance(filter, BusinessDaysFilterType) for filter in self.filter):
-            optional_args["filter"] = ",".join(map(str, self.filter))
+        if isinstance(options.filter, BusinessDaysFilterType):
+            optional_args["filter"] = str(options.filter)
+        elif isinstance(options.filter, tuple) and all(isinstance(filter, BusinessDaysFilterType) for filter in options.filter):
+            optional_args["filter"] = ",".join(map(str, options.filter))
 
         return optional_args
 
     def __from_xml(self, result: str) -> BusinessDates:
-        XmlUtils.check_for_errors(result)
-        xml: ET.Element = ET.fromstring(result)
+        xml: ET.Element = XmlUtils.parse(result)
         return BusinessDates(xml.find("geo"), [period for period in xml.findall("period")])
 
@@ -2,6 +2,23 @@ __all__ = ["exceptions"]
 
 from . import exceptions
 from .xml_utils import XmlUtils
+from .batching import chunked, map_concurrently, iter_concurrently
+from .bulk import BulkResult, run_many
+from .deadline import get_expiry, get_remaining
+from .compression import Decompressor
+from .connection_pool import ConnectionPool, PooledResponse
+from .async_connection_pool import AsyncConnectionPool
+from .transport import Transport, PooledTransport, AsyncTransport, AsyncPooledTransport
+from .query_template import QueryTemplate, QueryArguments
+from .lazy_element import LazyElement, LazyField
+from .cache import Cache, ResponseCache
+from .sqlite_cache import SQLiteCache
+from .single_flight import SingleFlight, AsyncSingleFlight
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
+from .circuit_breaker import CircuitBreaker
+from .refresh_schedule import RefreshSchedule
+from .fake_transport import FakeTransport, AsyncFakeTransport, FakeResponse
 
 def __dir__():
     return __all__
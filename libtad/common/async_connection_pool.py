@@ -0,0 +1,295 @@
+from http.client import HTTPMessage
+from email.parser import Parser
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from ssl import SSLContext
+from typing import Dict, List, Tuple
+from .deadline import get_expiry, get_remaining
+from .exceptions import DeadlineExceededException
+from .compression import ACCEPT_ENCODING, Decompressor
+import asyncio
+import socket
+import threading
+import time
+
+_Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+class _LoopConnections:
+    # Connections and semaphores can only be used on the loop they were
+    # made on, so they are kept per loop.
+    def __init__(self):
+        self.idle: Dict[tuple, List[Tuple[_Connection, float]]] = {}
+        self.semaphores: Dict[tuple, asyncio.Semaphore] = {}
+
+class AsyncConnectionPool:
+    """
+    A non-blocking pool of persistent keep-alive connections, kept per host
+    and event loop.
+
+    The number of connections opened concurrently to a host is bounded, so
+    thousands of lookups can be awaited at once while only a limited number
+    of requests is in flight.
+
+    ...
+
+    Attributes
+    ----------
+    max_size : int
+        Maximum number of idle connections kept open per host. Connections
+        released while the pool is full are closed.
+    max_connections : int
+        Maximum number of connections open to a host at the same time.
+        Requests beyond this limit wait for a connection to be released.
+    idle_timeout : float
+        Number of seconds an idle connection may stay in the pool before it
+        is closed instead of being reused.
+    connect_timeout : float
+        Number of seconds to wait for a connection to be established, or
+        None to wait indefinitely.
+    read_timeout : float
+        Number of seconds to wait for the server to send data, or None to
+        wait indefinitely.
+    compress : bool
+        Whether to ask the server for a gzip or deflate compressed body,
+        which is decompressed transparently.
+
+    Methods
+    -------
+    shared()
+        Gets the pool shared by all asynchronous services.
+    get(url, headers=None, timeout=None)
+        Performs a GET request and returns the response body.
+    clear()
+        Closes all idle connections.
+    """
+
+    __shared: "AsyncConnectionPool" = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, max_size: int = 10, max_connections: int = 100, idle_timeout: float = 30.0, connect_timeout: float = 10.0, read_timeout: float = 30.0, compress: bool = True):
+        """
+        Parameters
+        ----------
+        max_size : int, optional
+            Maximum number of idle connections kept open per host.
+        max_connections : int, optional
+            Maximum number of connections open to a host at the same time.
+        idle_timeout : float, optional
+            Number of seconds an idle connection may be kept for reuse.
+        connect_timeout : float, optional
+            Number of seconds to wait for a connection to be established.
+        read_timeout : float, optional
+            Number of seconds to wait for the server to send data.
+        compress : bool, optional
+            Whether to ask the server for a compressed body.
+        """
+
+        self.max_size: int = max_size
+        self.max_connections: int = max_connections
+        self.idle_timeout: float = idle_timeout
+        self.connect_timeout: float = connect_timeout
+        self.read_timeout: float = read_timeout
+        self.compress: bool = compress
+        self.__ssl_context: SSLContext = SSLContext()
+        self.__loops: Dict[asyncio.AbstractEventLoop, _LoopConnections] = {}
+
+    @classmethod
+    def shared(cls) -> "AsyncConnectionPool":
+        """
+        Gets the pool shared by all asynchronous services.
+
+        Returns
+        -------
+        pool : AsyncConnectionPool
+            The process-wide asynchronous connection pool.
+
+        """
+
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    async def get(self, url: str, headers: Dict[str, str] = None, timeout: float = None) -> bytes:
+        """
+        Performs a GET request and returns the response body.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        headers : dict of str, optional
+            Request headers.
+        timeout : float, optional
+            Number of seconds left for the whole request, which fails with
+            DeadlineExceededException once they have passed.
+
+        Returns
+        -------
+        body : bytes
+            The complete response body.
+
+        """
+
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path: str = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        headers = dict(headers or {})
+        if self.compress:
+            headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
+
+        lines: List[str] = [f"GET {path} HTTP/1.1", f"Host: {parts.netloc}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        request: bytes = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        expires: float = get_expiry(timeout)
+        loop_connections: _LoopConnections = self.__get_loop_connections()
+        semaphore = loop_connections.semaphores.get(key)
+        if semaphore is None:
+            semaphore = loop_connections.semaphores.setdefault(key, asyncio.Semaphore(self.max_connections))
+
+        await self.__wait(semaphore.acquire(), expires)
+        try:
+            while True:
+                connection, reused = await self.__wait(self.__acquire(loop_connections.idle, key), expires, self.connect_timeout)
+                reader, writer = connection
+                try:
+                    writer.write(request)
+                    await self.__wait(writer.drain(), expires, self.read_timeout)
+                    status, reason, response_headers = await self.__wait(self.__read_head(reader), expires, self.read_timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    # The server may have dropped a connection while it was
+                    # idle in the pool, in which case the request is safe to
+                    # repeat.
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                break
+
+            try:
+                body, keep_alive = await self.__read_body(reader, response_headers, expires, self.read_timeout)
+            except BaseException:
+                writer.close()
+                raise
+
+            if keep_alive:
+                self.__release(loop_connections.idle, key, connection)
+            else:
+                writer.close()
+        finally:
+            semaphore.release()
+
+        if status >= 400:
+            raise HTTPError(url, status, reason, response_headers, None)
+
+        decompressor = Decompressor(response_headers.get("Content-Encoding"))
+        return decompressor.decompress(body) + decompressor.flush()
+
+    def clear(self) -> None:
+        """
+        Closes all idle connections.
+        """
+
+        loops = self.__loops
+        self.__loops = {}
+
+        for loop, loop_connections in loops.items():
+            # Connections of closed loops cannot be closed anymore.
+            if loop.is_closed():
+                continue
+            for connections in loop_connections.idle.values():
+                for (_, writer), _ in connections:
+                    writer.close()
+
+    def __get_loop_connections(self) -> _LoopConnections:
+        loop = asyncio.get_event_loop()
+        loop_connections: _LoopConnections = self.__loops.get(loop)
+        if loop_connections is None:
+            # Loops that have been closed, e.g. at the end of asyncio.run(),
+            # are dropped together with their connections when a new loop
+            # starts using the pool.
+            for closed in [other for other in list(self.__loops) if other.is_closed()]:
+                self.__loops.pop(closed, None)
+            loop_connections = self.__loops.setdefault(loop, _LoopConnections())
+        return loop_connections
+
+    @staticmethod
+    async def __wait(awaitable, expires: float, timeout: float = None) -> object:
+        # Bounds a single step of the request by its own timeout and the
+        # time left until the deadline of the whole request.
+        try:
+            remaining: float = get_remaining(expires, timeout)
+        except DeadlineExceededException:
+            awaitable.close()
+            raise
+
+        try:
+            return await asyncio.wait_for(awaitable, remaining)
+        except asyncio.TimeoutError:
+            get_remaining(expires)
+            raise socket.timeout("timed out") from None
+
+    async def __acquire(self, idle: Dict[tuple, List[Tuple[_Connection, float]]], key: tuple) -> Tuple[_Connection, bool]:
+        now = time.monotonic()
+        connections = idle.get(key, [])
+        while connections:
+            connection, released = connections.pop()
+            if now - released > self.idle_timeout or connection[0].at_eof():
+                connection[1].close()
+                continue
+            return connection, True
+
+        scheme, host, port = key
+        ssl = self.__ssl_context if scheme == "https" else None
+        return await asyncio.open_connection(host, port, ssl=ssl), False
+
+    def __release(self, idle: Dict[tuple, List[Tuple[_Connection, float]]], key: tuple, connection: _Connection) -> None:
+        connections = idle.setdefault(key, [])
+        if len(connections) < self.max_size:
+            connections.append((connection, time.monotonic()))
+        else:
+            connection[1].close()
+
+    @staticmethod
+    async def __read_head(reader: asyncio.StreamReader) -> Tuple[int, str, HTTPMessage]:
+        status_line: str = (await reader.readuntil(b"\r\n")).decode("latin-1")
+        _, status, reason = (status_line.rstrip("\r\n").split(" ", 2) + [""])[:3]
+        lines: List[str] = []
+        while True:
+            line: bytes = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            lines.append(line.decode("latin-1"))
+
+        headers: HTTPMessage = Parser(_class=HTTPMessage).parsestr("".join(lines))
+        return int(status), reason, headers
+
+    @classmethod
+    async def __read_body(cls, reader: asyncio.StreamReader, headers: HTTPMessage, expires: float, timeout: float) -> Tuple[bytes, bool]:
+        keep_alive: bool = (headers.get("Connection") or "").lower() != "close"
+
+        if (headers.get("Transfer-Encoding") or "").lower() == "chunked":
+            chunks: List[bytes] = []
+            while True:
+                size = int((await cls.__wait(reader.readuntil(b"\r\n"), expires, timeout)).split(b";")[0], 16)
+                if size == 0:
+                    while await cls.__wait(reader.readuntil(b"\r\n"), expires, timeout) != b"\r\n":
+                        pass
+                    break
+                chunks.append(await cls.__wait(reader.readexactly(size), expires, timeout))
+                await cls.__wait(reader.readexactly(2), expires, timeout)
+            return b"".join(chunks), keep_alive
+
+        length = headers.get("Content-Length")
+        if length is not None:
+            return await cls.__wait(reader.readexactly(int(length)), expires, timeout), keep_alive
+
+        return await cls.__wait(reader.read(), expires, timeout), False
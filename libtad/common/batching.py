@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, List, Sequence, Tuple
+
+def chunked(items: Sequence, size: int) -> List[Sequence]:
+    """
+    Splits a sequence into consecutive chunks.
+
+    Parameters
+    ----------
+    items : sequence
+        The items to split.
+    size : int
+        Maximum number of items per chunk.
+
+    Returns
+    -------
+    chunks : list of sequence
+        The chunks, in the order of `items`.
+
+    """
+
+    if size <= 0:
+        raise ValueError("Chunk size must be a positive integer")
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def map_concurrently(function: Callable[[object], object], items: Sequence, max_workers: int) -> List[object]:
+    """
+    Calls a function for every item on a thread pool.
+
+    Parameters
+    ----------
+    function : callable
+        The function to call with each item.
+    items : sequence
+        The items.
+    max_workers : int
+        Maximum number of concurrent calls.
+
+    Returns
+    -------
+    results : list
+        The results, in the order of `items`. The first exception raised by
+        a call is raised instead.
+
+    """
+
+    if len(items) <= 1 or max_workers <= 1:
+        return [function(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(function, items))
+
+def iter_concurrently(function: Callable[[object], object], items: Sequence, max_workers: int, ordered: bool = False) -> Iterator[Tuple[int, object]]:
+    """
+    Calls a function for every item on a thread pool and yields the results
+    as they complete.
+
+    Parameters
+    ----------
+    function : callable
+        The function to call with each item.
+    items : sequence
+        The items.
+    max_workers : int
+        Maximum number of concurrent calls.
+    ordered : bool, optional
+        Whether to yield the results in the order of `items` instead of the
+        order of completion.
+
+    Returns
+    -------
+    results : iterator of tuple
+        Pairs of the index of the item in `items` and the result of its call.
+        The first exception raised by a call is
+        raised instead, and calls which have not started yet are cancelled.
+
+    """
+
+    if not items:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    futures = {executor.submit(function, item): index for index, item in enumerate(items)}
+    try:
+        for future in (futures if ordered else as_completed(futures)):
+            yield futures[future], future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
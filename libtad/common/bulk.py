@@ -0,0 +1,139 @@
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, NamedTuple, Tuple
+import threading
+
+SHARED_WORKERS: int = 64
+
+_shared_executor: ThreadPoolExecutor = None
+_shared_lock = threading.Lock()
+
+class BulkResult(NamedTuple):
+    """
+    The outcome of a single call made by `run_many`.
+
+    ...
+
+    Attributes
+    ----------
+    index : int
+        Position of the arguments in the iterable passed to `run_many`.
+    arguments : object
+        The arguments of the call.
+    result : object
+        The result of the call, or None if it failed.
+    exception : BaseException
+        The exception the call failed with, or None if it succeeded.
+    """
+
+    index: int
+    arguments: object
+    result: object = None
+    exception: BaseException = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+def run_many(function: Callable[..., object], arguments: Iterable[object], max_workers: int = 8, ordered: bool = False,
+             progress: Callable[[int, int], None] = None, executor: ThreadPoolExecutor = None) -> Iterator[BulkResult]:
+    """
+    Calls a service method for many arguments on a thread pool.
+
+    The calls share the connection pool, the cache and the rate limiter of
+    the service, so a backfill never sends requests faster than the rate
+    limit allows. The arguments are read lazily, and at most `max_workers`
+    calls are in flight at a time, so arbitrarily long iterables can be
+    processed with bounded memory. A failed call does not stop the others.
+
+    ``for item in run_many(service.holidays_for_country, [("no", 2020), ("us", 2021)]):``
+
+    ``    print(item.arguments, item.result if item.ok else item.exception)``
+
+    Parameters
+    ----------
+    function : callable
+        Method of a synchronous service, or any other function.
+    arguments : iterable
+        Arguments of the calls. A tuple is passed as positional arguments,
+        a dict as keyword arguments, and anything else as the only argument.
+    max_workers : int, optional
+        Maximum number of calls in flight at the same time.
+    ordered : bool, optional
+        Whether to yield the results in the order of `arguments` instead of
+        the order of completion.
+    progress : callable, optional
+        Called with the number of completed calls and the total number of
+        calls after every call. The total is None if `arguments` has no
+        length.
+    executor : ThreadPoolExecutor, optional
+        Executor to run the calls on.
+        Uses a thread pool shared by the process by default, which runs up
+        to `SHARED_WORKERS` calls at the same time.
+
+    Returns
+    -------
+    results : iterator of BulkResult
+        The outcome of every call. Calls that have not started when the
+        iterator is closed are cancelled.
+
+    """
+
+    if max_workers <= 0:
+        raise ValueError("max_workers must be a positive integer")
+
+    total: int = len(arguments) if hasattr(arguments, "__len__") else None
+    return _run(function, enumerate(arguments), max_workers, ordered, progress, executor or _get_shared_executor(), total)
+
+def _run(function: Callable[..., object], items: Iterator[Tuple[int, object]], max_workers: int, ordered: bool,
+         progress: Callable[[int, int], None], executor: ThreadPoolExecutor, total: int) -> Iterator[BulkResult]:
+    pending: Dict[Future, Tuple[int, object]] = {}
+    submitted: Deque[Future] = deque()
+
+    def submit() -> bool:
+        for index, item in items:
+            future: Future = executor.submit(_call, function, item)
+            pending[future] = (index, item)
+            submitted.append(future)
+            return True
+        return False
+
+    try:
+        while len(pending) < max_workers and submit():
+            pass
+
+        completed: int = 0
+        while pending:
+            if ordered:
+                future: Future = submitted.popleft()
+                wait([future])
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                submitted.remove(future)
+
+            index, item = pending.pop(future)
+            submit()
+
+            exception: BaseException = future.exception()
+            completed += 1
+            if progress is not None:
+                progress(completed, total)
+            yield BulkResult(index, item, None if exception is not None else future.result(), exception)
+    finally:
+        for future in pending:
+            future.cancel()
+
+def _call(function: Callable[..., object], item: object) -> object:
+    if isinstance(item, tuple):
+        return function(*item)
+    if isinstance(item, dict):
+        return function(**item)
+    return function(item)
+
+def _get_shared_executor() -> ThreadPoolExecutor:
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(max_workers=SHARED_WORKERS, thread_name_prefix="libtad-bulk")
+        return _shared_executor
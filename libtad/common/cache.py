@@ -0,0 +1,213 @@
+from .query_template import QueryArguments
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+import heapq
+import threading
+import time
+
+class Cache:
+    """
+    Base class for the response caches the services can be configured with.
+
+    Entries are keyed on the service name and the canonical request
+    arguments. The authentication arguments change with every signature and
+    are therefore left out of the key.
+
+    ...
+
+    Attributes
+    ----------
+    stores_response : bool
+        Whether the cache stores the raw XML responses, which are parsed
+        again on every hit, instead of the parsed results.
+    stale_while_revalidate : float
+        Number of seconds after its expiry during which an entry is still
+        returned immediately, while it is refreshed in the background. None
+        to wait for the refresh instead.
+
+    Methods
+    -------
+    make_key(service, arguments)
+        Builds the cache key for a request.
+    refreshing()
+        Context manager in which lookups of the current thread bypass the
+        cache, so the entries are fetched and stored again.
+    is_refreshing()
+        Checks whether lookups of the current thread bypass the cache.
+    get(service, key)
+        Gets a cached entry, or None if there is no fresh entry.
+    get_stale(service, key, max_staleness=None)
+        Gets a cached entry even if it has expired, or None if there is none.
+    set(service, key, value)
+        Stores an entry.
+    clear()
+        Removes all entries.
+    """
+
+    VOLATILE_ARGUMENTS: Tuple[str, ...] = ("accesskey", "timestamp", "signature")
+
+    stores_response: bool = False
+    stale_while_revalidate: float = None
+
+    __refreshing = threading.local()
+
+    @staticmethod
+    def make_key(service: str, arguments: Dict[str, object]) -> str:
+        """
+        Builds the cache key for a request.
+
+        Parameters
+        ----------
+        service : str
+            Name of the service.
+        arguments : dict
+            The request arguments.
+
+        Returns
+        -------
+        key : str
+            The service name followed by the sorted, non-volatile arguments.
+
+        """
+
+        if isinstance(arguments, QueryArguments):
+            # The static arguments were sorted when the template was built.
+            varying = sorted((name, str(value)) for name, value in arguments.varying.items() if name not in Cache.VOLATILE_ARGUMENTS)
+            canonical = heapq.merge(arguments.template.canonical, varying)
+        else:
+            canonical = sorted((name, str(value)) for name, value in arguments.items() if name not in Cache.VOLATILE_ARGUMENTS)
+        return service + "?" + "&".join(f"{name}={value}" for name, value in canonical)
+
+    @staticmethod
+    @contextmanager
+    def refreshing() -> Iterator[None]:
+        """
+        Context manager in which lookups of the current thread bypass the
+        cache, so the entries are fetched and stored again.
+        """
+
+        previous: bool = Cache.is_refreshing()
+        Cache.__refreshing.active = True
+        try:
+            yield
+        finally:
+            Cache.__refreshing.active = previous
+
+    @staticmethod
+    def is_refreshing() -> bool:
+        """
+        Checks whether lookups of the current thread bypass the cache.
+
+        Returns
+        -------
+        refreshing : bool
+            Whether the current thread is inside `refreshing()`.
+
+        """
+
+        return getattr(Cache.__refreshing, "active", False)
+
+    def get(self, service: str, key: str) -> object:
+        raise NotImplementedError
+
+    def get_stale(self, service: str, key: str, max_staleness: float = None) -> object:
+        return None
+
+    def set(self, service: str, key: str, value: object) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+class ResponseCache(Cache):
+    """
+    An in-memory cache of parsed results with expiry and LRU eviction.
+
+    The cache is opt-in and can be shared between service instances:
+
+    ``service.cache = ResponseCache(ttl=3600, ttls={"holidays": 86400})``
+
+    Cached results are returned as-is to every caller, so they should be
+    treated as read-only. Expired entries are kept until they are evicted,
+    so they can still be served while the API is unavailable.
+
+    ...
+
+    Attributes
+    ----------
+    ttl : float
+        Number of seconds an entry stays fresh, unless the service has its
+        own expiry in `ttls`.
+    ttls : dict of float
+        Number of seconds entries stay fresh by service name, e.g.
+        ``{"holidays": 86400}``.
+    max_size : int
+        Maximum number of entries. The least recently used entry is evicted
+        when the cache is full.
+    hits : int
+        Number of lookups answered from the cache.
+    misses : int
+        Number of lookups that were not in the cache or had expired.
+    evictions : int
+        Number of entries evicted to stay within `max_size`.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_size: int = 1024, ttls: Dict[str, float] = None, stale_while_revalidate: float = None):
+        """
+        Parameters
+        ----------
+        ttl : float, optional
+            Number of seconds an entry stays fresh.
+        max_size : int, optional
+            Maximum number of entries.
+        ttls : dict of float, optional
+            Number of seconds entries stay fresh by service name.
+        stale_while_revalidate : float, optional
+            Number of seconds an expired entry is still returned while it is
+            refreshed in the background.
+        """
+
+        self.ttl: float = ttl
+        self.ttls: Dict[str, float] = ttls if ttls is not None else {}
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.stale_while_revalidate: float = stale_while_revalidate
+        self.__entries: "OrderedDict[str, Tuple[object, float]]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, service: str, key: str) -> object:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get_stale(self, service: str, key: str, max_staleness: float = None) -> object:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or (max_staleness is not None and time.monotonic() - entry[1] > max_staleness):
+                return None
+            return entry[0]
+
+    def set(self, service: str, key: str, value: object) -> None:
+        expires: float = time.monotonic() + self.ttls.get(service, self.ttl)
+        with self.__lock:
+            self.__entries[key] = (value, expires)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
@@ -0,0 +1,265 @@
+from .exceptions import CircuitOpenException, DeadlineExceededException
+from urllib.error import HTTPError
+from collections import deque
+from typing import Deque, Tuple
+import asyncio
+import threading
+import time
+
+class CircuitBreaker:
+    """
+    Stops sending requests to the API for a while when it is failing.
+
+    The breaker is closed while requests succeed. It opens when too many of
+    the recent requests failed or were slow, after which requests fail fast
+    with CircuitOpenException instead of piling up on a degraded API. Once
+    `reset_timeout` has passed, a limited number of probe requests is let
+    through. The breaker closes again if they succeed, and opens for another
+    `reset_timeout` if they do not.
+
+    The breaker is opt-in and is usually shared by all services:
+
+    ``service.circuit_breaker = CircuitBreaker.shared()``
+
+    ...
+
+    Attributes
+    ----------
+    failure_rate : float
+        Share of failed requests within `window` at which the breaker opens.
+    minimum_requests : int
+        Minimum number of requests within `window` before the failure rate
+        is considered.
+    window : float
+        Number of seconds of request outcomes the failure rate is based on.
+    slow_call_duration : float
+        Number of seconds after which a successful request is counted as a
+        failure, or None to not consider the latency.
+    reset_timeout : float
+        Number of seconds the breaker stays open before probing.
+    half_open_requests : int
+        Number of probe requests let through at the same time.
+    serve_stale : bool
+        Whether services answer from expired cache entries while the breaker
+        is open, if there are any, instead of failing.
+    state : str
+        Current state, one of "closed", "open" and "half_open".
+
+    Methods
+    -------
+    shared()
+        Gets the breaker shared by all services.
+    before_request()
+        Checks whether a request may be sent.
+    record_success(duration, ticket=None)
+        Records a request that succeeded.
+    record_failure(duration, exception=None, ticket=None)
+        Records a request that failed.
+    reset()
+        Closes the breaker and forgets all recorded requests.
+    """
+
+    CLOSED: str = "closed"
+    OPEN: str = "open"
+    HALF_OPEN: str = "half_open"
+
+    __shared: "CircuitBreaker" = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, failure_rate: float = 0.5, minimum_requests: int = 10, window: float = 30.0, slow_call_duration: float = None,
+                 reset_timeout: float = 30.0, half_open_requests: int = 1, serve_stale: bool = True):
+        """
+        Parameters
+        ----------
+        failure_rate : float, optional
+            Share of failed requests at which the breaker opens.
+        minimum_requests : int, optional
+            Minimum number of requests before the failure rate is considered.
+        window : float, optional
+            Number of seconds of request outcomes to consider.
+        slow_call_duration : float, optional
+            Number of seconds after which a request is counted as a failure.
+        reset_timeout : float, optional
+            Number of seconds the breaker stays open before probing.
+        half_open_requests : int, optional
+            Number of probe requests let through at the same time.
+        serve_stale : bool, optional
+            Whether to answer from expired cache entries while open.
+        """
+
+        self.failure_rate: float = failure_rate
+        self.minimum_requests: int = minimum_requests
+        self.window: float = window
+        self.slow_call_duration: float = slow_call_duration
+        self.reset_timeout: float = reset_timeout
+        self.half_open_requests: int = half_open_requests
+        self.serve_stale: bool = serve_stale
+        self.__state: str = self.CLOSED
+        self.__opened: float = 0.0
+        self.__probes: int = 0
+        self.__generation: int = 0
+        self.__outcomes: Deque[Tuple[float, bool]] = deque()
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "CircuitBreaker":
+        """
+        Gets the breaker shared by all services.
+
+        Returns
+        -------
+        breaker : CircuitBreaker
+            The process-wide circuit breaker.
+
+        """
+
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    @property
+    def state(self) -> str:
+        with self.__lock:
+            if self.__state == self.OPEN and time.monotonic() - self.__opened >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self.__state
+
+    def before_request(self) -> int:
+        """
+        Checks whether a request may be sent.
+
+        Every request let through must be followed by a call to
+        `record_success` or `record_failure`, passing the returned ticket.
+
+        Returns
+        -------
+        ticket : int
+            Identifies the state the request was let through in, so outcomes
+            of requests sent before the breaker opened are not taken for
+            outcomes of probes.
+
+        Raises
+        ------
+        CircuitOpenException
+            If the breaker is open, or all probes are already in flight.
+
+        """
+
+        with self.__lock:
+            if self.__state == self.CLOSED:
+                return self.__generation
+
+            if self.__state == self.OPEN:
+                if time.monotonic() - self.__opened < self.reset_timeout:
+                    raise CircuitOpenException("The API is failing, requests are suspended")
+                self.__state = self.HALF_OPEN
+                self.__generation += 1
+                self.__probes = 0
+
+            if self.__probes >= self.half_open_requests:
+                raise CircuitOpenException("The API is failing, waiting for probe requests")
+            self.__probes += 1
+            return self.__generation
+
+    def record_success(self, duration: float, ticket: int = None) -> None:
+        """
+        Records a request that succeeded.
+
+        Parameters
+        ----------
+        duration : float
+            Number of seconds the request took.
+        ticket : int, optional
+            The ticket returned by `before_request` for the request.
+            Defaults to the current state.
+        """
+
+        if self.slow_call_duration is not None and duration > self.slow_call_duration:
+            self.__record(True, ticket)
+        else:
+            self.__record(False, ticket)
+
+    def record_failure(self, duration: float, exception: BaseException = None, ticket: int = None) -> None:
+        """
+        Records a request that failed.
+
+        Client errors such as a 404 status say nothing about the health of
+        the API and are recorded as successes. Requests the caller gave up
+        on, because its deadline passed or it was cancelled, are not
+        recorded, unless they already took longer than
+        `slow_call_duration`.
+
+        Parameters
+        ----------
+        duration : float
+            Number of seconds the request took.
+        exception : BaseException, optional
+            The exception the request failed with.
+        ticket : int, optional
+            The ticket returned by `before_request` for the request.
+            Defaults to the current state.
+        """
+
+        if isinstance(exception, (DeadlineExceededException, asyncio.CancelledError)):
+            if self.slow_call_duration is not None and duration > self.slow_call_duration:
+                self.__record(True, ticket)
+            else:
+                self.__release(ticket)
+        elif isinstance(exception, HTTPError) and exception.code < 500 and exception.code != 429:
+            self.record_success(duration, ticket)
+        else:
+            self.__record(True, ticket)
+
+    def reset(self) -> None:
+        """
+        Closes the breaker and forgets all recorded requests.
+        """
+
+        with self.__lock:
+            self.__state = self.CLOSED
+            self.__generation += 1
+            self.__probes = 0
+            self.__outcomes.clear()
+
+    def __record(self, failed: bool, ticket: int) -> None:
+        now: float = time.monotonic()
+        with self.__lock:
+            # Requests let through before the last change of state, e.g. a
+            # slow request sent before the breaker opened, say nothing
+            # about the probes.
+            if ticket is not None and ticket != self.__generation:
+                return
+
+            if self.__state == self.HALF_OPEN:
+                self.__probes -= 1
+                if failed:
+                    self.__open(now)
+                elif self.__probes <= 0:
+                    self.__state = self.CLOSED
+                    self.__generation += 1
+                    self.__outcomes.clear()
+                return
+
+            if self.__state == self.OPEN:
+                return
+
+            self.__outcomes.append((now, failed))
+            while self.__outcomes and now - self.__outcomes[0][0] > self.window:
+                self.__outcomes.popleft()
+
+            total: int = len(self.__outcomes)
+            if total >= self.minimum_requests and sum(1 for _, failure in self.__outcomes if failure) >= self.failure_rate * total:
+                self.__open(now)
+
+    def __release(self, ticket: int) -> None:
+        with self.__lock:
+            if self.__state == self.HALF_OPEN and (ticket is None or ticket == self.__generation):
+                self.__probes -= 1
+
+    def __open(self, now: float) -> None:
+        self.__state = self.OPEN
+        self.__generation += 1
+        self.__opened = now
+        self.__probes = 0
+        self.__outcomes.clear()
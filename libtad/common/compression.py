@@ -0,0 +1,108 @@
+from http.client import HTTPException
+import zlib
+
+ACCEPT_ENCODING: str = "gzip, deflate"
+
+class Decompressor:
+    """
+    Incrementally decodes a response body sent with a Content-Encoding.
+
+    The body can be fed in chunks as it is read from the connection, so a
+    compressed response is decoded while it is parsed instead of being held
+    in memory twice.
+
+    ``decompressor = Decompressor("gzip")``
+
+    ``data = decompressor.decompress(chunk) + decompressor.flush()``
+
+    ...
+
+    Attributes
+    ----------
+    encoding : str
+        The content encoding, one of "gzip", "deflate" and "identity".
+
+    Methods
+    -------
+    decompress(data)
+        Decodes the next chunk of the body.
+    flush()
+        Decodes what is left after the last chunk.
+    """
+
+    def __init__(self, encoding: str = None):
+        """
+        Parameters
+        ----------
+        encoding : str, optional
+            Value of the Content-Encoding header of the response.
+            No encoding by default.
+
+        Raises
+        ------
+        http.client.HTTPException
+            If the encoding is not supported.
+        """
+
+        encoding = (encoding or "identity").strip().lower()
+        if encoding == "x-gzip":
+            encoding = "gzip"
+        if encoding not in ("gzip", "deflate", "identity"):
+            raise HTTPException(f"Unsupported content encoding: {encoding}")
+
+        self.encoding: str = encoding
+        self.__first: bool = True
+        self.__decoder = None
+        if encoding == "gzip":
+            self.__decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self.__decoder = zlib.decompressobj()
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decodes the next chunk of the body.
+
+        Parameters
+        ----------
+        data : bytes
+            The chunk as read from the connection.
+
+        Returns
+        -------
+        data : bytes
+            The decoded bytes, which may be empty while the decoder waits
+            for more input.
+
+        """
+
+        if self.__decoder is None or not data:
+            return data
+
+        if not self.__first:
+            return self.__decoder.decompress(data)
+
+        self.__first = False
+        try:
+            return self.__decoder.decompress(data)
+        except zlib.error:
+            if self.encoding != "deflate":
+                raise
+            # Some servers send deflate without the zlib header and checksum
+            # the encoding is specified with.
+            self.__decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self.__decoder.decompress(data)
+
+    def flush(self) -> bytes:
+        """
+        Decodes what is left after the last chunk.
+
+        Returns
+        -------
+        data : bytes
+            The remaining decoded bytes.
+
+        """
+
+        if self.__decoder is None:
+            return b""
+        return self.__decoder.flush()
@@ -0,0 +1,320 @@
+from http.client import HTTPConnection, HTTPSConnection, HTTPResponse, HTTPException
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from ssl import SSLContext
+from typing import Dict, List, Tuple
+from .deadline import get_expiry, get_remaining
+from .compression import ACCEPT_ENCODING, Decompressor
+import socket
+import threading
+import time
+
+class PooledResponse:
+    """
+    A response read from a pooled connection.
+
+    The underlying connection is handed back to the pool when the response
+    is closed after its body has been read completely, and discarded
+    otherwise. Every read is bounded by the read timeout of the pool and
+    the time left until the deadline of the request. A compressed body is
+    decompressed while it is read.
+
+    ...
+
+    Attributes
+    ----------
+    status : int
+        HTTP status code of the response.
+    headers : http.client.HTTPMessage
+        Headers of the response.
+    """
+
+    def __init__(self, pool: "ConnectionPool", key: Tuple[str, str, int], connection: HTTPConnection, response: HTTPResponse, expires: float = None):
+        self.__pool: ConnectionPool = pool
+        self.__expires: float = expires
+        self.__key: Tuple[str, str, int] = key
+        self.__connection: HTTPConnection = connection
+        self.__response: HTTPResponse = response
+        self.__decompressor: Decompressor = Decompressor(response.headers.get("Content-Encoding"))
+        self.status: int = response.status
+        self.headers = response.headers
+
+    def read(self, amt: int = None) -> bytes:
+        decompressor: Decompressor = self.__decompressor
+        if decompressor.encoding == "identity":
+            return self.__read(amt)
+
+        if amt is None:
+            return decompressor.decompress(self.__read()) + decompressor.flush()
+
+        # An empty result marks the end of the body, so read on until the
+        # decompressor has output or the body is exhausted.
+        while True:
+            data: bytes = self.__read(amt)
+            if not data:
+                return decompressor.flush()
+            data = decompressor.decompress(data)
+            if data:
+                return data
+
+    def __read(self, amt: int = None) -> bytes:
+        if self.__expires is None:
+            return self.__response.read(amt)
+
+        if self.__connection is not None and self.__connection.sock is not None:
+            self.__connection.sock.settimeout(get_remaining(self.__expires, self.__pool.read_timeout))
+        try:
+            return self.__response.read(amt)
+        except socket.timeout:
+            get_remaining(self.__expires)
+            raise
+
+    def close(self) -> None:
+        if self.__connection is None:
+            return
+
+        connection = self.__connection
+        self.__connection = None
+
+        if self.__response.isclosed() and not self.__response.will_close:
+            self.__pool._release(self.__key, connection)
+        else:
+            self.__response.close()
+            connection.close()
+
+    def __enter__(self) -> "PooledResponse":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class ConnectionPool:
+    """
+    A pool of persistent keep-alive connections, kept per host.
+
+    Services share a single pool by default, so the TCP and TLS handshakes
+    are only paid once per connection instead of once per request.
+
+    ...
+
+    Attributes
+    ----------
+    max_size : int
+        Maximum number of idle connections kept open per host. Connections
+        released while the pool is full are closed.
+    idle_timeout : float
+        Number of seconds an idle connection may stay in the pool before it
+        is closed instead of being reused.
+    connect_timeout : float
+        Number of seconds to wait for a connection to be established, or
+        None to wait indefinitely.
+    read_timeout : float
+        Number of seconds to wait for the server to send data, or None to
+        wait indefinitely.
+    compress : bool
+        Whether to ask the server for a gzip or deflate compressed body,
+        which is decompressed transparently.
+
+    Methods
+    -------
+    shared()
+        Gets the pool shared by all services.
+    get(url, headers=None, timeout=None)
+        Performs a GET request and returns the response body.
+    open(url, headers=None, timeout=None)
+        Performs a GET request and returns the response for reading.
+    clear()
+        Closes all idle connections.
+    """
+
+    __shared: "ConnectionPool" = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, max_size: int = 10, idle_timeout: float = 30.0, connect_timeout: float = 10.0, read_timeout: float = 30.0, compress: bool = True):
+        """
+        Parameters
+        ----------
+        max_size : int, optional
+            Maximum number of idle connections kept open per host.
+        idle_timeout : float, optional
+            Number of seconds an idle connection may be kept for reuse.
+        connect_timeout : float, optional
+            Number of seconds to wait for a connection to be established.
+        read_timeout : float, optional
+            Number of seconds to wait for the server to send data.
+        compress : bool, optional
+            Whether to ask the server for a compressed body.
+        """
+
+        self.max_size: int = max_size
+        self.idle_timeout: float = idle_timeout
+        self.connect_timeout: float = connect_timeout
+        self.read_timeout: float = read_timeout
+        self.compress: bool = compress
+        self.__ssl_context: SSLContext = SSLContext()
+        self.__idle: Dict[Tuple[str, str, int], List[Tuple[HTTPConnection, float]]] = {}
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "ConnectionPool":
+        """
+        Gets the pool shared by all services.
+
+        Returns
+        -------
+        pool : ConnectionPool
+            The process-wide connection pool.
+
+        """
+
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    def get(self, url: str, headers: Dict[str, str] = None, timeout: float = None) -> bytes:
+        """
+        Performs a GET request and returns the response body.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        headers : dict of str, optional
+            Request headers.
+        timeout : float, optional
+            Number of seconds left for the whole request, which fails with
+            DeadlineExceededException once they have passed.
+
+        Returns
+        -------
+        body : bytes
+            The complete response body.
+
+        """
+
+        with self.open(url, headers, timeout) as response:
+            return response.read()
+
+    def open(self, url: str, headers: Dict[str, str] = None, timeout: float = None) -> PooledResponse:
+        """
+        Performs a GET request and returns the response for reading.
+
+        The response must be closed by the caller, preferably by using it as
+        a context manager.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        headers : dict of str, optional
+            Request headers.
+        timeout : float, optional
+            Number of seconds left for the whole request, which fails with
+            DeadlineExceededException once they have passed.
+
+        Returns
+        -------
+        response : PooledResponse
+            The response, positioned at the start of the body.
+
+        """
+
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key: Tuple[str, str, int] = (parts.scheme, parts.hostname, port)
+        path: str = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        headers = dict(headers or {})
+        if self.compress:
+            headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
+
+        expires: float = get_expiry(timeout)
+        while True:
+            connection, reused = self.__acquire(key)
+            try:
+                if connection.sock is None:
+                    connection.timeout = get_remaining(expires, self.connect_timeout)
+                    connection.connect()
+                connection.sock.settimeout(get_remaining(expires, self.read_timeout))
+                connection.request("GET", path, headers=headers)
+                response: HTTPResponse = connection.getresponse()
+            except (HTTPException, ConnectionError):
+                connection.close()
+                # The server may have dropped a connection while it was idle
+                # in the pool, in which case the request is safe to repeat.
+                if reused:
+                    continue
+                raise
+            except socket.timeout:
+                connection.close()
+                # Report a timeout caused by the deadline of the request as
+                # such, rather than as a slow read.
+                get_remaining(expires)
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            break
+
+        try:
+            pooled = PooledResponse(self, key, connection, response, expires)
+        except HTTPException:
+            # The body is sent with an encoding that cannot be decoded.
+            connection.close()
+            raise
+
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, pooled)
+
+        return pooled
+
+    def clear(self) -> None:
+        """
+        Closes all idle connections.
+        """
+
+        with self.__lock:
+            idle = self.__idle
+            self.__idle = {}
+
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    def __acquire(self, key: Tuple[str, str, int]) -> Tuple[HTTPConnection, bool]:
+        expired: List[HTTPConnection] = []
+        connection: HTTPConnection = None
+        now = time.monotonic()
+
+        with self.__lock:
+            connections = self.__idle.get(key, [])
+            while connections:
+                candidate, released = connections.pop()
+                if now - released > self.idle_timeout:
+                    expired.append(candidate)
+                    continue
+                connection = candidate
+                break
+
+        for stale in expired:
+            stale.close()
+
+        if connection is not None:
+            return connection, True
+
+        scheme, host, port = key
+        if scheme == "https":
+            return HTTPSConnection(host, port, context=self.__ssl_context), False
+        return HTTPConnection(host, port), False
+
+    def _release(self, key: Tuple[str, str, int], connection: HTTPConnection) -> None:
+        with self.__lock:
+            connections = self.__idle.setdefault(key, [])
+            if len(connections) < self.max_size:
+                connections.append((connection, time.monotonic()))
+                return
+
+        connection.close()
@@ -0,0 +1,55 @@
+from .exceptions import DeadlineExceededException
+import time
+
+def get_expiry(timeout: float) -> float:
+    """
+    Converts a number of seconds from now into a point in time.
+
+    Parameters
+    ----------
+    timeout : float
+        Number of seconds from now, or None for no limit.
+
+    Returns
+    -------
+    expires : float
+        The point in time on the monotonic clock, or None for no limit.
+
+    """
+
+    if timeout is None:
+        return None
+    return time.monotonic() + timeout
+
+def get_remaining(expires: float, timeout: float = None) -> float:
+    """
+    Gets the number of seconds left until a point in time.
+
+    Parameters
+    ----------
+    expires : float
+        The point in time on the monotonic clock, or None for no limit.
+    timeout : float, optional
+        Upper bound of the result, e.g. the timeout of a single read.
+
+    Returns
+    -------
+    remaining : float
+        The number of seconds left, at most `timeout`, or None if neither
+        sets a limit.
+
+    Raises
+    ------
+    DeadlineExceededException
+        If the point in time has passed.
+
+    """
+
+    if expires is None:
+        return timeout
+
+    remaining: float = expires - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededException("The deadline of the request has passed")
+
+    return remaining if timeout is None else min(timeout, remaining)
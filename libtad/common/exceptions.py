@@ -9,3 +9,9 @@ class MalformedXMLException(Exception):
 class QueriedDateOutOfRangeException(Exception):
     pass
 
+
+class DeadlineExceededException(TimeoutError):
+    pass
+
+class CircuitOpenException(Exception):
+    pass
@@ -0,0 +1,256 @@
+from .transport import Transport, AsyncTransport
+from .exceptions import DeadlineExceededException
+from datetime import date, datetime, timedelta
+from urllib.parse import urlsplit, parse_qsl
+from xml.sax.saxutils import escape, quoteattr
+from typing import Callable, Dict, List, Union
+from io import BytesIO
+import asyncio
+import threading
+import time
+
+class FakeResponse(BytesIO):
+    """
+    An in-memory response returned by FakeTransport.
+
+    ...
+
+    Attributes
+    ----------
+    status : int
+        HTTP status code of the response.
+    headers : dict of str
+        Headers of the response.
+    """
+
+    def __init__(self, body: bytes, status: int = 200, headers: Dict[str, str] = None):
+        super().__init__(body)
+        self.status: int = status
+        self.headers: Dict[str, str] = headers if headers is not None else {}
+
+class FakeTransport(Transport):
+    """
+    An in-process stand-in for api.xmltime.com serving canned XML.
+
+    Every service has a built-in document generator which answers requests
+    with well-formed data shaped after the query, e.g. one location per
+    requested place ID. Individual services can be overridden with a fixed
+    document or a callable taking the query arguments. This allows the
+    services to be tested, load-tested and benchmarked without network
+    access or an API account.
+
+    ...
+
+    Attributes
+    ----------
+    responses : dict
+        Custom responses by service name. A value is either the XML document
+        as str or bytes, or a callable receiving the query arguments as a
+        dict and returning the document.
+    size : int
+        Number of entries in generated list responses such as places,
+        holidays and DST entries.
+    latency : float
+        Number of seconds every request is delayed by, to simulate the
+        round trip to the API.
+    requests : list of str
+        URLs of all requests served so far.
+
+    Methods
+    -------
+    open(url, headers=None, timeout=None)
+        Serves the canned response for a request.
+    """
+
+    def __init__(self, responses: Dict[str, Union[str, bytes, Callable[[Dict[str, str]], Union[str, bytes]]]] = None, size: int = 10, latency: float = 0.0):
+        """
+        Parameters
+        ----------
+        responses : dict, optional
+            Custom responses by service name.
+        size : int, optional
+            Number of entries in generated list responses.
+        latency : float, optional
+            Number of seconds every request is delayed by.
+        """
+
+        self.responses: Dict[str, Union[str, bytes, Callable[[Dict[str, str]], Union[str, bytes]]]] = responses if responses is not None else {}
+        self.size: int = size
+        self.latency: float = latency
+        self.requests: List[str] = []
+        self.__lock = threading.Lock()
+
+    def open(self, url: str, headers: Dict[str, str] = None, timeout: float = None) -> FakeResponse:
+        """
+        Serves the canned response for a request.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        headers : dict of str, optional
+            Request headers.
+        timeout : float, optional
+            Number of seconds left for the whole request. Requests with a
+            higher latency fail with DeadlineExceededException once they
+            have passed.
+
+        Returns
+        -------
+        response : FakeResponse
+            The canned response.
+
+        """
+
+        if self.latency:
+            time.sleep(self.latency if timeout is None else min(self.latency, timeout))
+        self._check_timeout(timeout)
+
+        return FakeResponse(self._serve(url), headers={"Content-Type": "text/xml; charset=utf-8"})
+
+    def _check_timeout(self, timeout: float) -> None:
+        if timeout is not None and self.latency > timeout:
+            raise DeadlineExceededException("The deadline of the request has passed")
+
+    def _serve(self, url: str) -> bytes:
+        with self.__lock:
+            self.requests.append(url)
+
+        parts = urlsplit(url)
+        service: str = parts.path.strip("/")
+        query: Dict[str, str] = dict(parse_qsl(parts.query))
+
+        response = self.responses.get(service)
+        if response is None:
+            generator = _GENERATORS.get(service)
+            response = generator(query, self.size) if generator else _error(f"Unknown service: {service}")
+        elif callable(response):
+            response = response(query)
+
+        if isinstance(response, str):
+            response = response.encode("utf-8")
+
+        return response
+
+class AsyncFakeTransport(FakeTransport, AsyncTransport):
+    """
+    An in-process stand-in for api.xmltime.com for the asynchronous services.
+
+    Behaves like FakeTransport, but the simulated latency is awaited instead
+    of blocking the event loop.
+    """
+
+    async def get(self, url: str, headers: Dict[str, str] = None, timeout: float = None) -> bytes:
+        if self.latency:
+            await asyncio.sleep(self.latency if timeout is None else min(self.latency, timeout))
+        self._check_timeout(timeout)
+
+        return self._serve(url)
+
+def _document(content: str) -> str:
+    return f'<?xml version="1.0" encoding="UTF-8"?><data version="3">{content}</data>'
+
+def _error(message: str) -> str:
+    return _document(f"<error>{escape(message)}</error>")
+
+def _geo(name: str) -> str:
+    return (f"<geo><name>{escape(name)}</name><state>Oslo</state><country id=\"no\">Norway</country>"
+            "<latitude>59.913</latitude><longitude>10.740</longitude></geo>")
+
+def _time(iso: str) -> str:
+    day, clock = iso.split("T") if "T" in iso else (iso, "00:00:00")
+    year, month, mday = day.split("-")
+    hour, minute, second = clock[:8].split(":")
+    return (f'<time iso="{iso}+01:00"><datetime><year>{int(year)}</year><month>{int(month)}</month>'
+            f"<day>{int(mday)}</day><hour>{int(hour)}</hour><minute>{int(minute)}</minute><second>{int(second)}</second></datetime>"
+            '<timezone offset="+01:00"><zoneabb>CET</zoneabb><zonename>Central European Time</zonename>'
+            "<zoneoffset>3600</zoneoffset><zonedst>0</zonedst><zonetotaloffset>3600</zonetotaloffset></timezone></time>")
+
+def _timechanges(year: int) -> str:
+    return (f'<timechanges><change newdst="3600" newoffset="7200" utctime="{year}-03-28T01:00:00" '
+            f'oldlocaltime="{year}-03-28T02:00:00" newlocaltime="{year}-03-28T03:00:00"/>'
+            f'<change newdst="0" newoffset="3600" utctime="{year}-10-31T01:00:00" '
+            f'oldlocaltime="{year}-10-31T03:00:00" newlocaltime="{year}-10-31T02:00:00"/></timechanges>')
+
+def _location(location_id: str, iso: str = "2021-01-01T12:00:00") -> str:
+    return (f"<location id={quoteattr(location_id)}>{_geo(f'Place {location_id}')}{_time(iso)}"
+            f'{_timechanges(int(iso[:4]))}<astronomy><object name="sun"><event type="rise" hour="9" minute="18"/>'
+            '<event type="set" hour="15" minute="12"/></object></astronomy></location>')
+
+def _timeservice(query: Dict[str, str], size: int) -> str:
+    return _document("".join(_location(pid) for pid in query.get("placeid", "").split(",") if pid))
+
+def _converttime(query: Dict[str, str], size: int) -> str:
+    iso: str = query.get("iso", "2021-01-01T12:00:00")
+    ids: List[str] = [query.get("fromid", "")] + [pid for pid in query.get("toid", "").split(",") if pid]
+    return _document(f"<utc>{_time(iso)}</utc>" + "".join(_location(pid, iso) for pid in ids))
+
+def _holidays(query: Dict[str, str], size: int) -> str:
+    country: str = query.get("country", "us")
+    year: int = int(query.get("year", date.today().year))
+    holidays: List[str] = []
+    for index in range(size):
+        day = date(year, 1, 1) + timedelta(days=(index * 365) // max(size, 1))
+        holidays.append(f'<holiday id="{2000 + index}" urlid="{country}/holiday-{index}" '
+                        f'url="https://www.timeanddate.com/holidays/{country}/holiday-{index}">'
+                        f"<uid>{2000 + index:08x}{year:08x}</uid>"
+                        f'<name><text lang="en">Holiday {index}</text></name>'
+                        f'<oneliner><text lang="en">Holiday number {index}.</text></oneliner>'
+                        f'<date iso="{day.isoformat()}"><datetime><year>{day.year}</year><month>{day.month}</month><day>{day.day}</day></datetime></date>'
+                        f'<country id="{country}">Country {country}</country><types><type>Federal Holiday</type></types></holiday>')
+    return _document("<holidays>" + "".join(holidays) + "</holidays>")
+
+def _dstlist(query: Dict[str, str], size: int) -> str:
+    year: int = int(query.get("year", date.today().year))
+    entries: List[str] = []
+    for index in range(size):
+        locations: str = ""
+        if query.get("listplaces") == "1":
+            locations = "<locations>" + "".join(f'<location id="{index * 10 + n}" name="Place {index * 10 + n}"/>' for n in range(10)) + "</locations>"
+        timechanges: str = _timechanges(year) if query.get("timechanges") == "1" else ""
+        entries.append(f'<dstentry><region><country id="c{index}">Country {index}</country><desc>Region {index}</desc>'
+                       f"<biggestplace>Place {index * 10}</biggestplace>{locations}</region>"
+                       '<stdtimezone offset="+01:00"><zoneabb>CET</zoneabb><zonename>Central European Time</zonename></stdtimezone>'
+                       '<dsttimezone offset="+02:00"><zoneabb>CEST</zoneabb><zonename>Central European Summer Time</zonename></dsttimezone>'
+                       f"<dststart>{year}-03-28</dststart><dstend>{year}-10-31</dstend>{timechanges}</dstentry>")
+    return _document("<dstlist>" + "".join(entries) + "</dstlist>")
+
+def _places(query: Dict[str, str], size: int) -> str:
+    places: str = "".join(f'<place id="{index}" urlid="norway/place-{index}">{_geo(f"Place {index}")}</place>' for index in range(1, size + 1))
+    return _document(f"<places>{places}</places>")
+
+def _astronomy(query: Dict[str, str], size: int) -> str:
+    start: date = datetime.strptime(query.get("startdt", "2021-01-01")[:10], "%Y-%m-%d").date()
+    end: date = datetime.strptime(query.get("enddt", start.isoformat())[:10], "%Y-%m-%d").date()
+    days: List[str] = []
+    while start <= end:
+        days.append(f'<day date="{start.isoformat()}" daylength="06:00:00" moonphase="fullmoon">'
+                    f'<event type="rise" isotime="{start.isoformat()}T09:00:00+01:00" utctime="{start.isoformat()}T08:00:00" azimuth="140.0"/>'
+                    f'<event type="set" isotime="{start.isoformat()}T15:00:00+01:00" utctime="{start.isoformat()}T14:00:00" azimuth="220.0"/></day>')
+        start += timedelta(days=1)
+    return _document(f"<location id={quoteattr(query.get('placeid', ''))}>{_geo('Oslo')}<astronomy>"
+                     f"<object name={quoteattr(query.get('object', 'sun'))}>" + "".join(days) + "</object></astronomy></location>")
+
+def _astrodata(query: Dict[str, str], size: int) -> str:
+    results: str = "".join(f'<result isotime="{iso}+01:00" utctime="{iso}"><altitude>10.0</altitude><azimuth>180.0</azimuth>'
+                           "<distance>149600000.0</distance></result>" for iso in query.get("interval", "").split(",") if iso)
+    return _document(f"<location id={quoteattr(query.get('placeid', ''))}>{_geo('Oslo')}<astronomy>"
+                     f"<object name={quoteattr(query.get('object', 'sun'))}>{results}</object></astronomy></location>")
+
+def _business(query: Dict[str, str], size: int) -> str:
+    start: str = query.get("startdt", "2021-01-01")[:10]
+    end: str = query.get("enddt", start)[:10]
+    return _document(f"{_geo('Oslo')}<period includeddays=\"{size}\" calendardays=\"{size}\" skippeddays=\"0\">"
+                     f'<startdate iso="{start}"/><enddate iso="{end}"/></period>')
+
+_GENERATORS: Dict[str, Callable[[Dict[str, str], int], str]] = {
+    "timeservice": _timeservice,
+    "converttime": _converttime,
+    "holidays": _holidays,
+    "dstlist": _dstlist,
+    "places": _places,
+    "astronomy": _astronomy,
+    "astrodata": _astrodata,
+    "businessdate": _business,
+    "businessduration": _business,
+}
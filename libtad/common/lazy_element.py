@@ -0,0 +1,95 @@
+import xml.etree.ElementTree as ET
+from typing import Callable, Tuple
+
+class LazyField:
+    """
+    An attribute of a datatype which is decoded from its XML element.
+
+    The field is decoded on first access and stored on the instance, so
+    later reads are plain attribute lookups. Fields can be assigned like any
+    other attribute.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Name of the attribute.
+    decode : callable
+        Function taking the instance and its element, and returning the
+        value of the attribute.
+    """
+
+    def __init__(self, decode: Callable[[object, ET.Element], object]):
+        """
+        Parameters
+        ----------
+        decode : callable
+            Function taking the instance and its element, and returning the
+            value of the attribute. Its name is the name of the attribute.
+        """
+
+        self.decode: Callable[[object, ET.Element], object] = decode
+        self.name: str = decode.__name__
+        self.__doc__ = decode.__doc__
+
+    def __get__(self, instance: object, owner: type) -> object:
+        if instance is None:
+            return self
+
+        value = self.decode(instance, instance._node)
+        instance.__dict__[self.name] = value
+        return value
+
+class LazyElement:
+    """
+    Base class of datatypes whose attributes are `LazyField`s decoded from
+    an XML element.
+
+    By default every field is decoded when the object is created, and the
+    element is dropped. A lazy object keeps its element instead, and only
+    decodes the fields which are read, which saves most of the work when
+    only a few fields of many objects are needed.
+
+    ...
+
+    Methods
+    -------
+    decode_all()
+        Decodes the fields which have not been read yet, and drops the
+        element.
+    """
+
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(name for name in dir(cls) if isinstance(getattr(cls, name, None), LazyField))
+
+    def __init__(self, node: ET.Element, lazy: bool = False):
+        """
+        Parameters
+        ----------
+        node : xml.etree.ElementTree.Element
+            The element to decode the fields from.
+        lazy : bool, optional
+            Whether to decode the fields on first access.
+            Decodes all fields at once by default.
+        """
+
+        self._node: ET.Element = node
+        if not lazy:
+            self.decode_all()
+
+    def decode_all(self) -> None:
+        """
+        Decodes the fields which have not been read yet, and drops the
+        element.
+        """
+
+        if self._node is None:
+            return
+
+        for name in self._fields:
+            getattr(self, name)
+        self._node = None
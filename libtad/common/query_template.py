@@ -0,0 +1,116 @@
+from urllib.parse import urlencode
+from typing import Dict, List, Tuple
+
+class QueryTemplate:
+    """
+    The arguments a service sends with every request, encoded once.
+
+    Services keep a template of the arguments that only depend on their
+    settings, such as the language and the output options. A request then
+    only encodes the arguments of the call itself, and appends them to the
+    encoded template.
+
+    ...
+
+    Attributes
+    ----------
+    arguments : dict
+        The static arguments.
+    query : str
+        The static arguments encoded as a query string.
+    canonical : list of tuple
+        The static arguments as sorted pairs of strings, used to build
+        cache keys.
+
+    Methods
+    -------
+    bind(arguments)
+        Combines the template with the arguments of a call.
+    """
+
+    def __init__(self, arguments: Dict[str, object]):
+        """
+        Parameters
+        ----------
+        arguments : dict
+            The static arguments.
+        """
+
+        self.arguments: Dict[str, object] = dict(arguments)
+        self.query: str = urlencode(self.arguments)
+        self.canonical: List[Tuple[str, str]] = sorted((name, str(value)) for name, value in self.arguments.items())
+
+    def bind(self, arguments: Dict[str, object]) -> "QueryArguments":
+        """
+        Combines the template with the arguments of a call.
+
+        Parameters
+        ----------
+        arguments : dict
+            The arguments of the call.
+
+        Returns
+        -------
+        arguments : QueryArguments
+            All arguments of the request.
+
+        """
+
+        return QueryArguments(self, arguments)
+
+class QueryArguments(dict):
+    """
+    The arguments of a request, built from a template and the arguments of
+    a call.
+
+    The dictionary holds all arguments. It should not be changed after it
+    has been built, since the query string is built from the template and
+    `varying` alone.
+
+    ...
+
+    Attributes
+    ----------
+    template : QueryTemplate
+        The template the static arguments come from.
+    varying : dict
+        The arguments of the call.
+
+    Methods
+    -------
+    get_query()
+        Gets the arguments encoded as a query string.
+    """
+
+    def __init__(self, template: QueryTemplate, varying: Dict[str, object]):
+        """
+        Parameters
+        ----------
+        template : QueryTemplate
+            The template the static arguments come from.
+        varying : dict
+            The arguments of the call, none of which may be in the
+            template.
+        """
+
+        super().__init__(template.arguments)
+        self.update(varying)
+        self.template: QueryTemplate = template
+        self.varying: Dict[str, object] = varying
+
+    def get_query(self) -> str:
+        """
+        Gets the arguments encoded as a query string.
+
+        Returns
+        -------
+        query : str
+            The encoded template followed by the encoded call arguments.
+
+        """
+
+        if not self.varying:
+            return self.template.query
+        if not self.template.arguments:
+            return urlencode(self.varying)
+        return self.template.query + "&" + urlencode(self.varying)
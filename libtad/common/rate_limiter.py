@@ -0,0 +1,162 @@
+from .exceptions import DeadlineExceededException
+import asyncio
+import threading
+import time
+
+class RateLimiter:
+    """
+    A token bucket limiting the rate at which requests are sent.
+
+    Every request takes a token from the bucket, which is refilled at `rate`
+    tokens per second up to `burst` tokens. Requests arriving while the
+    bucket is empty are delayed until their token is available, in order of
+    arrival, instead of being sent and throttled by the server.
+
+    By default every service uses the limiter shared by the process, which
+    does not limit anything until a rate is set:
+
+    ``RateLimiter.shared().rate = 10``
+
+    A service can be given its own limiter instead:
+
+    ``service.rate_limiter = RateLimiter(rate=2, burst=5)``
+
+    ...
+
+    Attributes
+    ----------
+    rate : float
+        Number of requests allowed per second on average, or None for no
+        limit.
+    burst : int
+        Maximum number of requests that may be sent at once after a quiet
+        period. Defaults to one second worth of requests.
+    delayed : int
+        Number of requests that had to wait for a token.
+
+    Methods
+    -------
+    shared()
+        Gets the limiter shared by all services.
+    reserve(timeout=None)
+        Takes a token and returns the number of seconds to wait for it.
+    acquire(timeout=None)
+        Takes a token, blocking until it is available.
+    acquire_async(timeout=None)
+        Takes a token, sleeping without blocking the event loop until it is
+        available.
+    """
+
+    __shared: "RateLimiter" = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, rate: float = None, burst: int = None):
+        """
+        Parameters
+        ----------
+        rate : float, optional
+            Number of requests allowed per second.
+            Unlimited by default.
+        burst : int, optional
+            Maximum number of requests that may be sent at once.
+        """
+
+        self.rate: float = rate
+        self.burst: int = burst
+        self.delayed: int = 0
+        self.__tokens: float = None
+        self.__updated: float = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "RateLimiter":
+        """
+        Gets the limiter shared by all services.
+
+        Returns
+        -------
+        limiter : RateLimiter
+            The process-wide rate limiter.
+
+        """
+
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    def reserve(self, timeout: float = None) -> float:
+        """
+        Takes a token and returns the number of seconds to wait for it.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds the request may wait.
+
+        Returns
+        -------
+        delay : float
+            Number of seconds until the request may be sent, or None if it
+            would have to wait longer than `timeout`, in which case no token
+            is taken.
+
+        """
+
+        rate: float = self.rate
+        if not rate:
+            return 0.0
+
+        capacity: float = float(self.burst or max(rate, 1.0))
+        with self.__lock:
+            now: float = time.monotonic()
+            tokens: float = capacity if self.__tokens is None else self.__tokens
+            # Tokens may go negative, which queues later requests behind the
+            # ones already waiting.
+            tokens = min(capacity, tokens + (now - self.__updated) * rate) - 1.0
+            delay: float = 0.0 if tokens >= 0 else -tokens / rate
+            if timeout is not None and delay > timeout:
+                return None
+
+            self.__tokens = tokens
+            self.__updated = now
+            if delay:
+                self.delayed += 1
+            return delay
+
+    def acquire(self, timeout: float = None) -> None:
+        """
+        Takes a token, blocking until it is available.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait. DeadlineExceededException is
+            raised immediately if the token would not be available in time.
+        """
+
+        delay: float = self.__reserve(timeout)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, timeout: float = None) -> None:
+        """
+        Takes a token, sleeping without blocking the event loop until it is
+        available.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait. DeadlineExceededException is
+            raised immediately if the token would not be available in time.
+        """
+
+        delay: float = self.__reserve(timeout)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def __reserve(self, timeout: float) -> float:
+        delay: float = self.reserve(timeout)
+        if delay is None:
+            raise DeadlineExceededException("The rate limit does not allow the request before its deadline")
+        return delay
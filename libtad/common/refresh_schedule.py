@@ -0,0 +1,135 @@
+from .cache import Cache
+from typing import Callable, List
+import threading
+
+class RefreshSchedule:
+    """
+    Refreshes a declared set of hot lookups in the background at a fixed
+    interval.
+
+    Every registered lookup is called again on a background thread, with
+    the cache bypassed so the answer is fetched from the API and stored.
+    With an interval shorter than the expiry of the cache, readers of these
+    lookups are always answered from the cache. Lookups are declared as
+    calls of the synchronous services. Their entries are shared with the
+    asynchronous services configured with the same cache.
+
+    ``schedule = RefreshSchedule(interval=60)``
+
+    ``schedule.add(lambda: service.current_time_for_place(LocationId("norway/oslo")))``
+
+    ``schedule.start()``
+
+    ...
+
+    Attributes
+    ----------
+    interval : float
+        Number of seconds between two refreshes of all lookups.
+    failures : int
+        Number of refreshes that failed. The previous entry stays in the
+        cache, and the lookup is refreshed again at the next interval.
+
+    Methods
+    -------
+    add(lookup)
+        Registers a lookup to refresh.
+    remove(lookup)
+        Stops refreshing a lookup.
+    refresh()
+        Refreshes all lookups once on the current thread.
+    start()
+        Starts refreshing the lookups on a background thread.
+    stop()
+        Stops the background thread.
+    """
+
+    def __init__(self, interval: float = 60.0):
+        """
+        Parameters
+        ----------
+        interval : float, optional
+            Number of seconds between two refreshes of all lookups.
+        """
+
+        self.interval: float = interval
+        self.failures: int = 0
+        self.__lookups: List[Callable[[], object]] = []
+        self.__lock = threading.Lock()
+        self.__stopped: threading.Event = None
+        self.__thread: threading.Thread = None
+
+    def add(self, lookup: Callable[[], object]) -> None:
+        """
+        Registers a lookup to refresh.
+
+        Parameters
+        ----------
+        lookup : callable
+            Calls a service method with the arguments of the hot lookup.
+        """
+
+        with self.__lock:
+            self.__lookups.append(lookup)
+
+    def remove(self, lookup: Callable[[], object]) -> None:
+        """
+        Stops refreshing a lookup.
+
+        Parameters
+        ----------
+        lookup : callable
+            A lookup passed to `add`.
+        """
+
+        with self.__lock:
+            self.__lookups.remove(lookup)
+
+    def refresh(self) -> None:
+        """
+        Refreshes all lookups once on the current thread.
+        """
+
+        with self.__lock:
+            lookups: List[Callable[[], object]] = list(self.__lookups)
+
+        with Cache.refreshing():
+            for lookup in lookups:
+                try:
+                    lookup()
+                except Exception:
+                    self.failures += 1
+
+    def start(self) -> None:
+        """
+        Starts refreshing the lookups on a background thread.
+
+        The lookups are refreshed right away, and then every `interval`
+        seconds until `stop` is called.
+        """
+
+        with self.__lock:
+            if self.__thread is not None:
+                return
+            self.__stopped = threading.Event()
+            self.__thread = threading.Thread(target=self.__run, args=(self.__stopped,), name="libtad-refresh-schedule", daemon=True)
+            self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background thread.
+        """
+
+        with self.__lock:
+            thread: threading.Thread = self.__thread
+            if thread is None:
+                return
+            self.__stopped.set()
+            self.__thread = None
+
+        thread.join()
+
+    def __run(self, stopped: threading.Event) -> None:
+        while not stopped.is_set():
+            self.refresh()
+            stopped.wait(self.interval)
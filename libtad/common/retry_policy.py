@@ -0,0 +1,221 @@
+from urllib.error import HTTPError, URLError
+from http.client import HTTPException
+from typing import Awaitable, Callable, Tuple, Type
+from .exceptions import DeadlineExceededException
+import asyncio
+import random
+import socket
+import time
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again.
+
+    Requests failing with a retryable status or exception are repeated with
+    exponentially growing delays, randomized to keep many clients from
+    retrying in lockstep. Errors reported by the API in the response, such
+    as an invalid argument, are never retried.
+
+    ``service.retry_policy = RetryPolicy(max_attempts=5, deadline=10)``
+
+    ...
+
+    Attributes
+    ----------
+    max_attempts : int
+        Maximum number of times a request is sent, including the first.
+    backoff : float
+        Number of seconds to wait before the first retry. The delay doubles
+        with every further retry.
+    max_backoff : float
+        Maximum number of seconds to wait between two attempts.
+    jitter : bool
+        Whether to wait a random fraction of the delay instead of all of it.
+    deadline : float
+        Number of seconds after the first attempt at which no more retries
+        are started, or None for no deadline.
+    retry_statuses : tuple of int
+        HTTP status codes that are retried.
+    retry_exceptions : tuple of type
+        Exception classes that are retried.
+
+    Methods
+    -------
+    is_retryable(exception)
+        Checks whether a request failing with `exception` may be retried.
+    get_delay(attempt, exception=None)
+        Gets the number of seconds to wait before the next attempt.
+    call(function, timeout=None)
+        Calls `function` until it succeeds or may not be retried.
+    call_async(function, timeout=None)
+        Awaits `function` until it succeeds or may not be retried.
+    """
+
+    RETRY_STATUSES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (ConnectionError, socket.timeout, HTTPException, URLError, asyncio.IncompleteReadError)
+
+    def __init__(self, max_attempts: int = 3, backoff: float = 0.1, max_backoff: float = 10.0, jitter: bool = True, deadline: float = None,
+                 retry_statuses: Tuple[int, ...] = None, retry_exceptions: Tuple[Type[BaseException], ...] = None):
+        """
+        Parameters
+        ----------
+        max_attempts : int, optional
+            Maximum number of times a request is sent.
+        backoff : float, optional
+            Number of seconds to wait before the first retry.
+        max_backoff : float, optional
+            Maximum number of seconds to wait between two attempts.
+        jitter : bool, optional
+            Whether to randomize the delays.
+        deadline : float, optional
+            Number of seconds after which no more retries are started.
+        retry_statuses : tuple of int, optional
+            HTTP status codes that are retried.
+        retry_exceptions : tuple of type, optional
+            Exception classes that are retried.
+        """
+
+        self.max_attempts: int = max_attempts
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.jitter: bool = jitter
+        self.deadline: float = deadline
+        self.retry_statuses: Tuple[int, ...] = retry_statuses if retry_statuses is not None else self.RETRY_STATUSES
+        self.retry_exceptions: Tuple[Type[BaseException], ...] = retry_exceptions if retry_exceptions is not None else self.RETRY_EXCEPTIONS
+
+    def is_retryable(self, exception: BaseException) -> bool:
+        """
+        Checks whether a request failing with `exception` may be retried.
+
+        Parameters
+        ----------
+        exception : BaseException
+            The exception the request failed with.
+
+        Returns
+        -------
+        retryable : bool
+            Whether the request may be retried.
+
+        """
+
+        # The deadline of the request has passed, so there is no time left
+        # for another attempt.
+        if isinstance(exception, DeadlineExceededException):
+            return False
+
+        # HTTPError derives from URLError, but is only retried for the
+        # configured statuses.
+        if isinstance(exception, HTTPError):
+            return exception.code in self.retry_statuses
+
+        return isinstance(exception, self.retry_exceptions)
+
+    def get_delay(self, attempt: int, exception: BaseException = None) -> float:
+        """
+        Gets the number of seconds to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of attempts made so far.
+        exception : BaseException, optional
+            The exception the last attempt failed with. A Retry-After header
+            sent with it is respected.
+
+        Returns
+        -------
+        delay : float
+            Number of seconds to wait.
+
+        """
+
+        delay: float = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        retry_after = getattr(exception, "headers", None) and exception.headers.get("Retry-After")
+        if retry_after and retry_after.strip().isdigit():
+            delay = max(delay, min(float(retry_after), self.max_backoff))
+
+        return delay
+
+    def call(self, function: Callable[[], object], timeout: float = None) -> object:
+        """
+        Calls `function` until it succeeds or may not be retried.
+
+        Parameters
+        ----------
+        function : callable
+            The request to make.
+        timeout : float, optional
+            Number of seconds left until the deadline of the request, after
+            which no more retries are started.
+
+        Returns
+        -------
+        result : object
+            The result of the first successful call.
+
+        """
+
+        start: float = time.monotonic()
+        deadline: float = self.deadline
+        if timeout is not None and (deadline is None or timeout < deadline):
+            deadline = timeout
+        attempt: int = 0
+        while True:
+            attempt += 1
+            try:
+                return function()
+            except Exception as exception:
+                delay: float = self.__get_retry_delay(attempt, exception, start, deadline)
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+
+    async def call_async(self, function: Callable[[], Awaitable[object]], timeout: float = None) -> object:
+        """
+        Awaits `function` until it succeeds or may not be retried.
+
+        Parameters
+        ----------
+        function : callable
+            Coroutine function making the request.
+        timeout : float, optional
+            Number of seconds left until the deadline of the request, after
+            which no more retries are started.
+
+        Returns
+        -------
+        result : object
+            The result of the first successful call.
+
+        """
+
+        start: float = time.monotonic()
+        deadline: float = self.deadline
+        if timeout is not None and (deadline is None or timeout < deadline):
+            deadline = timeout
+        attempt: int = 0
+        while True:
+            attempt += 1
+            try:
+                return await function()
+            except Exception as exception:
+                delay: float = self.__get_retry_delay(attempt, exception, start, deadline)
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+
+    def __get_retry_delay(self, attempt: int, exception: BaseException, start: float, deadline: float) -> float:
+        if attempt >= self.max_attempts or not self.is_retryable(exception):
+            return None
+
+        delay: float = self.get_delay(attempt, exception)
+        if deadline is not None and time.monotonic() + delay - start >= deadline:
+            return None
+
+        return delay
@@ -0,0 +1,167 @@
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from .exceptions import DeadlineExceededException
+from typing import Awaitable, Callable, Dict, Hashable
+from functools import partial
+import asyncio
+import threading
+import time
+
+class SingleFlight:
+    """
+    Coalesces identical calls made concurrently from several threads.
+
+    The first caller for a key runs the call, while callers arriving with
+    the same key before it has finished wait for its result instead of
+    repeating the call. Exceptions are passed on to every waiting caller,
+    except for DeadlineExceededException: the call only had the time of the
+    caller that started it, so callers with time left make the call again.
+
+    ...
+
+    Methods
+    -------
+    do(key, function, timeout=None)
+        Runs `function`, or waits for the call already running for `key`.
+    """
+
+    def __init__(self):
+        self.__calls: Dict[Hashable, Future] = {}
+        self.__lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], object], timeout: float = None) -> object:
+        """
+        Runs `function`, or waits for the call already running for `key`.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifies identical calls.
+        function : callable
+            The call to run.
+        timeout : float, optional
+            Maximum number of seconds to wait for a call already running.
+
+        Returns
+        -------
+        result : object
+            The result of the call.
+
+        """
+
+        with self.__lock:
+            future: Future = self.__calls.get(key)
+            leader: bool = future is None
+            if leader:
+                future = self.__calls[key] = Future()
+
+        if not leader:
+            start: float = time.monotonic()
+            try:
+                return future.result(timeout)
+            except DeadlineExceededException:
+                # The call ran out of the time of the caller that started it,
+                # which this caller may still have.
+                remaining: float = timeout - (time.monotonic() - start) if timeout is not None else None
+                if remaining is not None and remaining <= 0:
+                    raise
+                return self.do(key, function, remaining)
+            except FutureTimeoutError:
+                # The call itself may have failed with a timeout as well.
+                if future.done():
+                    return future.result()
+                raise DeadlineExceededException("The deadline of the request has passed") from None
+
+        try:
+            result = function()
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+
+class AsyncSingleFlight:
+    """
+    Coalesces identical calls made concurrently from several tasks.
+
+    The first caller for a key starts the call, while callers arriving with
+    the same key before it has finished await the same call. Cancelling one
+    of the callers does not cancel the call for the others. Callers with time
+    left make the call again if it failed with DeadlineExceededException,
+    since it only had the time of the caller that started it.
+
+    ...
+
+    Methods
+    -------
+    do(key, function, timeout=None)
+        Runs `function`, or awaits the call already running for `key`.
+    """
+
+    def __init__(self):
+        self.__loops: Dict[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[object]], timeout: float = None) -> object:
+        """
+        Runs `function`, or awaits the call already running for `key`.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifies identical calls.
+        function : callable
+            Coroutine function making the call.
+        timeout : float, optional
+            Maximum number of seconds to wait for the call.
+
+        Returns
+        -------
+        result : object
+            The result of the call.
+
+        """
+
+        calls: Dict[Hashable, asyncio.Future] = self.__get_calls()
+        future: asyncio.Future = calls.get(key)
+        leader: bool = future is None
+        if leader:
+            future = calls[key] = asyncio.ensure_future(function())
+            future.add_done_callback(partial(self.__finish, calls, key))
+
+        start: float = time.monotonic()
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except DeadlineExceededException:
+            # The call ran out of the time of the caller that started it,
+            # which this caller may still have.
+            remaining: float = timeout - (time.monotonic() - start) if timeout is not None else None
+            if leader or (remaining is not None and remaining <= 0):
+                raise
+            return await self.do(key, function, remaining)
+        except asyncio.TimeoutError:
+            # The call itself may have failed with a timeout as well.
+            if future.done():
+                return future.result()
+            raise DeadlineExceededException("The deadline of the request has passed") from None
+
+    def __get_calls(self) -> Dict[Hashable, asyncio.Future]:
+        # Calls are tracked per event loop, as their futures cannot be
+        # awaited from another loop. Loops closed while calls were running
+        # are dropped when a new loop starts making calls.
+        loop = asyncio.get_event_loop()
+        calls: Dict[Hashable, asyncio.Future] = self.__loops.get(loop)
+        if calls is None:
+            for closed in [other for other in list(self.__loops) if other.is_closed()]:
+                self.__loops.pop(closed, None)
+            calls = self.__loops.setdefault(loop, {})
+        return calls
+
+    def __finish(self, calls: Dict[Hashable, asyncio.Future], key: Hashable, future: asyncio.Future) -> None:
+        calls.pop(key, None)
+        # Retrieve the exception, so it is not reported as unhandled when
+        # every caller was cancelled before the call finished.
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,144 @@
+from .cache import Cache
+from typing import Dict, List
+import os
+import sqlite3
+import threading
+import time
+
+class SQLiteCache(Cache):
+    """
+    A persistent cache of responses stored in a local SQLite database.
+
+    Meant for slowly changing data such as holidays of past years, DST
+    lists and the places catalog, so they survive process restarts. The
+    database file can be shared by several worker processes on one host.
+    Unlike ResponseCache, the raw XML responses are stored and parsed again
+    on every hit.
+
+    ...
+
+    Attributes
+    ----------
+    path : str
+        Path of the database file.
+    ttl : float
+        Number of seconds an entry stays fresh, unless the service has its
+        own expiry in `ttls`.
+    ttls : dict of float
+        Number of seconds entries stay fresh by service name, e.g.
+        ``{"places": 7 * 86400}``.
+    hits : int
+        Number of lookups answered from the cache by this instance.
+    misses : int
+        Number of lookups that were not in the cache or had expired.
+
+    Methods
+    -------
+    purge()
+        Removes all expired entries, which are kept until then so they can
+        still be served while the API is unavailable.
+    """
+
+    stores_response: bool = True
+
+    def __init__(self, path: str, ttl: float = 86400.0, ttls: Dict[str, float] = None, timeout: float = 30.0, stale_while_revalidate: float = None):
+        """
+        Parameters
+        ----------
+        path : str
+            Path of the database file. It is created if it does not exist.
+        ttl : float, optional
+            Number of seconds an entry stays fresh.
+        ttls : dict of float, optional
+            Number of seconds entries stay fresh by service name.
+        timeout : float, optional
+            Number of seconds to wait for a lock held by another process.
+        stale_while_revalidate : float, optional
+            Number of seconds an expired entry is still returned while it is
+            refreshed in the background.
+        """
+
+        self.path: str = path
+        self.ttl: float = ttl
+        self.ttls: Dict[str, float] = ttls if ttls is not None else {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stale_while_revalidate: float = stale_while_revalidate
+        self.__timeout: float = timeout
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+        self.__inherited: List[sqlite3.Connection] = []
+
+        # The schema is created on a connection of its own, so a cache built
+        # before the process forks does not hand an open connection to the
+        # child processes.
+        connection: sqlite3.Connection = self.__connect()
+        try:
+            with connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS responses ("
+                                   "key TEXT PRIMARY KEY, "
+                                   "service TEXT NOT NULL, "
+                                   "response TEXT NOT NULL, "
+                                   "created REAL NOT NULL, "
+                                   "expires REAL NOT NULL)")
+                connection.execute("CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)")
+        finally:
+            connection.close()
+
+    def get(self, service: str, key: str) -> str:
+        row = self.__connection().execute("SELECT response FROM responses WHERE key = ? AND expires > ?", (key, time.time())).fetchone()
+        # The batch calls look up entries from several threads at once.
+        with self.__lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return row[0] if row is not None else None
+
+    def get_stale(self, service: str, key: str, max_staleness: float = None) -> str:
+        oldest: float = time.time() - max_staleness if max_staleness is not None else float("-inf")
+        row = self.__connection().execute("SELECT response FROM responses WHERE key = ? AND expires >= ?", (key, oldest)).fetchone()
+        return row[0] if row is not None else None
+
+    def set(self, service: str, key: str, value: str) -> None:
+        now: float = time.time()
+        expires: float = now + self.ttls.get(service, self.ttl)
+        with self.__connection() as connection:
+            connection.execute("INSERT OR REPLACE INTO responses (key, service, response, created, expires) VALUES (?, ?, ?, ?, ?)",
+                               (key, service, value, now, expires))
+
+    def clear(self) -> None:
+        with self.__connection() as connection:
+            connection.execute("DELETE FROM responses")
+
+    def purge(self) -> None:
+        """
+        Removes all expired entries, which are kept until then so they can
+        still be served while the API is unavailable.
+        """
+
+        with self.__connection() as connection:
+            connection.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+
+    def __connection(self) -> sqlite3.Connection:
+        # SQLite connections may not be shared between threads or processes,
+        # so every thread opens its own, and opens a new one after a fork.
+        connection: sqlite3.Connection = getattr(self.__local, "connection", None)
+        pid: int = os.getpid()
+        if connection is None or self.__local.pid != pid:
+            if connection is not None:
+                # Closing the connection of the parent process could
+                # checkpoint and remove the WAL file it is still using, so
+                # the connection is kept open, unused.
+                self.__inherited.append(connection)
+            connection = self.__connect()
+            self.__local.connection = connection
+            self.__local.pid = pid
+        return connection
+
+    def __connect(self) -> sqlite3.Connection:
+        # WAL mode lets readers in other processes proceed while one process
+        # writes.
+        connection: sqlite3.Connection = sqlite3.connect(self.path, timeout=self.__timeout)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
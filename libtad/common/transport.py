@@ -0,0 +1,224 @@
+from .connection_pool import ConnectionPool
+from .async_connection_pool import AsyncConnectionPool
+from typing import Dict
+import threading
+
+class Transport:
+    """
+    Base class for the transports used by the services to talk to the API.
+
+    A transport performs a GET request for a fully built URL. Subclasses
+    must implement `open`, which returns a readable response object that
+    can be used as a context manager.
+
+    ...
+
+    Methods
+    -------
+    open(url, headers=None, timeout=None)
+        Performs a GET request and returns the response for reading.
+    get(url, headers=None, timeout=None)
+        Performs a GET request and returns the response body.
+    """
+
+    def open(self, url: str, headers: Dict[str, str] = None, timeout: float = None):
+        """
+        Performs a GET request and returns the response for reading.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        headers : dict of str, optional
+            Request headers.
+        timeout : float, optional
+            Number of seconds left for the whole request, which fails with
+            DeadlineExceededException once they have passed.
+
+        Returns
+        -------
+        response : file-like object
+            The response, positioned at the start of the body.
+
+        """
+
+        raise NotImplementedError
+
+    def get(self, url: str, headers: Dict[str, str] = None, timeout: float = None) -> bytes:
+        """
+        Performs a GET request and returns the response body.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        headers : dict of str, optional
+            Request headers.
+        timeout : float, optional
+            Number of seconds left for the whole request, which fails with
+            DeadlineExceededException once they have passed.
+
+        Returns
+        -------
+        body : bytes
+            The complete response body.
+
+        """
+
+        with self.open(url, headers, timeout) as response:
+            return response.read()
+
+class PooledTransport(Transport):
+    """
+    Transport that sends requests over persistent keep-alive connections.
+
+    The shared instance is the transport used by the services unless
+    another one is passed in.
+
+    ...
+
+    Attributes
+    ----------
+    pool : ConnectionPool
+        The connection pool requests are sent through. Uses the pool shared
+        by all services by default.
+
+    Methods
+    -------
+    shared()
+        Gets the transport shared by all services which are not given
+        another one.
+    """
+
+    __shared: "PooledTransport" = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, pool: ConnectionPool = None):
+        """
+        Parameters
+        ----------
+        pool : ConnectionPool, optional
+            The connection pool to use.
+            Uses the shared pool by default.
+        """
+
+        self.pool: ConnectionPool = pool if pool is not None else ConnectionPool.shared()
+
+    @classmethod
+    def shared(cls) -> "PooledTransport":
+        """
+        Gets the transport shared by all services which are not given
+        another one.
+
+        Services using the same transport coalesce identical requests.
+
+        Returns
+        -------
+        transport : PooledTransport
+            The process-wide transport over the shared connection pool.
+
+        """
+
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    def open(self, url: str, headers: Dict[str, str] = None, timeout: float = None):
+        return self.pool.open(url, headers, timeout)
+
+class AsyncTransport:
+    """
+    Base class for the transports used by the asynchronous services.
+
+    Subclasses must implement the coroutine `get`.
+
+    ...
+
+    Methods
+    -------
+    get(url, headers=None, timeout=None)
+        Performs a GET request and returns the response body.
+    """
+
+    async def get(self, url: str, headers: Dict[str, str] = None, timeout: float = None) -> bytes:
+        """
+        Performs a GET request and returns the response body.
+
+        Parameters
+        ----------
+        url : str
+            The URL to request.
+        headers : dict of str, optional
+            Request headers.
+        timeout : float, optional
+            Number of seconds left for the whole request, which fails with
+            DeadlineExceededException once they have passed.
+
+        Returns
+        -------
+        body : bytes
+            The complete response body.
+
+        """
+
+        raise NotImplementedError
+
+class AsyncPooledTransport(AsyncTransport):
+    """
+    Transport that sends requests over non-blocking keep-alive connections.
+
+    The shared instance is the transport used by the asynchronous services
+    unless another one is passed in.
+
+    ...
+
+    Attributes
+    ----------
+    pool : AsyncConnectionPool
+        The connection pool requests are sent through. Uses the pool shared
+        by all asynchronous services by default.
+
+    Methods
+    -------
+    shared()
+        Gets the transport shared by all asynchronous services which are not given
+        another one.
+    """
+
+    __shared: "AsyncPooledTransport" = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, pool: AsyncConnectionPool = None):
+        """
+        Parameters
+        ----------
+        pool : AsyncConnectionPool, optional
+            The connection pool to use.
+            Uses the shared pool by default.
+        """
+
+        self.pool: AsyncConnectionPool = pool if pool is not None else AsyncConnectionPool.shared()
+
+    @classmethod
+    def shared(cls) -> "AsyncPooledTransport":
+        """
+        Gets the transport shared by all asynchronous services which are not given
+        another one.
+
+        Services using the same transport coalesce identical requests.
+
+        Returns
+        -------
+        transport : AsyncPooledTransport
+            The process-wide transport over the shared connection pool.
+
+        """
+
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    async def get(self, url: str, headers: Dict[str, str] = None, timeout: float = None) -> bytes:
+        return await self.pool.get(url, headers, timeout)
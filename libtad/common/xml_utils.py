@@ -1,18 +1,64 @@
 from libtad.common.exceptions import ServerSideException, MalformedXMLException
+from typing import Iterable, Iterator, List
 import xml.etree.ElementTree as ET
 
 class XmlUtils:
+    CHUNK_SIZE: int = 64 * 1024
+
     @staticmethod
-    def check_for_errors(result: str) -> None:
+    def parse(result: str) -> ET.Element:
         node: ET.Element = ET.fromstring(result)
+        XmlUtils.check_root(node)
+        return node
 
-        if not node.get("version"):
-            raise MalformedXMLException("Expected 'version' attribute in data node")
+    @staticmethod
+    def check_for_errors(result: str) -> None:
+        XmlUtils.parse(result)
+
+    @staticmethod
+    def iterparse(chunks: Iterable[bytes], tag: str) -> Iterator[ET.Element]:
+        parser = ET.XMLPullParser(events=("start", "end"))
+        path: List[ET.Element] = []
+
+        def read_events() -> Iterator[ET.Element]:
+            for event, node in parser.read_events():
+                if event == "start":
+                    if not path:
+                        XmlUtils.check_version(node)
+                    path.append(node)
+                    continue
+
+                path.pop()
+                if node.tag == tag:
+                    yield node
+                    # Drop consumed elements so the tree never grows beyond
+                    # the element currently being read.
+                    node.clear()
+                    if path:
+                        path[-1].remove(node)
+                elif node.tag == "error" and len(path) == 1:
+                    XmlUtils.handle_error(node)
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from read_events()
+
+        parser.close()
+        yield from read_events()
+
+    @staticmethod
+    def check_root(node: ET.Element) -> None:
+        XmlUtils.check_version(node)
 
         error_node: ET.Element = node.find("error")
         if error_node is not None:
             XmlUtils.handle_error(error_node)
 
+    @staticmethod
+    def check_version(node: ET.Element) -> None:
+        if not node.get("version"):
+            raise MalformedXMLException("Expected 'version' attribute in data node")
+
     @staticmethod
     def handle_error(error_node: ET.Element) -> None:
         error_msg: str = error_node.text if error_node is not None else "Unspecified error"
@@ -2,3 +2,4 @@ ENTRYPOINT:                 str = "https://api.xmltime.com"
 DEFAULTLANGUAGE:            str = "en"
 DEFAULTRETURNFORMAT:        str = "xml"
 DEFAULTVERBOSETIMEVALUE:    str = "0"
+USERAGENT:                  str = "libtad-py"
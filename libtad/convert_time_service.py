@@ -2,13 +2,39 @@ from libtad.base_service import BaseService
 from libtad.datatypes.places import LocationId
 from libtad.datatypes.time import TADDateTime
 from libtad.datatypes.converted_times import ConvertedTimes
-from libtad.common import XmlUtils
+from libtad.common import XmlUtils, Transport, chunked, get_expiry
 import libtad.constants as Constants
-from typing import List, Dict, Union
+from typing import Callable, List, Dict, NamedTuple, Tuple, Union
 import xml.etree.ElementTree as ET
-from urllib.parse import urlencode
-from urllib.request import urlopen, Request
-from ssl import SSLContext
+import copy
+
+class ConvertTimeOptions(NamedTuple):
+    """
+    Immutable options of ConvertTimeService, which can be passed to a
+    single call.
+
+    Options that are not given take their default values. The options of a
+    service can be changed for a single call with e.g.
+    ``service.options._replace(radius=50)``.
+
+    ...
+
+    Attributes
+    ----------
+    language : tuple of str
+        Languages of the returned texts.
+    radius : int
+        Search radius in kilometers for translating coordinates to locations.
+    include_time_changes : bool
+        Add a list of time changes during the year to the location object.
+    include_timezone_information : bool
+        Add timezone information under the time object.
+    """
+
+    language: Tuple[str, ...] = (Constants.DEFAULTLANGUAGE,)
+    radius: int = None
+    include_time_changes: bool = True
+    include_timezone_information: bool = True
 
 class ConvertTimeService(BaseService):
     """
@@ -27,6 +53,11 @@ class ConvertTimeService(BaseService):
         e.g. shows changes caused by daylight savings time.
     include_timezone_information : bool
         Add timezone information under the time object.
+    chunk_size : int
+        Maximum number of place IDs to convert to in a single request. Longer
+        lists are split into chunks which are fetched concurrently.
+    max_workers : int
+        Maximum number of requests sent at the same time.
     language : list of str
         The preferred language(s) for the texts. An error will be raised if the
         language code cannot be recognized. In case the text for a specific event
@@ -42,15 +73,23 @@ class ConvertTimeService(BaseService):
  
         Example:
         ``service.language.append("de")``
+    options : ConvertTimeOptions
+        The attributes above as immutable options, which calls use unless
+        options are passed to them. Assigning options sets the attributes.
 
     Methods
     -------
-    convert_time(from_id, time, to_ids=None)
+    convert_time(from_id, time, to_ids=None, deadline=None, options=None)
         Converts the time by using a LocationId, a ISO-string and optionally a list 
         of IDs to convert to.
+    convert_times(from_id, times, to_ids=None, deadline=None, options=None)
+        Converts several points in time from one place, optionally to a list of
+        IDs.
     """
 
-    def __init__(self, access_key: str, secret_key: str):
+    _options_type: type = ConvertTimeOptions
+
+    def __init__(self, access_key: str, secret_key: str, transport: Transport = None, options: ConvertTimeOptions = None):
         """
         Parameters
         ----------
@@ -58,18 +97,33 @@ class ConvertTimeService(BaseService):
             Access key.
         secret_key : str
             Secret key.
+        transport : Transport, optional
+            Transport used to send requests to the API.
+            Uses pooled keep-alive connections by default.
+        options : ConvertTimeOptions, optional
+            Options to set the attributes from.
+            Uses the default values by default.
         """
 
-        super().__init__(access_key, secret_key, "converttime")
+        super().__init__(access_key, secret_key, "converttime", transport)
         self.radius: int = None
         self.include_time_changes: bool = True
         self.include_timezone_information: bool = True
-        
-    def convert_time(self, from_id: LocationId, time: Union[str, TADDateTime], to_ids : List[LocationId] = None) -> ConvertedTimes:
+        self.chunk_size: int = 100
+        self.max_workers: int = 8
+
+        if options is not None:
+            self.options = options
+
+    def convert_time(self, from_id: LocationId, time: Union[str, TADDateTime], to_ids : List[LocationId] = None, deadline: float = None, options: ConvertTimeOptions = None) -> ConvertedTimes:
         """
         Converts the time by using a LocationId, a ISO-string and optionally a list
         of IDs to convert to.
 
+        Lists with more than `chunk_size` IDs to convert to are split into
+        several requests, which are sent concurrently and merged into a
+        single result.
+
         Parameters
         ----------
         from_id : LocationId
@@ -78,6 +132,12 @@ class ConvertTimeService(BaseService):
             ISO 8601-formatted string or TADDateTime object.
         to_ids : list of LocationId, optional
             The place IDs to convert to.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : ConvertTimeOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
         
         Returns
         -------
@@ -87,57 +147,105 @@ class ConvertTimeService(BaseService):
 
         """
 
+        return self.__convert(from_id, [time], to_ids, lambda converted: converted[0], self._get_options(options), get_expiry(deadline))
+
+    def convert_times(self, from_id: LocationId, times: List[Union[str, TADDateTime]], to_ids: List[LocationId] = None, deadline: float = None, options: ConvertTimeOptions = None) -> List[ConvertedTimes]:
+        """
+        Converts several points in time from one place, optionally to a list of
+        IDs.
+
+        Every distinct point in time is only requested once, and all requests
+        are sent concurrently.
+
+        Parameters
+        ----------
+        from_id : LocationId
+            The places identifier.
+        times : list of str or TADDateTime
+            ISO 8601-formatted strings or TADDateTime objects.
+        to_ids : list of LocationId, optional
+            The place IDs to convert to.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : ConvertTimeOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
+
+        Returns
+        -------
+        converted_times : list of ConvertedTimes
+            The converted times, in the order of `times`. Identical points in
+            time share the same result.
+
+        """
+
+        return self.__convert(from_id, times, to_ids, lambda converted: converted, self._get_options(options), get_expiry(deadline))
+
+    def __convert(self, from_id: LocationId, times: List[Union[str, TADDateTime]], to_ids: List[LocationId], select: Callable[[List[ConvertedTimes]], object], options: ConvertTimeOptions, expires: float) -> object:
         if (not isinstance(from_id, LocationId)
-                or not (isinstance(time, TADDateTime) or isinstance(time, str))
+                or not (isinstance(times, list) and all(isinstance(time, TADDateTime) or isinstance(time, str) for time in times))
                 or not (not to_ids or (isinstance(to_ids, list) and all(isinstance(to_id, LocationId) for to_id in to_ids)))):
             raise ValueError("An argument is invalid")
 
         from_id_str = str(from_id)
-        if isinstance(time, TADDateTime):
-            time_str = str(time)
+        time_strs: List[str] = [str(time) for time in times]
 
-        if not from_id_str or not time_str:
+        if not from_id_str or not time_strs or not all(time_strs):
             raise ValueError("An argument is invalid")
 
-        args: Dict[str, object] = self._authentication_options.copy()
-        args["fromid"] = from_id_str
-        args["iso"] = time_str
+        to_id_chunks: List[List[str]] = chunked([str(to_id) for to_id in to_ids], self.chunk_size) if to_ids else [[]]
+        distinct_times: List[str] = list(dict.fromkeys(time_strs))
+        requests: List[Dict[str, object]] = []
+
+        for time_str in distinct_times:
+            for chunk in to_id_chunks:
+                args: Dict[str, object] = self._authentication_options
+                args["fromid"] = from_id_str
+                args["iso"] = time_str
+
+                if chunk:
+                    args["toid"] = ",".join(chunk)
 
-        if to_ids:
-            args["toid"] = ",".join([str(to_id) for to_id in to_ids])
+                requests.append(self._apply_template(args, self.__get_optional_arguments, options))
 
-        return self.__retrieve_converted_times(args)
+        def collect(results: List[ConvertedTimes]) -> object:
+            per_time: int = len(to_id_chunks)
+            converted: Dict[str, ConvertedTimes] = {
+                time_str: self.__merge(results[i * per_time:(i + 1) * per_time])
+                for i, time_str in enumerate(distinct_times)
+            }
+            return select([converted[time_str] for time_str in time_strs])
 
-    def __retrieve_converted_times(self, args: Dict[str, object]) -> ConvertedTimes:
-        arguments: Dict[str, object] = self.__get_optional_arguments(args)
-        url: str = Constants.ENTRYPOINT + "/" + self._service_name + "?" + urlencode(arguments)
-        req = Request(
-                url,
-                headers = { "User-Agent": "libtad-py"}
-                )
+        return self._execute_all(requests, self.__from_xml, collect, self.max_workers, expires)
 
-        with urlopen(req, context=SSLContext()) as f:
-            result: str = f.read().decode("utf-8")
+    def __merge(self, results: List[ConvertedTimes]) -> ConvertedTimes:
+        if len(results) == 1:
+            return results[0]
 
-        return self.__from_xml(result)
+        # Every chunk repeats the location converted from as its first
+        # location. Results may be shared with a cache, so they are copied
+        # rather than extended in place.
+        merged: ConvertedTimes = copy.copy(results[0])
+        merged.locations = results[0].locations + [location for result in results[1:] for location in result.locations[1:]]
+        return merged
 
-    def __get_optional_arguments(self, args: Dict[str, object]) -> Dict[str, object]:
-        optional_args: Dict[str, str] = args
+    def __get_optional_arguments(self, options: ConvertTimeOptions) -> Dict[str, object]:
+        optional_args: Dict[str, object] = {}
 
-        optional_args["timechanges"] = int(self.include_time_changes)
-        optional_args["tz"] = int(self.include_timezone_information)
-        optional_args["lang"] = ",".join(self.language)
+        optional_args["timechanges"] = int(options.include_time_changes)
+        optional_args["tz"] = int(options.include_timezone_information)
+        optional_args["lang"] = ",".join(options.language)
         optional_args["out"] = Constants.DEFAULTRETURNFORMAT
         optional_args["verbosetime"] = str(Constants.DEFAULTVERBOSETIMEVALUE)
         optional_args["version"] = str(self._version)
 
-        if self.radius is not None:
-            optional_args["radius"] = str(self.radius)
+        if options.radius is not None:
+            optional_args["radius"] = str(options.radius)
 
         return optional_args
 
     def __from_xml(self, result: str) -> ConvertedTimes:
-        XmlUtils.check_for_errors(result)
-        xml: ET.Element = ET.fromstring(result)
-        return ConvertedTimes(xml.find("utc"), [location for location in xml.findall("location")])
+        xml: ET.Element = XmlUtils.parse(result)
+        return ConvertedTimes(xml.find("utc"), [location for location in xml.findall("location")], self.lazy_parsing)
 
@@ -1,10 +1,11 @@
 from libtad.datatypes.time import TADDateTime, TADTimeSpan
 from .moon_phase import MoonPhase
 from .astronomy_day_event import AstronomyDayEvent
+from libtad.common.lazy_element import LazyElement, LazyField
 import xml.etree.ElementTree as ET
 from typing import List
 
-class AstronomyDay:
+class AstronomyDay(LazyElement):
     """
     A class used for storing astronomy object information for a given day.
 
@@ -25,28 +26,35 @@ class AstronomyDay:
 
     """
 
-    def __init__(self, node: ET.Element):
-        self.date: TADDateTime = None
-        self.day_length: TADTimeSpan = None
-        self.moonphase: MoonPhase = MoonPhase.NotRequested
-        self.events: List[AstronomyDayEvent] = []
-
+    def __init__(self, node: ET.Element, lazy: bool = False):
+        """
+        Parameters
+        ----------
+        node : xml.etree.ElementTree.Element
+            The day element.
+        lazy : bool, optional
+            Whether to decode the attributes on first access.
+            Decodes all attributes at once by default.
+        """
+
+        super().__init__(node, lazy)
+
+    @LazyField
+    def date(self, node: ET.Element) -> TADDateTime:
         date = node.get("date")
-        day_length = node.get("daylength")
-        moonphase = node.get("moonphase")
-        events = node.findall("event")
-
-        if date:
-            self.date = TADDateTime._parse(date)
+        return TADDateTime._parse(date) if date else None
 
-        if day_length:
-            self.day_length = TADTimeSpan._parse(day_length)
-
-        if moonphase:
-            phase = MoonPhase._parse(moonphase)
-            if phase:
-                self.moonphase: MoonPhase = phase
+    @LazyField
+    def day_length(self, node: ET.Element) -> TADTimeSpan:
+        day_length = node.get("daylength")
+        return TADTimeSpan._parse(day_length) if day_length else None
 
-        if events:
-            self.events = [AstronomyDayEvent(event) for event in events]
+    @LazyField
+    def moonphase(self, node: ET.Element) -> MoonPhase:
+        moonphase = node.get("moonphase")
+        phase = MoonPhase._parse(moonphase) if moonphase else None
+        return phase if phase else MoonPhase.NotRequested
 
+    @LazyField
+    def events(self, node: ET.Element) -> List[AstronomyDayEvent]:
+        return [AstronomyDayEvent(event) for event in node.findall("event")]
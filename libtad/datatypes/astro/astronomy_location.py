@@ -2,6 +2,7 @@ from .astronomy_object_details import AstronomyObjectDetails
 from libtad.datatypes.places import Geo
 import xml.etree.ElementTree as ET
 from typing import List
+import copy
 
 class AstronomyLocation:
     """
@@ -19,7 +20,7 @@ class AstronomyLocation:
         Requested astronomical information.
     """
 
-    def __init__(self, node: ET.Element):
+    def __init__(self, node: ET.Element, lazy: bool = False):
         self.id: str = ""
         self.matchparam: str = ""
         self.geography: Geo = None
@@ -42,5 +43,25 @@ class AstronomyLocation:
         if astro is not None:
             for object_node in astro:
                 if object_node is not None:
-                    self.objects.append(AstronomyObjectDetails(object_node))
+                    self.objects.append(AstronomyObjectDetails(object_node, lazy))
 
+    @staticmethod
+    def _merge(results: List[List["AstronomyLocation"]], attribute: str) -> List["AstronomyLocation"]:
+        # Merges the results of requests split into several windows or
+        # batches. They share the location and object details, so the
+        # entries in `attribute` of the later results are appended to copies
+        # of the object details of the first one.
+        if len(results) == 1:
+            return results[0]
+
+        merged: List[AstronomyLocation] = []
+        for index, location in enumerate(results[0]):
+            location = copy.copy(location)
+            location.objects = [copy.copy(details) for details in location.objects]
+            for number, details in enumerate(location.objects):
+                entries = [entry for result in results if index < len(result) and number < len(result[index].objects)
+                           for entry in getattr(result[index].objects[number], attribute) or []]
+                setattr(details, attribute, entries or None)
+            merged.append(location)
+
+        return merged
@@ -30,7 +30,7 @@ class AstronomyObjectDetails:
 
     """
 
-    def __init__(self, node: ET.Element):
+    def __init__(self, node: ET.Element, lazy: bool = False):
         self.name: AstronomyObjectType = AstronomyObjectType(0)
         self.days: List[AstronomyDay] = None
         self.current: AstronomyCurrent = None
@@ -47,7 +47,7 @@ class AstronomyObjectDetails:
             raise MalformedXMLException(name)
         
         if days:
-            self.days = [AstronomyDay(day) for day in days]
+            self.days = [AstronomyDay(day, lazy) for day in days]
 
         if current is not None:
             self.current = AstronomyCurrent(current)
@@ -19,7 +19,7 @@ class ConvertedTimes:
         in the request.
     """
 
-    def __init__(self, node_utc: ET.Element, node_locations: List[ET.Element]):
+    def __init__(self, node_utc: ET.Element, node_locations: List[ET.Element], lazy: bool = False):
         self.utc: TADTime = None
         self.locations: List[Location] = []
 
@@ -29,5 +29,5 @@ class ConvertedTimes:
             self.utc = TADTime(time)
 
         if node_locations:
-            self.locations = [Location(loc) for loc in node_locations]
+            self.locations = [Location(loc, lazy) for loc in node_locations]
 
@@ -1,11 +1,12 @@
 from .holiday_state import HolidayState
 from libtad.datatypes.time import TADTime
 from libtad.datatypes.places import Country
+from libtad.common.lazy_element import LazyElement, LazyField
 import xml.etree.ElementTree as ET
 from urllib.parse import urlparse, ParseResult
 from typing import List, Dict
 
-class Holiday:
+class Holiday(LazyElement):
     '''
     A class used for holidays.
     
@@ -61,79 +62,82 @@ class Holiday:
         Example: National Holiday
     '''
 
-    def __init__(self, node: ET.Element):
-        self.id: int = -1
-        self.uid: str = ""
-        self.urlid: str = ""
-        self.name: Dict[str] = {}
-        self.date: TADTime = None
-        self.url: ParseResult = None
-        self.country: Country = None
-        self.locations: str = ""
-        self.states: List[HolidayState] = []
-        self.oneliner: Dict[str] = {}
-        self.types: List[str] = []
-
-        ID = node.get("id")       
-        url = node.get("url")
-        urlid = node.get("urlid")
-        name = node.find("name")
-        locations = node.find("locations")
+    def __init__(self, node: ET.Element, lazy: bool = False):
+        """
+        Parameters
+        ----------
+        node : xml.etree.ElementTree.Element
+            The holiday element.
+        lazy : bool, optional
+            Whether to decode the attributes on first access.
+            Decodes all attributes at once by default.
+        """
+
+        super().__init__(node, lazy)
+
+    @LazyField
+    def id(self, node: ET.Element) -> int:
+        ID = node.get("id")
+        return int(ID) if ID else -1
+
+    @LazyField
+    def uid(self, node: ET.Element) -> str:
         uid = node.find("uid")
-        country = node.find("country")
-        oneliner = node.find("oneliner")
-        types = node.find("types")
-        states = node.find("states")
+        if uid is not None:
+            return uid.text
+        return node.get("uid") or ""
+
+    @LazyField
+    def urlid(self, node: ET.Element) -> str:
+        return node.get("urlid") or ""
+
+    @LazyField
+    def name(self, node: ET.Element) -> Dict[str, str]:
+        return self.__get_texts(node.find("name"))
+
+    @LazyField
+    def date(self, node: ET.Element) -> TADTime:
         date = node.find("date")
+        return TADTime(date) if date is not None else None
+
+    @LazyField
+    def url(self, node: ET.Element) -> ParseResult:
+        url = node.get("url")
+        return urlparse(url) if url else None
 
-        if ID:
-            self.id = int(ID)
+    @LazyField
+    def country(self, node: ET.Element) -> Country:
+        country = node.find("country")
+        return Country(country) if country is not None else None
 
-        if url:
-            self.url = urlparse(url)
+    @LazyField
+    def locations(self, node: ET.Element) -> str:
+        locations = node.find("locations")
+        return locations.text if locations is not None else ""
 
-        if urlid:
-            self.urlid = urlid
+    @LazyField
+    def states(self, node: ET.Element) -> List[HolidayState]:
+        states = node.find("states")
+        return [HolidayState(s) for s in states] if states is not None else []
 
-        if uid is not None:
-            self.uid = uid.text
-        else:
-            uid = node.get("uid")
-            if uid:
-                self.uid = uid
-
-        if country is not None:
-            self.country = Country(country)
-
-        if oneliner is not None:
-            for oneliner_node in oneliner:
-                if oneliner_node is None:
-                    continue
-                oneliner_lang = oneliner_node.get("lang")
-                oneliner_text = oneliner_node.text
-                if oneliner_lang is not None and oneliner_text is not None:
-                    self.oneliner[oneliner_lang] = oneliner_text
-
-        if date is not None:
-            self.date = TADTime(date)
-
-        if name is not None:
-            for name_node in name:
-                if name_node is None:
-                    continue
-                name_lang = name_node.get("lang")
-                name_text = name_node.text
-                if name_lang is not None and name_text is not None:
-                    self.name[name_lang] = name_text
-
-        if locations is not None:
-            self.locations = locations.text
-
-        if types is not None:
-            for t in types:
-                self.types.append(t.text)
-
-        if states is not None:
-            for s in states:
-                self.states.append(HolidayState(s))
+    @LazyField
+    def oneliner(self, node: ET.Element) -> Dict[str, str]:
+        return self.__get_texts(node.find("oneliner"))
 
+    @LazyField
+    def types(self, node: ET.Element) -> List[str]:
+        types = node.find("types")
+        return [t.text for t in types] if types is not None else []
+
+    @staticmethod
+    def __get_texts(node: ET.Element) -> Dict[str, str]:
+        texts: Dict[str, str] = {}
+        if node is None:
+            return texts
+
+        for text_node in node:
+            lang = text_node.get("lang")
+            text = text_node.text
+            if lang is not None and text is not None:
+                texts[lang] = text
+        return texts
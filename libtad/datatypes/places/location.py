@@ -1,10 +1,11 @@
 from .geo import Geo
 from libtad.datatypes.astro import Astronomy
 from libtad.datatypes.time import TimeChange, TADTime
+from libtad.common.lazy_element import LazyElement, LazyField
 import xml.etree.ElementTree as ET
 from typing import List
 
-class Location:
+class Location(LazyElement):
     """
     An object containing data for location.
 
@@ -26,31 +27,39 @@ class Location:
         Only for the timeservice and if requested.
     """
 
-    def __init__(self, node: ET.Element):
-        self.id: str = None
-        self.geography: Geo = None
-        self.time: TADTime = None
-        self.time_changes: List[TimeChange] = []
-        self.astronomy: List[Astronomy] = []
+    def __init__(self, node: ET.Element, lazy: bool = False):
+        """
+        Parameters
+        ----------
+        node : xml.etree.ElementTree.Element
+            The location element.
+        lazy : bool, optional
+            Whether to decode the attributes on first access.
+            Decodes all attributes at once by default.
+        """
 
-        ID = node.get("id")
-        geo = node.find("geo")
-        time = node.find("time")
-        timechanges = node.find("timechanges")
-        astronomy = node.find("astronomy")
-
-        if ID:
-            self.id = ID
+        super().__init__(node, lazy)
 
-        if geo is not None:
-            self.geography = Geo(geo)
+    @LazyField
+    def id(self, node: ET.Element) -> str:
+        return node.get("id") or None
 
-        if time is not None:
-            self.time = TADTime(time)
+    @LazyField
+    def geography(self, node: ET.Element) -> Geo:
+        geo = node.find("geo")
+        return Geo(geo) if geo is not None else None
 
-        if timechanges is not None:
-            self.time_changes = [TimeChange(change) for change in timechanges.findall("change")]
+    @LazyField
+    def time(self, node: ET.Element) -> TADTime:
+        time = node.find("time")
+        return TADTime(time) if time is not None else None
 
-        if astronomy is not None:
-            self.astronomy = [Astronomy(obj) for obj in astronomy.findall("object")]
+    @LazyField
+    def time_changes(self, node: ET.Element) -> List[TimeChange]:
+        timechanges = node.find("timechanges")
+        return [TimeChange(change) for change in timechanges.findall("change")] if timechanges is not None else []
 
+    @LazyField
+    def astronomy(self, node: ET.Element) -> List[Astronomy]:
+        astronomy = node.find("astronomy")
+        return [Astronomy(obj) for obj in astronomy.findall("object")] if astronomy is not None else []
@@ -1,12 +1,37 @@
 from libtad.base_service import BaseService
 from libtad.datatypes.dst import DST
 import libtad.constants as Constants
-from libtad.common import XmlUtils
-from typing import List, Dict
+from libtad.common import XmlUtils, Transport, get_expiry
+from typing import List, Dict, Iterator, NamedTuple, Tuple
 import xml.etree.ElementTree as ET
-from urllib.parse import urlencode
-from urllib.request import urlopen, Request
-from ssl import SSLContext
+
+class DSTOptions(NamedTuple):
+    """
+    Immutable options of DSTService, which can be passed to a single call.
+
+    Options that are not given take their default values. The options of a
+    service can be changed for a single call with e.g.
+    ``service.options._replace(include_time_changes=True)``.
+
+    ...
+
+    Attributes
+    ----------
+    language : tuple of str
+        Languages of the returned texts.
+    include_time_changes : bool
+        Add a list of time changes during the year to the dstentry object.
+    include_only_dst_countries : bool
+        Return only countries which actually observe DST. Not applied when a
+        year is queried.
+    include_places_for_every_country : bool
+        List the individual places that belong to each record.
+    """
+
+    language: Tuple[str, ...] = (Constants.DEFAULTLANGUAGE,)
+    include_time_changes: bool = False
+    include_only_dst_countries: bool = True
+    include_places_for_every_country: bool = True
 
 class DSTService(BaseService):
     """
@@ -51,13 +76,22 @@ class DSTService(BaseService):
         Example:
         ``service.language.append("de")``
 
+    options : DSTOptions
+        The attributes above as immutable options, which calls use unless
+        options are passed to them. Assigning options sets the attributes.
+
     Methods
     -------
-    get_daylight_saving_time(country_code=None, year=None)
+    get_daylight_saving_time(country_code=None, year=None, deadline=None, options=None)
         Gets the daylight saving time by country and year.
+    iter_daylight_saving_time(country_code=None, year=None, deadline=None, options=None)
+        Streams the daylight saving time by country and year while the
+        response is being read.
     """
 
-    def __init__(self, access_key: str, secret_key: str):
+    _options_type: type = DSTOptions
+
+    def __init__(self, access_key: str, secret_key: str, transport: Transport = None, options: DSTOptions = None):
         """
         Parameters
         ----------
@@ -65,14 +99,23 @@ class DSTService(BaseService):
             Access key.
         secret_key : str
             Secret key.
+        transport : Transport, optional
+            Transport used to send requests to the API.
+            Uses pooled keep-alive connections by default.
+        options : DSTOptions, optional
+            Options to set the attributes from.
+            Uses the default values by default.
         """
 
-        super().__init__(access_key, secret_key, "dstlist")
+        super().__init__(access_key, secret_key, "dstlist", transport)
         self.include_time_changes: bool = False
         self.include_only_dst_countries: bool = True
         self.include_places_for_every_country: bool = True
 
-    def get_daylight_saving_time(self, country_code: str = None, year: int = None) -> List[DST]:
+        if options is not None:
+            self.options = options
+
+    def get_daylight_saving_time(self, country_code: str = None, year: int = None, deadline: float = None, options: DSTOptions = None) -> List[DST]:
         """
         Gets the daylight saving time by country and year.
 
@@ -87,6 +130,12 @@ class DSTService(BaseService):
         year : int, optional
             Year.
             Uses the current year by default.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : DSTOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
 
         Returns
         -------
@@ -95,6 +144,48 @@ class DSTService(BaseService):
 
         """
 
+        args: Dict[str, object] = self.__get_query_arguments(country_code, year, self._get_options(options))
+        return self.__retrieve_dst_list(args, get_expiry(deadline))
+
+    def iter_daylight_saving_time(self, country_code: str = None, year: int = None, deadline: float = None, options: DSTOptions = None) -> Iterator[DST]:
+        """
+        Streams the daylight saving time by country and year while the
+        response is being read.
+
+        Every DST entry is yielded as soon as it has been parsed and is then
+        discarded from the parsed document, so the worldwide list including
+        places and time changes can be processed with bounded memory.
+
+        If `country_code` is unspecified, information for all countries will be
+        returned. If `year` is unspecified, current year is used.
+
+        Parameters
+        ----------
+        country_code : str, optional
+            ISO3166-1-alpha-2 Country Code.
+            Uses all countries by default.
+        year : int, optional
+            Year.
+            Uses the current year by default.
+        deadline : float, optional
+            Number of seconds the call may take in total, including waiting for
+            the rate limit and reading the whole response. Streamed requests
+            are not retried, since entries may already have been yielded.
+        options : DSTOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
+
+        Returns
+        -------
+        dst_list : iterator of DST
+            The DST information for each country or region.
+
+        """
+
+        args: Dict[str, object] = self.__get_query_arguments(country_code, year, self._get_options(options))
+        return self._stream(args, "dstentry", DST, get_expiry(deadline))
+
+    def __get_query_arguments(self, country_code: str, year: int, options: DSTOptions) -> Dict[str, object]:
         args: Dict[str, object] = {}
         
         if country_code and type(country_code) is str:
@@ -103,37 +194,29 @@ class DSTService(BaseService):
             if year <= 0:
                 raise ValueError("An argument is invalid")
             args["year"] = str(year)
-            self.include_only_dst_countries = False
-
-        return self.__retrieve_dst_list(args)
+            # Countries not observing DST are listed for a queried year,
+            # without changing the options of the service.
+            options = options._replace(include_only_dst_countries=False)
 
-    def __retrieve_dst_list(self, args: Dict[str, object]) -> List[DST]:
-        args.update(self.__get_arguments())
-        url: str = Constants.ENTRYPOINT + "/" + self._service_name + "?" + urlencode(args)
-        req = Request(
-                url,
-                headers = { "User-Agent": "libtad-py"}
-                )
+        args.update(self._authentication_options)
+        return self._apply_template(args, self.__get_optional_arguments, options)
 
-        with urlopen(req, context=SSLContext()) as f:
-            result: str = f.read().decode("utf-8")
+    def __retrieve_dst_list(self, args: Dict[str, object], expires: float) -> List[DST]:
+        return self._execute(args, self.__from_xml, expires)
 
-        return self.__from_xml(result)
-
-    def __get_arguments(self) -> Dict[str, object]:
-        args: Dict[str, object] = self._authentication_options.copy()
-        args["lang"] = ",".join(self.language)
+    def __get_optional_arguments(self, options: DSTOptions) -> Dict[str, object]:
+        args: Dict[str, object] = {}
+        args["lang"] = ",".join(options.language)
         args["out"] = Constants.DEFAULTRETURNFORMAT
         args["verbosetime"] = str(Constants.DEFAULTVERBOSETIMEVALUE)
         args["version"] = str(self._version)
-        args["timechanges"] = int(self.include_time_changes)
-        args["onlydst"] = int(self.include_only_dst_countries)
-        args["listplaces"] = int(self.include_places_for_every_country)
+        args["timechanges"] = int(options.include_time_changes)
+        args["onlydst"] = int(options.include_only_dst_countries)
+        args["listplaces"] = int(options.include_places_for_every_country)
         return args
 
     def __from_xml(self, result: str) -> List[DST]:
-        XmlUtils.check_for_errors(result)
-        xml: ET.Element = ET.fromstring(result)
+        xml: ET.Element = XmlUtils.parse(result)
         dstlist: ET.Element = xml.find("dstlist")
         return [DST(dstentry) for dstentry in dstlist.findall("dstentry")]
 
@@ -1,15 +1,34 @@
 from libtad.base_service import BaseService
 from libtad.datatypes.holidays import HolidayType, Holiday
-from libtad.common import XmlUtils
+from libtad.common import XmlUtils, Transport, get_expiry
 import libtad.constants as Constants
 import xml.etree.ElementTree as ET
-from urllib.parse import ParseResult, urlunparse, urlencode
-from urllib.request import urlopen, Request
-from ssl import SSLContext
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterator, List, NamedTuple, Tuple
 
 
+class HolidaysOptions(NamedTuple):
+    """
+    Immutable options of HolidaysService, which can be passed to a single
+    call.
+
+    Options that are not given take their default values. The options of a
+    service can be changed for a single call with e.g.
+    ``service.options._replace(types=HolidayType.Local)``.
+
+    ...
+
+    Attributes
+    ----------
+    language : tuple of str
+        Languages of the returned texts.
+    types : HolidayType
+        Holiday types to include.
+    """
+
+    language: Tuple[str, ...] = (Constants.DEFAULTLANGUAGE,)
+    types: HolidayType = HolidayType(0)
+
 class HolidaysService(BaseService):
     """
     The holidays service can be used to retrieve the list of holidays for a country.
@@ -39,14 +58,27 @@ class HolidaysService(BaseService):
 
         Example:
         ``service.language.append("de")``
+    max_workers : int
+        Maximum number of requests sent at the same time when fetching
+        holidays for several countries.
+    options : HolidaysOptions
+        The attributes above as immutable options, which calls use unless
+        options are passed to them. Assigning options sets the attributes.
 
     Methods
     -------
-    holidays_for_country(country_code, year=datetime.now().year)
+    holidays_for_country(country_code, year=datetime.now().year, deadline=None, options=None)
         The holidays service can be used to retrieve the list of holidays for a country.
+    holidays_for_countries(queries, deadline=None, options=None)
+        Retrieves the holidays for several countries and years concurrently.
+    iter_holidays_for_countries(queries, deadline=None, options=None)
+        Retrieves the holidays for several countries and years concurrently,
+        yielding each list as soon as it has been received.
     """
 
-    def __init__(self, access_key: str, secret_key: str):
+    _options_type: type = HolidaysOptions
+
+    def __init__(self, access_key: str, secret_key: str, transport: Transport = None, options: HolidaysOptions = None):
         """
         Parameters
         ----------
@@ -54,29 +86,46 @@ class HolidaysService(BaseService):
             Access key.
         secret_key : str
             Secret key.
+        transport : Transport, optional
+            Transport used to send requests to the API.
+            Uses pooled keep-alive connections by default.
+        options : HolidaysOptions, optional
+            Options to set the attributes from.
+            Uses the default values by default.
         """
 
-        super().__init__(access_key, secret_key, "holidays")
+        super().__init__(access_key, secret_key, "holidays", transport)
         self.types: HolidayType = HolidayType(0)
+        self.max_workers: int = 8
 
-    def __get_holiday_types(self) -> str:
+        if options is not None:
+            self.options = options
+
+    def __get_holiday_types(self, options: HolidaysOptions) -> str:
         included_strings: List[str] = []
         for hol_item in HolidayType:
-            if self.types & hol_item:
+            if options.types & hol_item:
                 included_strings.append(HolidayType.resolve(hol_item)[1])
         included: str = ",".join(included_strings)
         return included
 
     def __from_xml(self, result: str) -> List[Holiday]:
-        XmlUtils.check_for_errors(result)
-        xml: ET.Element = ET.fromstring(result)
-        return [Holiday(hol_node) for hol_node in xml.find("holidays")]
+        xml: ET.Element = XmlUtils.parse(result)
+        return [Holiday(hol_node, self.lazy_parsing) for hol_node in xml.find("holidays")]
 
-    def __get_arguments(self, country_code: str, year: int) -> Dict[str, str]:
-        args: Dict[str, object] = self._authentication_options.copy()
-        types: str = self.__get_holiday_types()
+    def __get_arguments(self, country_code: str, year: int, options: HolidaysOptions) -> Dict[str, str]:
+        args: Dict[str, object] = self._authentication_options
         args["country"] = country_code
-        args["lang"] = ",".join(self.language)
+
+        if year > 0:
+            args["year"] = str(year)
+
+        return self._apply_template(args, self.__get_optional_arguments, options)
+
+    def __get_optional_arguments(self, options: HolidaysOptions) -> Dict[str, object]:
+        args: Dict[str, object] = {}
+        types: str = self.__get_holiday_types(options)
+        args["lang"] = ",".join(options.language)
         args["version"] = str(self._version)
         args["verbosetime"] = str(Constants.DEFAULTVERBOSETIMEVALUE)
         args["out"] = Constants.DEFAULTRETURNFORMAT
@@ -84,25 +133,13 @@ class HolidaysService(BaseService):
         if types:
             args["types"] = types
 
-        if year > 0:
-            args["year"] = str(year)
-
         return args
 
-    def __retrieve_holidays(self, country_code: str, year: int) -> List[Holiday]:
-        arguments: Dict[str, str] = self.__get_arguments(country_code, year)
-        url: str = Constants.ENTRYPOINT + "/" + self._service_name + "?" + urlencode(arguments)
-        req = Request(
-                url,
-                headers = { "User-Agent": "libtad-py"}
-                )
+    def __retrieve_holidays(self, country_code: str, year: int, options: HolidaysOptions, expires: float) -> List[Holiday]:
+        arguments: Dict[str, str] = self.__get_arguments(country_code, year, options)
+        return self._execute(arguments, self.__from_xml, expires)
 
-        with urlopen(req, context=SSLContext()) as f:
-            result: str = f.read().decode("utf-8")
-
-        return self.__from_xml(result)
-
-    def holidays_for_country(self, country_code: str, year: int = datetime.now().year) -> List[Holiday]:
+    def holidays_for_country(self, country_code: str, year: int = datetime.now().year, deadline: float = None, options: HolidaysOptions = None) -> List[Holiday]:
         """
         The holidays service can be used to retrieve the list of holidays for a country.
         If the argument `year` is not passed in, the current year is used.
@@ -115,6 +152,12 @@ class HolidaysService(BaseService):
         year : int, optional
             The year for which the holidays should be retrieved.            
             Uses the current year by default.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : HolidaysOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
 
         Returns
         -------
@@ -123,7 +166,73 @@ class HolidaysService(BaseService):
 
         """
 
+        options = self._get_options(options)
         if not country_code or year <= 0:
             raise ValueError("An argument is invalid")
-        return self.__retrieve_holidays(country_code, year)
+        return self.__retrieve_holidays(country_code, year, options, get_expiry(deadline))
+
+    def holidays_for_countries(self, queries: List[Tuple[str, int]], deadline: float = None, options: HolidaysOptions = None) -> Dict[Tuple[str, int], List[Holiday]]:
+        """
+        Retrieves the holidays for several countries and years concurrently.
+
+        At most `max_workers` requests are sent at the same time.
+
+        Parameters
+        ----------
+        queries : list of tuple of str and int
+            Pairs of ISO3166-1-alpha-2 Country Code and year.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : HolidaysOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
+
+        Returns
+        -------
+        holidays : dict of list of Holiday
+            Lists of holidays by (country code, year) pair.
+
+        """
+
+        options = self._get_options(options)
+        queries = self.__validate_queries(queries)
+        arguments: List[Dict[str, str]] = [self.__get_arguments(country_code, year, options) for country_code, year in queries]
+        return self._execute_all(arguments, self.__from_xml, lambda results: dict(zip(queries, results)), self.max_workers, get_expiry(deadline))
+
+    def iter_holidays_for_countries(self, queries: List[Tuple[str, int]], deadline: float = None, options: HolidaysOptions = None) -> Iterator[Tuple[Tuple[str, int], List[Holiday]]]:
+        """
+        Retrieves the holidays for several countries and years concurrently,
+        yielding each list as soon as it has been received.
+
+        At most `max_workers` requests are sent at the same time.
+
+        Parameters
+        ----------
+        queries : list of tuple of str and int
+            Pairs of ISO3166-1-alpha-2 Country Code and year.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : HolidaysOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
+
+        Returns
+        -------
+        holidays : iterator of tuple
+            Pairs of the (country code, year) query and its list of holidays,
+            in order of completion.
+
+        """
+
+        options = self._get_options(options)
+        queries = self.__validate_queries(queries)
+        arguments: List[Dict[str, str]] = [self.__get_arguments(country_code, year, options) for country_code, year in queries]
+        return self._execute_iter(queries, arguments, self.__from_xml, self.max_workers, expires=get_expiry(deadline))
 
+    def __validate_queries(self, queries: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
+        queries = list(dict.fromkeys((country_code, year) for country_code, year in queries))
+        if any(not country_code or year <= 0 for country_code, year in queries):
+            raise ValueError("An argument is invalid")
+        return queries
@@ -1,14 +1,33 @@
 from libtad.base_service import BaseService
 from libtad.datatypes.places import Place
-from libtad.common import XmlUtils
+from libtad.common import XmlUtils, Transport, get_expiry
 import libtad.constants as Constants
 import xml.etree.ElementTree as ET
-from urllib.parse import ParseResult, urlunparse, urlencode
-from urllib.request import urlopen, Request
-from ssl import SSLContext
-from typing import List, Dict
+from typing import List, Dict, Iterator, NamedTuple, Tuple
 
 
+class PlacesOptions(NamedTuple):
+    """
+    Immutable options of PlacesService, which can be passed to a single
+    call.
+
+    Options that are not given take their default values. The options of a
+    service can be changed for a single call with e.g.
+    ``service.options._replace(include_coordinates=False)``.
+
+    ...
+
+    Attributes
+    ----------
+    language : tuple of str
+        Languages of the returned texts.
+    include_coordinates : bool
+        Return coordinates for the Geography object.
+    """
+
+    language: Tuple[str, ...] = (Constants.DEFAULTLANGUAGE,)
+    include_coordinates: bool = True
+
 class PlacesService(BaseService):
     """
     The places service can be used to retrieve the list of supported places. 
@@ -19,14 +38,21 @@ class PlacesService(BaseService):
     ----------
     include_coordinates : bool
         Return coordinates for the Geography object.
+    options : PlacesOptions
+        The attributes above as immutable options, which calls use unless
+        options are passed to them. Assigning options sets the attributes.
 
     Methods
     -------
-    get_places()
+    get_places(deadline=None, options=None)
         Gets list of supported places.
+    iter_places(deadline=None, options=None)
+        Streams the supported places while the response is being read.
     """
 
-    def __init__(self, access_key: str, secret_key: str):
+    _options_type: type = PlacesOptions
+
+    def __init__(self, access_key: str, secret_key: str, transport: Transport = None, options: PlacesOptions = None):
         """
         Parameters
         ----------
@@ -34,15 +60,33 @@ class PlacesService(BaseService):
             Access key.
         secret_key : str
             Secret key.
+        transport : Transport, optional
+            Transport used to send requests to the API.
+            Uses pooled keep-alive connections by default.
+        options : PlacesOptions, optional
+            Options to set the attributes from.
+            Uses the default values by default.
         """
 
-        super().__init__(access_key, secret_key, "places")
+        super().__init__(access_key, secret_key, "places", transport)
         self.include_coordinates: bool = True
 
-    def get_places(self) -> List[Place]:
+        if options is not None:
+            self.options = options
+
+    def get_places(self, deadline: float = None, options: PlacesOptions = None) -> List[Place]:
         """
         Gets list of supported places.
 
+        Parameters
+        ----------
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : PlacesOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
+
         Returns
         -------
         places : list of Place
@@ -51,23 +95,45 @@ class PlacesService(BaseService):
 
         """
 
-        args = self.__get_arguments()
-        url: str = Constants.ENTRYPOINT + "/" + self._service_name + "?" + urlencode(args)
-        req = Request(
-                url,
-                headers = { "User-Agent": "libtad-py"}
-                )
+        args = self.__get_arguments(self._get_options(options))
+        return self._execute(args, self.__from_xml, get_expiry(deadline))
+
+    def iter_places(self, deadline: float = None, options: PlacesOptions = None) -> Iterator[Place]:
+        """
+        Streams the supported places while the response is being read.
+
+        The response is parsed incrementally and every place is discarded
+        from the parsed document once it has been yielded, so memory use
+        stays flat regardless of the size of the catalog.
+
+        Parameters
+        ----------
+        deadline : float, optional
+            Number of seconds the call may take in total, including waiting for
+            the rate limit and reading the whole response. Streamed requests
+            are not retried, since entries may already have been yielded.
+        options : PlacesOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
 
-        with urlopen(req, context=SSLContext()) as f:
-            result: str = f.read().decode("utf-8")
+        Returns
+        -------
+        places : iterator of Place
+            All currently known places, their identifiers and their 
+            geographical location (if requested).
+
+        """
 
-        return self.__from_xml(result)
+        args = self.__get_arguments(self._get_options(options))
+        return self._stream(args, "place", Place, get_expiry(deadline))
 
+    def __get_arguments(self, options: PlacesOptions) -> Dict[str, object]:
+        return self._apply_template(self._authentication_options, self.__get_optional_arguments, options)
 
-    def __get_arguments(self) -> Dict[str, object]:
-        args: Dict[str, object] = self._authentication_options.copy()
-        args["lang"] = ",".join(self.language)
-        args["geo"] = int(self.include_coordinates)
+    def __get_optional_arguments(self, options: PlacesOptions) -> Dict[str, object]:
+        args: Dict[str, object] = {}
+        args["lang"] = ",".join(options.language)
+        args["geo"] = int(options.include_coordinates)
         args["version"] = str(self._version)
         args["out"] = Constants.DEFAULTRETURNFORMAT
         args["verbosetime"] = str(Constants.DEFAULTVERBOSETIMEVALUE)
@@ -75,8 +141,7 @@ class PlacesService(BaseService):
         return args
 
     def __from_xml(self, result: str) -> List[Place]:
-        XmlUtils.check_for_errors(result)
-        xml: ET.Element = ET.fromstring(result)
+        xml: ET.Element = XmlUtils.parse(result)
         places = xml.find("places")
         return [Place(place_node) for place_node in places.findall("place")]
 
@@ -1,12 +1,46 @@
 from libtad.base_service import BaseService
 from libtad.datatypes.places import LocationId, Location
-from libtad.common import XmlUtils
+from libtad.common import XmlUtils, Transport, chunked, get_expiry
 import libtad.constants as Constants
-from typing import List, Dict, Union
-from urllib.parse import urlencode
-from urllib.request import urlopen, Request
-from ssl import SSLContext
+from typing import List, Dict, NamedTuple, Tuple, Union
 import xml.etree.ElementTree as ET
+from itertools import chain
+
+class TimeOptions(NamedTuple):
+    """
+    Immutable options of TimeService, which can be passed to a single call.
+
+    Options that are not given take their default values. The options of a
+    service can be changed for a single call with e.g.
+    ``service.options._replace(radius=50)``.
+
+    ...
+
+    Attributes
+    ----------
+    language : tuple of str
+        Languages of the returned texts.
+    radius : int
+        Search radius in kilometers for translating coordinates to locations.
+    include_coordinates : bool
+        Return coordinates for the Geography object.
+    include_sunrise_and_sunset : bool
+        Add the astronomy element with sunrise and sunset.
+    include_current_time_to_location : bool
+        Add the current time under the location object.
+    include_list_of_time_changes : bool
+        Add a list of time changes during the year to the location object.
+    include_timezone_information : bool
+        Add timezone information under the time object.
+    """
+
+    language: Tuple[str, ...] = (Constants.DEFAULTLANGUAGE,)
+    radius: int = None
+    include_coordinates: bool = True
+    include_sunrise_and_sunset: bool = True
+    include_current_time_to_location: bool = True
+    include_list_of_time_changes: bool = True
+    include_timezone_information: bool = True
 
 class TimeService(BaseService):
     """
@@ -37,14 +71,24 @@ class TimeService(BaseService):
         listing e.g. shows changes caused by daylight savings time.
     include_timezone_information : bool
         Add timezone information under the time object.
+    chunk_size : int
+        Maximum number of places queried in a single request. Longer lists
+        of places are split into chunks which are fetched concurrently.
+    max_workers : int
+        Maximum number of chunks fetched at the same time.
+    options : TimeOptions
+        The attributes above as immutable options, which calls use unless
+        options are passed to them. Assigning options sets the attributes.
 
     Methods
     -------
-    current_time_for_place(place_id)
+    current_time_for_place(place_id, deadline=None, options=None)
         Retrieves the current time for place by ID.
     """
 
-    def __init__(self, access_key: str, secret_key: str):
+    _options_type: type = TimeOptions
+
+    def __init__(self, access_key: str, secret_key: str, transport: Transport = None, options: TimeOptions = None):
         """
         Parameters
         ----------
@@ -52,24 +96,45 @@ class TimeService(BaseService):
             Access key.
         secret_key : str
             Secret key.
+        transport : Transport, optional
+            Transport used to send requests to the API.
+            Uses pooled keep-alive connections by default.
+        options : TimeOptions, optional
+            Options to set the attributes from.
+            Uses the default values by default.
         """
 
-        super().__init__(access_key, secret_key, "timeservice")
+        super().__init__(access_key, secret_key, "timeservice", transport)
         self.radius: int = None
         self.include_coordinates: bool = True
         self.include_sunrise_and_sunset: bool = True
         self.include_current_time_to_location: bool = True
         self.include_list_of_time_changes: bool = True
         self.include_timezone_information: bool = True
+        self.chunk_size: int = 100
+        self.max_workers: int = 8
+
+        if options is not None:
+            self.options = options
 
-    def current_time_for_place(self, place_id: Union[LocationId, List[LocationId]]) -> List[Location]:
+    def current_time_for_place(self, place_id: Union[LocationId, List[LocationId]], deadline: float = None, options: TimeOptions = None) -> List[Location]:
         """
         Retrieves the current time for place by ID.
 
+        Lists with more than `chunk_size` places are split into several
+        requests, which are sent concurrently. The locations are returned
+        in the order of `place_id` regardless.
+
         Parameters
         ----------
         place_id : LocationId or list of LocationId
             Place identifier.
+        deadline : float, optional
+            Number of seconds the call may take in total, including retries
+            and waiting for the rate limit.
+        options : TimeOptions, optional
+            Options of the call.
+            Uses the attributes of the service by default.
 
         Returns
         -------
@@ -78,51 +143,55 @@ class TimeService(BaseService):
 
         """
 
-        place_id_str = ""
+        options = self._get_options(options)
+        place_id_strs: List[str] = []
         if isinstance(place_id, LocationId):
-            place_id_str = str(place_id)
+            place_id_strs = [str(place_id)]
         elif isinstance(place_id, list) and all(isinstance(pid, LocationId) for pid in place_id):
-            place_id_str = ",".join([str(pid) for pid in place_id])
+            place_id_strs = [str(pid) for pid in place_id]
 
-        if not place_id_str:
+        if not "".join(place_id_strs):
             raise ValueError("An argument is invalid")
 
-        args: Dict[str, object] = self._authentication_options.copy()
-        args["placeid"] = place_id_str
+        if len(place_id_strs) > self.chunk_size:
+            chunks: List[Dict[str, object]] = []
+            for chunk in chunked(place_id_strs, self.chunk_size):
+                args: Dict[str, object] = self._authentication_options
+                args["placeid"] = ",".join(chunk)
+                chunks.append(self._apply_template(args, self.__get_optional_arguments, options))
 
-        return self.__retrieve_current_time(args)
+            return self._execute_all(chunks, self.__from_xml, self.__merge, self.max_workers, get_expiry(deadline))
 
-    def __retrieve_current_time(self, args: Dict[str, object]) -> List[Location]:
-        arguments: Dict[str, object] = self.__get_optional_arguments(args)
-        url: str = Constants.ENTRYPOINT + "/" + self._service_name + "?" + urlencode(arguments)
-        req = Request(
-                url,
-                headers = { "User-Agent": "libtad-py"}
-                )
+        args: Dict[str, object] = self._authentication_options
+        args["placeid"] = ",".join(place_id_strs)
 
-        with urlopen(req, context=SSLContext()) as f:
-            result: str = f.read().decode("utf-8")
+        return self.__retrieve_current_time(args, options, get_expiry(deadline))
 
-        return self.__from_xml(result)
+    def __retrieve_current_time(self, args: Dict[str, object], options: TimeOptions, expires: float) -> List[Location]:
+        arguments: Dict[str, object] = self._apply_template(args, self.__get_optional_arguments, options)
+        return self._execute(arguments, self.__from_xml, expires)
 
-    def __get_optional_arguments(self, args: Dict[str, object]) -> Dict[str, object]:
-        args["geo"] = int(self.include_coordinates)
-        args["lang"] = ",".join(self.language)
-        args["sun"] = int(self.include_sunrise_and_sunset)
-        args["time"] = int(self.include_current_time_to_location)
-        args["timechanges"] = int(self.include_list_of_time_changes)
-        args["tz"] = int(self.include_timezone_information)
+    def __get_optional_arguments(self, options: TimeOptions) -> Dict[str, object]:
+        args: Dict[str, object] = {}
+        args["geo"] = int(options.include_coordinates)
+        args["lang"] = ",".join(options.language)
+        args["sun"] = int(options.include_sunrise_and_sunset)
+        args["time"] = int(options.include_current_time_to_location)
+        args["timechanges"] = int(options.include_list_of_time_changes)
+        args["tz"] = int(options.include_timezone_information)
         args["out"] = Constants.DEFAULTRETURNFORMAT
         args["verbosetime"] = str(Constants.DEFAULTVERBOSETIMEVALUE)
         args["version"] = str(self._version)
 
-        if self.radius is not None:
-            args["radius"] = self.radius
+        if options.radius is not None:
+            args["radius"] = options.radius
 
         return args
     
+    def __merge(self, results: List[List[Location]]) -> List[Location]:
+        return list(chain.from_iterable(results))
+
     def __from_xml(self, result: str) -> List[Location]:
-        XmlUtils.check_for_errors(result)
-        xml: ET.Element = ET.fromstring(result)
-        return [Location(loc) for loc in xml.findall("location")]
+        xml: ET.Element = XmlUtils.parse(result)
+        return [Location(loc, self.lazy_parsing) for loc in xml.findall("location")]
 
@@ -0,0 +1,45 @@
+from libtad import AsyncTimeService, AsyncHolidaysService, AsyncPlacesService
+from libtad.common import AsyncFakeTransport, AsyncPooledTransport
+from libtad.common.exceptions import ServerSideException
+from libtad.datatypes.places import LocationId
+import asyncio
+import time
+import unittest
+
+class TestAsyncServices(unittest.TestCase):
+    def test_default_transport(self):
+        service = AsyncTimeService("accessKey", "secretKey")
+        self.assertIsInstance(service.transport, AsyncPooledTransport)
+
+    def test_current_time_for_place(self):
+        service = AsyncTimeService("accessKey", "secretKey", AsyncFakeTransport())
+        result = asyncio.run(service.current_time_for_place([LocationId(1), LocationId(2)]))
+        self.assertEqual([location.id for location in result], ["1", "2"])
+
+    def test_concurrency(self):
+        transport = AsyncFakeTransport(latency=0.2)
+        service = AsyncHolidaysService("accessKey", "secretKey", transport)
+
+        async def fetch_all():
+            return await asyncio.gather(*[service.holidays_for_country("us", year) for year in range(2000, 2100)])
+
+        start = time.monotonic()
+        result = asyncio.run(fetch_all())
+
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(len(result), 100)
+        self.assertEqual(len(transport.requests), 100)
+
+    def test_errors(self):
+        transport = AsyncFakeTransport({"places": '<data version="3"><error>Access denied</error></data>'})
+        service = AsyncPlacesService("accessKey", "secretKey", transport)
+
+        with self.assertRaises(ServerSideException):
+            asyncio.run(service.get_places())
+
+        with self.assertRaises(ValueError):
+            AsyncTimeService("accessKey", "secretKey", transport).current_time_for_place([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+from libtad import HolidaysService
+from libtad.authentication import Authentication
+from libtad.common import FakeTransport
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+import base64
+import hashlib
+import hmac
+import time
+import unittest
+
+class TestAuthentication(unittest.TestCase):
+    def test_signature(self):
+        auth = Authentication("holidays", "accessKey", "secretKey")
+        args = auth.get_authentication_args({"country": "no"})
+
+        message = "accessKey" + "holidays" + args["timestamp"]
+        expected = base64.b64encode(hmac.new(b"secretKey", message.encode("utf8"), hashlib.sha1).digest())
+        self.assertEqual(args["signature"], expected)
+        self.assertEqual(args["accesskey"], "accessKey")
+        self.assertEqual(args["country"], "no")
+
+    def test_reuse(self):
+        auth = Authentication("holidays", "accessKey", "secretKey")
+        first = auth.get_authentication_args()
+        second = auth.get_authentication_args()
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_max_age(self):
+        auth = Authentication("holidays", "accessKey", "secretKey", max_age=0.05)
+        first = auth.get_authentication_args()
+        time.sleep(0.1)
+        self.assertNotEqual(auth.get_authentication_args()["timestamp"], first["timestamp"])
+
+        auth.max_age = 60
+        second = auth.get_authentication_args()
+        auth.refresh()
+        self.assertNotEqual(auth.get_authentication_args()["timestamp"], second["timestamp"])
+
+    def test_threads(self):
+        auth = Authentication("holidays", "accessKey", "secretKey")
+        with ThreadPoolExecutor(8) as executor:
+            timestamps = set(executor.map(lambda _: auth.get_authentication_args()["timestamp"], range(100)))
+
+        self.assertEqual(len(timestamps), 1)
+
+    def test_service(self):
+        transport = FakeTransport()
+        service = HolidaysService("accessKey", "secretKey", transport)
+        service.authentication.max_age = 0.05
+        service.holidays_for_country("no", 2021)
+        time.sleep(0.1)
+        service.holidays_for_country("no", 2022)
+
+        timestamps = [parse_qs(urlsplit(url).query)["timestamp"][0] for url in transport.requests]
+        self.assertEqual(len(timestamps), 2)
+        self.assertNotEqual(timestamps[0], timestamps[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
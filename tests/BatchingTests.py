@@ -0,0 +1,199 @@
+from libtad import TimeService, AsyncTimeService, ConvertTimeService, AsyncConvertTimeService, HolidaysService, AsyncHolidaysService, \
+    AstronomyService, AsyncAstronomyService, AstrodataService, AsyncAstrodataService
+from libtad.common import FakeTransport, AsyncFakeTransport, chunked
+from libtad.datatypes.astro import AstronomyObjectType
+from libtad.common.exceptions import QueriedDateOutOfRangeException
+from libtad.datatypes.places import LocationId
+from libtad.datatypes.time import TADDateTime
+from urllib.parse import urlsplit, parse_qs
+import asyncio
+import time
+import unittest
+
+def query(url):
+    return {name: values[0] for name, values in parse_qs(urlsplit(url).query).items()}
+
+class TestBatching(unittest.TestCase):
+    def test_chunked(self):
+        self.assertEqual(chunked([1, 2, 3, 4, 5], 2), [[1, 2], [3, 4], [5]])
+        with self.assertRaises(ValueError):
+            chunked([1], 0)
+
+    def test_current_time_for_place(self):
+        transport = FakeTransport(latency=0.1)
+        service = TimeService("accessKey", "secretKey", transport)
+        service.chunk_size = 50
+        place_ids = [LocationId(lid) for lid in range(1, 1001)]
+
+        start = time.monotonic()
+        result = service.current_time_for_place(place_ids)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual([location.id for location in result], [str(lid) for lid in range(1, 1001)])
+        self.assertEqual(len(transport.requests), 20)
+        self.assertTrue(all(len(query(url)["placeid"].split(",")) == 50 for url in transport.requests))
+
+    def test_current_time_for_place_single_request(self):
+        transport = FakeTransport()
+        service = TimeService("accessKey", "secretKey", transport)
+        service.current_time_for_place([LocationId(lid) for lid in range(1, 101)])
+
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_async_current_time_for_place(self):
+        transport = AsyncFakeTransport()
+        service = AsyncTimeService("accessKey", "secretKey", transport)
+        service.chunk_size = 10
+        result = asyncio.run(service.current_time_for_place([LocationId(lid) for lid in range(1, 96)]))
+
+        self.assertEqual([location.id for location in result], [str(lid) for lid in range(1, 96)])
+        self.assertEqual(len(transport.requests), 10)
+
+    def test_convert_time(self):
+        transport = FakeTransport()
+        service = ConvertTimeService("accessKey", "secretKey", transport)
+        service.chunk_size = 30
+        result = service.convert_time(LocationId(187), TADDateTime(2021, 6, 1, 12), [LocationId(lid) for lid in range(1, 101)])
+
+        self.assertEqual(result.utc.iso, "2021-06-01T12:00:00+01:00")
+        self.assertEqual([location.id for location in result.locations], ["187"] + [str(lid) for lid in range(1, 101)])
+        self.assertEqual(len(transport.requests), 4)
+
+    def test_convert_time_iso_string(self):
+        service = ConvertTimeService("accessKey", "secretKey", FakeTransport())
+        result = service.convert_time(LocationId(187), "2021-06-01T12:00:00")
+        self.assertEqual([location.id for location in result.locations], ["187"])
+
+    def test_convert_times(self):
+        transport = FakeTransport()
+        service = ConvertTimeService("accessKey", "secretKey", transport)
+        service.chunk_size = 2
+        times = [TADDateTime(2021, 1, 1), TADDateTime(2021, 6, 1), "2021-01-01T00:00:00"]
+        result = service.convert_times(LocationId(187), times, [LocationId(1), LocationId(2), LocationId(3)])
+
+        self.assertEqual(len(result), 3)
+        self.assertIs(result[0], result[2])
+        self.assertEqual(result[1].utc.iso, "2021-06-01T00:00:00+01:00")
+        self.assertEqual([location.id for location in result[1].locations], ["187", "1", "2", "3"])
+        self.assertEqual(len(transport.requests), 4)
+
+    def test_async_convert_times(self):
+        service = AsyncConvertTimeService("accessKey", "secretKey", AsyncFakeTransport())
+        service.chunk_size = 1
+        result = asyncio.run(service.convert_times(LocationId(187), [TADDateTime(2021, 1, 1)] * 3, [LocationId(1), LocationId(2)]))
+
+        self.assertEqual([location.id for location in result[2].locations], ["187", "1", "2"])
+
+    def test_holidays_for_countries(self):
+        transport = FakeTransport(latency=0.1)
+        service = HolidaysService("accessKey", "secretKey", transport)
+        service.max_workers = 50
+        queries = [(country, year) for country in ("us", "no", "de", "gb", "fr") for year in range(2010, 2030)]
+
+        start = time.monotonic()
+        result = service.holidays_for_countries(queries)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(list(result), queries)
+        self.assertEqual(result[("no", 2015)][0].country.id, "no")
+        self.assertEqual(result[("no", 2015)][0].date.datetime.year, 2015)
+        self.assertEqual(len(transport.requests), 100)
+
+    def test_iter_holidays_for_countries(self):
+        service = HolidaysService("accessKey", "secretKey", FakeTransport())
+        queries = [("us", 2020), ("no", 2021), ("us", 2020)]
+        result = dict(service.iter_holidays_for_countries(queries))
+
+        self.assertEqual(set(result), {("us", 2020), ("no", 2021)})
+        self.assertEqual(result[("no", 2021)][0].country.id, "no")
+
+        with self.assertRaises(ValueError):
+            service.holidays_for_countries([("us", 0)])
+
+    def test_async_iter_holidays_for_countries(self):
+        service = AsyncHolidaysService("accessKey", "secretKey", AsyncFakeTransport())
+
+        async def collect():
+            mapping = await service.holidays_for_countries([("us", 2020), ("no", 2021)])
+            streamed = {query: holidays async for query, holidays in service.iter_holidays_for_countries([("us", 2020), ("no", 2021)])}
+            return mapping, streamed
+
+        mapping, streamed = asyncio.run(collect())
+        self.assertEqual(set(mapping), set(streamed))
+
+
+    def test_astronomical_info(self):
+        transport = FakeTransport(latency=0.1)
+        service = AstronomyService("accessKey", "secretKey", transport)
+        service.window_days = 31
+        result = service.get_astronomical_info(AstronomyObjectType.Sun, LocationId("norway/oslo"), TADDateTime(2021, 1, 1), TADDateTime(2021, 12, 31))
+
+        days = result[0].objects[0].days
+        self.assertEqual(len(result), 1)
+        self.assertEqual(len(days), 365)
+        self.assertEqual([str(day.date) for day in days[:2]], ["2021-01-01T00:00:00", "2021-01-02T00:00:00"])
+        self.assertEqual(str(days[-1].date), "2021-12-31T00:00:00")
+        self.assertEqual(len(transport.requests), 12)
+        self.assertEqual(sorted(query(url)["startdt"][:10] for url in transport.requests)[:2], ["2021-01-01", "2021-02-01"])
+
+    def test_astronomical_info_single_request(self):
+        transport = FakeTransport()
+        service = AstronomyService("accessKey", "secretKey", transport)
+        service.get_astronomical_info(AstronomyObjectType.Sun, LocationId("norway/oslo"), TADDateTime(2021, 1, 1), TADDateTime(2021, 12, 31))
+
+        self.assertEqual(len(transport.requests), 1)
+        with self.assertRaises(QueriedDateOutOfRangeException):
+            service.get_astronomical_info(AstronomyObjectType.Sun, LocationId("norway/oslo"), TADDateTime(2021, 2, 1), TADDateTime(2021, 1, 1))
+
+    def test_iter_astronomical_info(self):
+        service = AstronomyService("accessKey", "secretKey", FakeTransport())
+        service.window_days = 10
+        windows = list(service.iter_astronomical_info(AstronomyObjectType.Moon, LocationId("norway/oslo"), TADDateTime(2021, 1, 1), TADDateTime(2021, 1, 25)))
+
+        self.assertEqual([(str(start)[:10], str(end)[:10]) for (start, end), _ in windows],
+                         [("2021-01-01", "2021-01-10"), ("2021-01-11", "2021-01-20"), ("2021-01-21", "2021-01-25")])
+        self.assertEqual([len(locations[0].objects[0].days) for _, locations in windows], [10, 10, 5])
+
+    def test_async_astronomical_info(self):
+        transport = AsyncFakeTransport()
+        service = AsyncAstronomyService("accessKey", "secretKey", transport)
+        service.window_days = 7
+        result = asyncio.run(service.get_astronomical_info(AstronomyObjectType.Sun, LocationId("norway/oslo"), TADDateTime(2021, 3, 1), TADDateTime(2021, 3, 31)))
+
+        self.assertEqual([day.date.day for day in result[0].objects[0].days], list(range(1, 32)))
+        self.assertEqual(len(transport.requests), 5)
+
+    def test_astrodata(self):
+        transport = FakeTransport(latency=0.1)
+        service = AstrodataService("accessKey", "secretKey", transport)
+        interval = [TADDateTime(2021, 6, 1 + minute // 1440, minute // 60 % 24, minute % 60) for minute in range(0, 10000, 10)]
+
+        start = time.monotonic()
+        result = service.get_astrodata(AstronomyObjectType.Sun, LocationId("norway/oslo"), interval)
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual([str(current.utctime.date_time) for current in result[0].objects[0].result], [str(i) for i in interval])
+        self.assertEqual(len(transport.requests), 10)
+        self.assertTrue(all(len(query(url)["interval"].split(",")) == 100 for url in transport.requests))
+
+    def test_iter_astrodata(self):
+        service = AstrodataService("accessKey", "secretKey", FakeTransport())
+        service.chunk_size = 4
+        interval = [TADDateTime(2021, 6, 1, hour) for hour in range(10)]
+        batches = list(service.iter_astrodata(AstronomyObjectType.Moon, LocationId("norway/oslo"), interval))
+
+        self.assertEqual([batch for batch, _ in batches], [interval[0:4], interval[4:8], interval[8:10]])
+        self.assertEqual([len(locations[0].objects[0].result) for _, locations in batches], [4, 4, 2])
+
+    def test_async_astrodata(self):
+        transport = AsyncFakeTransport()
+        service = AsyncAstrodataService("accessKey", "secretKey", transport)
+        service.chunk_size = 5
+        interval = [TADDateTime(2021, 6, 1, hour) for hour in range(24)]
+        result = asyncio.run(service.get_astrodata(AstronomyObjectType.Sun, LocationId("norway/oslo"), interval))
+
+        self.assertEqual(len(result[0].objects[0].result), 24)
+        self.assertEqual(len(transport.requests), 5)
+
+if __name__ == "__main__":
+    unittest.main()
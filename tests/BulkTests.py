@@ -0,0 +1,91 @@
+from libtad import HolidaysService
+from libtad.common import FakeTransport, RateLimiter, run_many
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import unittest
+
+class TestBulk(unittest.TestCase):
+    def test_ordered(self):
+        service = HolidaysService("accessKey", "secretKey", FakeTransport(latency=0.05))
+        queries = [("no", year) for year in range(2000, 2040)]
+
+        start = time.monotonic()
+        results = list(run_many(service.holidays_for_country, queries, max_workers=20, ordered=True))
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual([result.index for result in results], list(range(40)))
+        self.assertEqual([result.arguments for result in results], queries)
+        self.assertTrue(all(result.ok and len(result.result) == 10 for result in results))
+
+    def test_as_completed(self):
+        delays = {1: 0.2, 2: 0.0, 3: 0.1}
+        results = list(run_many(lambda n: time.sleep(delays[n]) or n, [1, 2, 3], max_workers=3))
+
+        self.assertEqual([result.result for result in results], [2, 3, 1])
+
+    def test_arguments(self):
+        results = list(run_many(lambda a, b=0: a + b, [(1, 2), {"a": 3, "b": 4}, 5], ordered=True))
+        self.assertEqual([result.result for result in results], [3, 7, 5])
+
+    def test_errors(self):
+        service = HolidaysService("accessKey", "secretKey", FakeTransport())
+        results = list(run_many(service.holidays_for_country, [("no", 2021), (None, 2021), ("us", 2021)], ordered=True))
+
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertIsInstance(results[1].exception, ValueError)
+        self.assertIsNone(results[1].result)
+
+    def test_progress(self):
+        calls = []
+        list(run_many(lambda n: n, range(5), progress=lambda done, total: calls.append((done, total))))
+        self.assertEqual(calls, [(done, 5) for done in range(1, 6)])
+
+        calls.clear()
+        list(run_many(lambda n: n, (n for n in range(3)), progress=lambda done, total: calls.append((done, total))))
+        self.assertEqual(calls, [(1, None), (2, None), (3, None)])
+
+    def test_max_workers(self):
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def call(n):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        list(run_many(call, range(30), max_workers=3))
+        self.assertEqual(running[1], 3)
+        with self.assertRaises(ValueError):
+            run_many(call, range(3), max_workers=0)
+
+    def test_lazy(self):
+        read = []
+
+        def arguments():
+            for n in range(100):
+                read.append(n)
+                yield n
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = run_many(lambda n: n, arguments(), max_workers=2, executor=executor)
+            next(results)
+            results.close()
+
+        self.assertLessEqual(len(read), 3)
+
+    def test_rate_limit(self):
+        service = HolidaysService("accessKey", "secretKey", FakeTransport())
+        service.rate_limiter = RateLimiter(rate=20, burst=1)
+
+        start = time.monotonic()
+        results = list(run_many(service.holidays_for_country, [("no", year) for year in range(2000, 2010)], max_workers=10))
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.4)
+        self.assertTrue(all(result.ok for result in results))
+
+if __name__ == "__main__":
+    unittest.main()
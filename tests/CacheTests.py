@@ -0,0 +1,198 @@
+from libtad import HolidaysService, AsyncHolidaysService, TimeService, AsyncTimeService, DSTService
+from libtad.common import FakeTransport, AsyncFakeTransport, ResponseCache, SQLiteCache, Cache, RefreshSchedule
+from libtad.datatypes.places import LocationId
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+class TestResponseCache(unittest.TestCase):
+    def test_make_key(self):
+        key = Cache.make_key("holidays", {"signature": "abc", "year": "2021", "accesskey": "key", "country": "us", "timestamp": "now"})
+        self.assertEqual(key, "holidays?country=us&year=2021")
+
+    def test_hits(self):
+        transport = FakeTransport()
+        service = HolidaysService("accessKey", "secretKey", transport)
+        service.cache = ResponseCache()
+
+        first = service.holidays_for_country("us", 2021)
+        second = service.holidays_for_country("us", 2021)
+        other = service.holidays_for_country("no", 2021)
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(len(transport.requests), 2)
+        self.assertEqual((service.cache.hits, service.cache.misses), (1, 2))
+
+    def test_shared_between_instances(self):
+        transport = FakeTransport()
+        cache = ResponseCache()
+        for _ in range(3):
+            service = TimeService("accessKey", "secretKey", transport)
+            service.cache = cache
+            service.current_time_for_place(LocationId(187))
+
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_ttl(self):
+        cache = ResponseCache(ttl=60, ttls={"timeservice": 0.05})
+        cache.set("timeservice", "timeservice?placeid=1", "time")
+        cache.set("holidays", "holidays?country=us", "holidays")
+        time.sleep(0.1)
+
+        self.assertIsNone(cache.get("timeservice", "timeservice?placeid=1"))
+        self.assertEqual(cache.get("holidays", "holidays?country=us"), "holidays")
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_size=2)
+        cache.set("places", "a", 1)
+        cache.set("places", "b", 2)
+        cache.get("places", "a")
+        cache.set("places", "c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertIsNone(cache.get("places", "b"))
+        self.assertEqual(cache.get("places", "a"), 1)
+
+    def test_async(self):
+        transport = AsyncFakeTransport()
+        service = AsyncHolidaysService("accessKey", "secretKey", transport)
+        service.cache = ResponseCache()
+
+        async def fetch_twice():
+            await service.holidays_for_country("us", 2021)
+            return await service.holidays_for_country("us", 2021)
+
+        asyncio.run(fetch_twice())
+        self.assertEqual(len(transport.requests), 1)
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    def test_serve_stale(self):
+        transport = FakeTransport(latency=0.2)
+        service = TimeService("accessKey", "secretKey", transport)
+        service.cache = ResponseCache(ttl=0.01, stale_while_revalidate=60)
+        first = service.current_time_for_place(LocationId(187))
+        time.sleep(0.02)
+
+        start = time.monotonic()
+        for _ in range(5):
+            self.assertIs(service.current_time_for_place(LocationId(187)), first)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        time.sleep(0.3)
+        self.assertEqual(len(transport.requests), 2)
+        self.assertIsNot(service.current_time_for_place(LocationId(187)), first)
+
+    def test_too_stale(self):
+        transport = FakeTransport()
+        service = TimeService("accessKey", "secretKey", transport)
+        service.cache = ResponseCache(ttl=0.01, stale_while_revalidate=0.01)
+        first = service.current_time_for_place(LocationId(187))
+        time.sleep(0.05)
+
+        self.assertIsNot(service.current_time_for_place(LocationId(187)), first)
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_async(self):
+        transport = AsyncFakeTransport(latency=0.05)
+        service = AsyncTimeService("accessKey", "secretKey", transport)
+        service.cache = ResponseCache(ttl=0.01, stale_while_revalidate=60)
+
+        async def run():
+            first = await service.current_time_for_place(LocationId(187))
+            await asyncio.sleep(0.02)
+            self.assertIs(await service.current_time_for_place(LocationId(187)), first)
+            await asyncio.sleep(0.1)
+            self.assertIsNot(await service.current_time_for_place(LocationId(187)), first)
+
+        asyncio.run(run())
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_refresh_schedule(self):
+        transport = FakeTransport()
+        service = DSTService("accessKey", "secretKey", transport)
+        service.cache = ResponseCache(ttl=60)
+        schedule = RefreshSchedule(interval=0.05)
+        schedule.add(lambda: service.get_daylight_saving_time("no", 2021))
+
+        schedule.start()
+        time.sleep(0.12)
+        schedule.stop()
+
+        refreshes = len(transport.requests)
+        self.assertGreaterEqual(refreshes, 2)
+        service.get_daylight_saving_time("no", 2021)
+        self.assertEqual(len(transport.requests), refreshes)
+        self.assertEqual(schedule.failures, 0)
+
+class TestSQLiteCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "libtad.sqlite")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_persistence(self):
+        transport = FakeTransport()
+        service = HolidaysService("accessKey", "secretKey", transport)
+        service.cache = SQLiteCache(self.path)
+        first = service.holidays_for_country("us", 2020)
+
+        # A new cache instance on the same file stands in for a restarted
+        # process.
+        service.cache = SQLiteCache(self.path)
+        second = service.holidays_for_country("us", 2020)
+
+        self.assertEqual(len(transport.requests), 1)
+        self.assertEqual([holiday.uid for holiday in first], [holiday.uid for holiday in second])
+        self.assertEqual((service.cache.hits, service.cache.misses), (1, 0))
+
+    def test_ttl(self):
+        cache = SQLiteCache(self.path, ttl=60, ttls={"dstlist": -1})
+        cache.set("dstlist", "dstlist?year=2021", "<data/>")
+        cache.set("places", "places?geo=1", "<data/>")
+
+        self.assertIsNone(cache.get("dstlist", "dstlist?year=2021"))
+        self.assertEqual(cache.get("places", "places?geo=1"), "<data/>")
+
+        cache.purge()
+        cache.clear()
+        self.assertIsNone(cache.get("places", "places?geo=1"))
+
+    def test_fork(self):
+        cache = SQLiteCache(self.path)
+        self.assertIsNone(getattr(cache._SQLiteCache__local, "connection", None))
+
+        cache.set("places", "places?geo=1", "<data/>")
+        parent = cache._SQLiteCache__local.connection
+        if not hasattr(os, "fork"):
+            self.skipTest("fork is not available")
+
+        pid = os.fork()
+        if pid == 0:
+            ok = cache.get("places", "places?geo=1") == "<data/>" and cache._SQLiteCache__local.connection is not parent
+            cache.set("places", "places?geo=0", "<child/>")
+            os._exit(0 if ok else 1)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(status, 0)
+        self.assertIs(cache._SQLiteCache__local.connection, parent)
+        self.assertEqual(cache.get("places", "places?geo=0"), "<child/>")
+
+    def test_counters(self):
+        cache = SQLiteCache(self.path)
+        cache.set("places", "places?geo=1", "<data/>")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda n: cache.get("places", f"places?geo={n % 2}"), range(400)))
+
+        self.assertEqual((cache.hits, cache.misses), (200, 200))
+
+
+if __name__ == "__main__":
+    unittest.main()
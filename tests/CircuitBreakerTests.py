@@ -0,0 +1,169 @@
+from libtad import HolidaysService, AsyncHolidaysService
+from libtad.common import CircuitBreaker, ResponseCache, SQLiteCache, FakeTransport, AsyncFakeTransport
+from libtad.common.exceptions import CircuitOpenException, DeadlineExceededException
+from urllib.error import HTTPError
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+class Outage:
+    def __init__(self):
+        self.down = False
+
+    def __call__(self, query):
+        if self.down:
+            raise ConnectionResetError()
+        return '<?xml version="1.0" encoding="UTF-8"?><data version="3"><holidays/></data>'
+
+def service(outage, breaker, cache=None, transport=FakeTransport, cls=HolidaysService):
+    service = cls("accessKey", "secretKey", transport(responses={"holidays": outage}))
+    service.retry_policy = None
+    service.circuit_breaker = breaker
+    service.cache = cache
+    return service
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_on_failure_rate(self):
+        breaker = CircuitBreaker(failure_rate=0.5, minimum_requests=4)
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record_success(0.01)
+        breaker.before_request()
+        breaker.record_failure(0.01)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+        breaker.before_request()
+        breaker.record_failure(0.01)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenException):
+            breaker.before_request()
+
+    def test_opens_on_latency(self):
+        breaker = CircuitBreaker(minimum_requests=2, slow_call_duration=0.5)
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record_success(1.0)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_client_errors(self):
+        breaker = CircuitBreaker(minimum_requests=2)
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record_failure(0.01, HTTPError("https://api.xmltime.com", 404, "Not Found", None, None))
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_deadlines(self):
+        breaker = CircuitBreaker(minimum_requests=4)
+        slow = HolidaysService("accessKey", "secretKey", FakeTransport(latency=0.2))
+        slow.retry_policy = None
+        slow.circuit_breaker = breaker
+
+        for _ in range(4):
+            with self.assertRaises(DeadlineExceededException):
+                slow.holidays_for_country("no", 2021, deadline=0.01)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+        breaker = CircuitBreaker(minimum_requests=2, slow_call_duration=0.1, reset_timeout=0.05)
+        for _ in range(2):
+            breaker.before_request()
+            breaker.record_failure(0.2, DeadlineExceededException())
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        time.sleep(0.06)
+        breaker.before_request()
+        breaker.record_failure(0.01, asyncio.CancelledError())
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        breaker.before_request()
+        breaker.record_success(0.01)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_outcomes_before_opening(self):
+        breaker = CircuitBreaker(minimum_requests=2, reset_timeout=0.05)
+        slow = breaker.before_request()
+        for _ in range(2):
+            breaker.record_failure(0.01, ticket=breaker.before_request())
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        time.sleep(0.06)
+        probe = breaker.before_request()
+        breaker.record_success(0.01, slow)
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(CircuitOpenException):
+            breaker.before_request()
+
+        breaker.record_success(0.01, probe)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.record_failure(0.01, ticket=probe)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_half_open(self):
+        breaker = CircuitBreaker(minimum_requests=1, reset_timeout=0.05)
+        breaker.before_request()
+        breaker.record_failure(0.01)
+        time.sleep(0.06)
+
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        breaker.before_request()
+        with self.assertRaises(CircuitOpenException):
+            breaker.before_request()
+        breaker.record_failure(0.01)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+        time.sleep(0.06)
+        breaker.before_request()
+        breaker.record_success(0.01)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_fail_fast(self):
+        outage = Outage()
+        outage.down = True
+        holidays = service(outage, CircuitBreaker(minimum_requests=3))
+        for _ in range(3):
+            with self.assertRaises(ConnectionResetError):
+                holidays.holidays_for_country("us", 2021)
+
+        with self.assertRaises(CircuitOpenException):
+            holidays.holidays_for_country("us", 2021)
+        self.assertEqual(len(holidays.transport.requests), 3)
+
+    def test_serve_stale(self):
+        outage = Outage()
+        holidays = service(outage, CircuitBreaker(minimum_requests=1), ResponseCache(ttl=0.01))
+        cached = holidays.holidays_for_country("us", 2021)
+        time.sleep(0.02)
+
+        outage.down = True
+        with self.assertRaises(ConnectionResetError):
+            holidays.holidays_for_country("us", 2021)
+        self.assertIs(holidays.holidays_for_country("us", 2021), cached)
+        with self.assertRaises(CircuitOpenException):
+            holidays.holidays_for_country("us", 2020)
+
+    def test_serve_stale_sqlite(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        outage = Outage()
+        holidays = service(outage, CircuitBreaker(minimum_requests=1), SQLiteCache(os.path.join(directory.name, "cache.db"), ttl=-1))
+        holidays.holidays_for_country("us", 2021)
+
+        outage.down = True
+        with self.assertRaises(ConnectionResetError):
+            holidays.holidays_for_country("us", 2021)
+        self.assertEqual(holidays.holidays_for_country("us", 2021), [])
+
+    def test_async(self):
+        outage = Outage()
+        outage.down = True
+        holidays = service(outage, CircuitBreaker(minimum_requests=1), transport=AsyncFakeTransport, cls=AsyncHolidaysService)
+        with self.assertRaises(ConnectionResetError):
+            asyncio.run(holidays.holidays_for_country("us", 2021))
+        with self.assertRaises(CircuitOpenException):
+            asyncio.run(holidays.holidays_for_country("us", 2021))
+
+    def test_shared(self):
+        self.assertIs(CircuitBreaker.shared(), CircuitBreaker.shared())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+from libtad.common import ConnectionPool, AsyncConnectionPool
+from libtad.common.exceptions import DeadlineExceededException
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+import asyncio
+import socket
+import threading
+import time
+import unittest
+import zlib
+
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith("/slow"):
+            time.sleep(0.5)
+        body = self.path.encode("utf-8")
+        if self.path.startswith("/large"):
+            body *= 10000
+        if self.path.startswith("/accept"):
+            body = (self.headers.get("Accept-Encoding") or "").encode("utf-8")
+        self.send_response(500 if self.path.startswith("/error") else 200)
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+            body = compressor.compress(body) + compressor.flush()
+            self.send_header("Content-Encoding", "gzip")
+        elif "deflate" in (self.headers.get("Accept-Encoding") or ""):
+            # Raw deflate, as sent by some servers.
+            compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+            body = compressor.compress(body) + compressor.flush()
+            self.send_header("Content-Encoding", "deflate")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except ConnectionError:
+            # The client gave up on a slow response.
+            pass
+
+    def log_message(self, *args):
+        pass
+
+class TestConnectionPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_connection_reuse(self):
+        pool = ConnectionPool()
+        self.assertEqual(pool.get(self.url + "/first"), b"/first")
+        with pool.open(self.url + "/second") as response:
+            connection = response._PooledResponse__connection
+            self.assertEqual(response.read(), b"/second")
+
+        with pool.open(self.url + "/third") as response:
+            self.assertIs(response._PooledResponse__connection, connection)
+            self.assertEqual(response.read(), b"/third")
+
+        pool.clear()
+
+    def test_idle_timeout(self):
+        pool = ConnectionPool(idle_timeout=0)
+        with pool.open(self.url + "/first") as response:
+            connection = response._PooledResponse__connection
+            response.read()
+
+        with pool.open(self.url + "/second") as response:
+            self.assertIsNot(response._PooledResponse__connection, connection)
+            response.read()
+
+        pool.clear()
+
+    def test_max_size(self):
+        pool = ConnectionPool(max_size=1)
+        first = pool.open(self.url + "/first")
+        second = pool.open(self.url + "/second")
+        first.read()
+        second.read()
+        first.close()
+        second.close()
+
+        self.assertEqual(len(pool._ConnectionPool__idle[("http", "127.0.0.1", self.server.server_port)]), 1)
+        pool.clear()
+
+    def test_http_error(self):
+        pool = ConnectionPool()
+        with self.assertRaises(HTTPError) as context:
+            pool.get(self.url + "/error")
+
+        self.assertEqual(context.exception.code, 500)
+        context.exception.close()
+
+    def test_read_timeout(self):
+        pool = ConnectionPool(read_timeout=0.1)
+        with self.assertRaises(socket.timeout):
+            pool.get(self.url + "/slow")
+        pool.clear()
+
+    def test_deadline(self):
+        pool = ConnectionPool()
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededException):
+            pool.get(self.url + "/slow", timeout=0.1)
+
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertEqual(pool.get(self.url + "/fast", timeout=1.0), b"/fast")
+        pool.clear()
+
+    def test_async_timeouts(self):
+        async def run():
+            pool = AsyncConnectionPool(read_timeout=0.1)
+            with self.assertRaises(socket.timeout):
+                await pool.get(self.url + "/slow")
+            pool.read_timeout = None
+            with self.assertRaises(DeadlineExceededException):
+                await pool.get(self.url + "/slow", timeout=0.1)
+            self.assertEqual(await pool.get(self.url + "/fast", timeout=1.0), b"/fast")
+            pool.clear()
+
+        asyncio.run(run())
+
+    def test_compression(self):
+        pool = ConnectionPool()
+        self.assertEqual(pool.get(self.url + "/accept"), b"gzip, deflate")
+        with pool.open(self.url + "/large") as response:
+            self.assertEqual(response.headers["Content-Encoding"], "gzip")
+            self.assertLess(int(response.headers["Content-Length"]), 1000)
+            chunks = list(iter(lambda: response.read(64), b""))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), b"/large" * 10000)
+        self.assertEqual(pool.get(self.url + "/deflate", {"Accept-Encoding": "deflate"}), b"/deflate")
+
+        pool.compress = False
+        self.assertNotIn(b"gzip", pool.get(self.url + "/accept"))
+        pool.clear()
+
+    def test_async_compression(self):
+        async def run():
+            pool = AsyncConnectionPool()
+            self.assertEqual(await pool.get(self.url + "/large"), b"/large" * 10000)
+            self.assertEqual(await pool.get(self.url + "/deflate", {"Accept-Encoding": "deflate"}), b"/deflate")
+            pool.compress = False
+            self.assertNotIn(b"gzip", await pool.get(self.url + "/accept"))
+            pool.clear()
+
+        asyncio.run(run())
+
+    def test_async_closed_loops(self):
+        pool = AsyncConnectionPool()
+        loops = []
+
+        async def run():
+            loops.append(asyncio.get_running_loop())
+            self.assertEqual(await pool.get(self.url + "/first"), b"/first")
+
+        for _ in range(3):
+            asyncio.run(run())
+
+        self.assertEqual(list(pool._AsyncConnectionPool__loops), loops[-1:])
+        pool.clear()
+
+    def test_shared(self):
+        self.assertIs(ConnectionPool.shared(), ConnectionPool.shared())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+from libtad import HolidaysService, AsyncHolidaysService, PlacesService
+from libtad.common import FakeTransport, AsyncFakeTransport, RateLimiter
+from libtad.common.exceptions import DeadlineExceededException
+import asyncio
+import time
+import unittest
+
+class TestDeadline(unittest.TestCase):
+    def test_deadline(self):
+        transport = FakeTransport(latency=0.5)
+        service = HolidaysService("accessKey", "secretKey", transport)
+
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededException):
+            service.holidays_for_country("us", 2021, deadline=0.1)
+
+        self.assertLess(time.monotonic() - start, 0.3)
+        self.assertEqual(len(transport.requests), 0)
+
+    def test_deadline_met(self):
+        service = HolidaysService("accessKey", "secretKey", FakeTransport(latency=0.05))
+        self.assertEqual(len(service.holidays_for_country("us", 2021, deadline=1.0)), 10)
+
+    def test_batch_deadline(self):
+        service = HolidaysService("accessKey", "secretKey", FakeTransport(latency=0.1))
+        service.max_workers = 1
+        queries = [("us", year) for year in range(2000, 2010)]
+
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededException):
+            service.holidays_for_countries(queries, deadline=0.25)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_stream_deadline(self):
+        service = PlacesService("accessKey", "secretKey", FakeTransport(latency=0.5))
+        with self.assertRaises(DeadlineExceededException):
+            list(service.iter_places(deadline=0.1))
+
+    def test_rate_limit_deadline(self):
+        service = HolidaysService("accessKey", "secretKey", FakeTransport())
+        service.rate_limiter = RateLimiter(rate=1, burst=1)
+        service.holidays_for_country("us", 2020)
+
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededException):
+            service.holidays_for_country("us", 2021, deadline=0.1)
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_async_deadline(self):
+        service = AsyncHolidaysService("accessKey", "secretKey", AsyncFakeTransport(latency=0.5))
+
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededException):
+            asyncio.run(service.holidays_for_country("us", 2021, deadline=0.1))
+        self.assertLess(time.monotonic() - start, 0.3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+from libtad import HolidaysService, TimeService, AstronomyService, ConvertTimeService
+from libtad.common import FakeTransport
+from libtad.datatypes.astro import AstronomyObjectType
+from libtad.datatypes.holidays import Holiday
+from libtad.datatypes.places import LocationId
+from libtad.datatypes.time import TADDateTime
+from enum import Enum
+import unittest
+
+def decoded(value):
+    if isinstance(value, Enum):
+        return value
+    if isinstance(value, list):
+        return [decoded(item) for item in value]
+    if hasattr(value, "__dict__"):
+        return {name: decoded(item) for name, item in vars(value).items() if name != "_node"}
+    return value
+
+class TestLazyParsing(unittest.TestCase):
+    def compare(self, service, call, fields):
+        eager = call()
+        service.lazy_parsing = True
+        lazy = call()
+
+        self.assertEqual(len(lazy), len(eager))
+        for lazy_item, eager_item in zip(lazy, eager):
+            self.assertIsNotNone(lazy_item._node)
+            self.assertIsNone(eager_item._node)
+            for field in fields:
+                self.assertEqual(decoded(getattr(lazy_item, field)), decoded(getattr(eager_item, field)))
+        return lazy
+
+    def test_holidays(self):
+        service = HolidaysService("accessKey", "secretKey", FakeTransport())
+        self.compare(service, lambda: service.holidays_for_country("no", 2021), Holiday._fields)
+        self.assertEqual(len(Holiday._fields), 11)
+
+    def test_decode_on_access(self):
+        service = HolidaysService("accessKey", "secretKey", FakeTransport())
+        service.lazy_parsing = True
+        holiday = service.holidays_for_country("no", 2021)[0]
+
+        self.assertNotIn("date", vars(holiday))
+        date = holiday.date
+        self.assertIn("date", vars(holiday))
+        self.assertIs(holiday.date, date)
+        self.assertNotIn("country", vars(holiday))
+
+        holiday.uid = "changed"
+        self.assertEqual(holiday.uid, "changed")
+
+        holiday.decode_all()
+        self.assertIsNone(holiday._node)
+        self.assertIn("country", vars(holiday))
+        self.assertEqual(holiday.uid, "changed")
+
+    def test_time(self):
+        service = TimeService("accessKey", "secretKey", FakeTransport())
+        service.include_list_of_time_changes = True
+        call = lambda: service.current_time_for_place(LocationId("norway/oslo"))
+        self.compare(service, call, ["id", "geography", "time", "time_changes", "astronomy"])
+
+    def test_convert_time(self):
+        service = ConvertTimeService("accessKey", "secretKey", FakeTransport())
+        eager = service.convert_time(LocationId(187), TADDateTime(2021, 6, 1, 12), [LocationId(lid) for lid in range(1, 4)])
+        service.lazy_parsing = True
+        lazy = service.convert_time(LocationId(187), TADDateTime(2021, 6, 1, 12), [LocationId(lid) for lid in range(1, 4)])
+
+        self.assertEqual([location.id for location in lazy.locations], [location.id for location in eager.locations])
+        self.assertEqual(decoded(lazy.locations[0].time), decoded(eager.locations[0].time))
+
+    def test_astronomy(self):
+        service = AstronomyService("accessKey", "secretKey", FakeTransport())
+        call = lambda: service.get_astronomical_info(AstronomyObjectType.Sun, LocationId("norway/oslo"), TADDateTime(2021, 6, 1), TADDateTime(2021, 6, 5))
+        eager = call()
+        service.lazy_parsing = True
+        lazy = call()
+
+        eager_days = eager[0].objects[0].days
+        lazy_days = lazy[0].objects[0].days
+        self.assertEqual(len(lazy_days), len(eager_days))
+        self.assertNotIn("events", vars(lazy_days[0]))
+        for lazy_day, eager_day in zip(lazy_days, eager_days):
+            for field in ("date", "day_length", "moonphase", "events"):
+                self.assertEqual(decoded(getattr(lazy_day, field)), decoded(getattr(eager_day, field)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+from libtad import TimeService, DSTService, BusinessDateService, TimeOptions, DSTOptions, BusinessDateOptions
+from libtad.common import FakeTransport
+from libtad.datatypes.business import BusinessDaysFilterType
+from libtad.datatypes.places import LocationId
+from libtad.datatypes.time import TADDateTime
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+import unittest
+
+def get_queries(transport):
+    return [{name: values[0] for name, values in parse_qs(urlsplit(url).query).items()} for url in transport.requests]
+
+class TestOptions(unittest.TestCase):
+    def test_snapshot(self):
+        service = TimeService("accessKey", "secretKey", FakeTransport())
+        options = service.options
+
+        self.assertEqual(options, TimeOptions())
+        self.assertIs(service.options, options)
+
+        service.radius = 50
+        self.assertEqual(service.options, TimeOptions(radius=50))
+        service.language.append("de")
+        self.assertEqual(service.options.language, ("en", "de"))
+
+    def test_assign(self):
+        service = TimeService("accessKey", "secretKey", FakeTransport(), options=TimeOptions(language=("de",), radius=10))
+        self.assertEqual(service.language, ["de"])
+        self.assertEqual(service.radius, 10)
+
+        service.options = service.options._replace(include_coordinates=False)
+        self.assertFalse(service.include_coordinates)
+        with self.assertRaises(ValueError):
+            service.options = DSTOptions()
+
+    def test_per_call(self):
+        transport = FakeTransport()
+        service = TimeService("accessKey", "secretKey", transport)
+        service.current_time_for_place(LocationId("norway/oslo"), options=TimeOptions(language=["de"], radius=25))
+        service.current_time_for_place(LocationId("norway/oslo"))
+
+        first, second = get_queries(transport)
+        self.assertEqual((first["lang"], first["radius"]), ("de", "25"))
+        self.assertEqual(second["lang"], "en")
+        self.assertNotIn("radius", second)
+        self.assertIsNone(service.radius)
+
+        with self.assertRaises(ValueError):
+            service.current_time_for_place(LocationId("norway/oslo"), options=DSTOptions())
+
+    def test_dst_year(self):
+        transport = FakeTransport()
+        service = DSTService("accessKey", "secretKey", transport)
+        service.get_daylight_saving_time("no", 2021)
+        service.get_daylight_saving_time("no")
+
+        self.assertTrue(service.include_only_dst_countries)
+        self.assertEqual([query["onlydst"] for query in get_queries(transport)], ["0", "1"])
+
+    def test_list_option(self):
+        transport = FakeTransport()
+        service = BusinessDateService("accessKey", "secretKey", transport)
+        filters = [BusinessDaysFilterType.Sat, BusinessDaysFilterType.Sun]
+        service.get_business_date_for_place(LocationId("norway/oslo"), TADDateTime(2021, 1, 1), 5, options=BusinessDateOptions(filter=filters))
+
+        self.assertEqual(get_queries(transport)[0]["filter"], ",".join(map(str, filters)))
+
+    def test_list_option_in_place(self):
+        transport = FakeTransport()
+        service = BusinessDateService("accessKey", "secretKey", transport)
+        service.filter = [BusinessDaysFilterType.Sat]
+        service.get_business_date_for_place(LocationId("norway/oslo"), TADDateTime(2021, 1, 1), 5)
+        options = service.options
+        service.filter.append(BusinessDaysFilterType.Sun)
+        service.get_business_date_for_place(LocationId("norway/oslo"), TADDateTime(2021, 1, 1), 5)
+
+        self.assertEqual(options.filter, (BusinessDaysFilterType.Sat,))
+        self.assertEqual(service.options.filter, (BusinessDaysFilterType.Sat, BusinessDaysFilterType.Sun))
+        self.assertEqual([query["filter"] for query in get_queries(transport)], ["sat", "sat,sun"])
+
+    def test_shared_service(self):
+        transport = FakeTransport()
+        service = TimeService("accessKey", "secretKey", transport)
+        service.coalesce_requests = False
+        languages = ["en", "de", "fr", "es"] * 10
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda language: service.current_time_for_place(LocationId(language), options=TimeOptions(language=(language,))), languages))
+
+        self.assertTrue(all(query["placeid"] == query["lang"] for query in get_queries(transport)))
+
+
+if __name__ == "__main__":
+    unittest.main()
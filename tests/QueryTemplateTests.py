@@ -0,0 +1,58 @@
+from libtad import TimeService, HolidaysService, BusinessDateService, BusinessDurationService
+from libtad.common import Cache, QueryTemplate, FakeTransport
+from libtad.datatypes.business import BusinessDaysFilterType
+from libtad.datatypes.places import LocationId
+from libtad.datatypes.time import TADDateTime
+from urllib.parse import urlsplit, parse_qs
+import unittest
+
+class TestQueryTemplate(unittest.TestCase):
+    def test_query(self):
+        template = QueryTemplate({"lang": "en,de", "out": "xml"})
+        arguments = template.bind({"placeid": "norway/oslo", "timestamp": "now"})
+
+        self.assertEqual(arguments, {"lang": "en,de", "out": "xml", "placeid": "norway/oslo", "timestamp": "now"})
+        self.assertEqual(arguments.get_query(), "lang=en%2Cde&out=xml&placeid=norway%2Foslo&timestamp=now")
+        self.assertEqual(template.bind({}).get_query(), "lang=en%2Cde&out=xml")
+
+    def test_cache_key(self):
+        template = QueryTemplate({"lang": "en", "out": "xml", "version": 3})
+        varying = {"placeid": "norway/oslo", "accesskey": "key", "geo": 1}
+        arguments = template.bind(varying)
+
+        self.assertEqual(Cache.make_key("timeservice", arguments), Cache.make_key("timeservice", dict(arguments)))
+
+    def test_reuse(self):
+        service = TimeService("accessKey", "secretKey", FakeTransport())
+        service.current_time_for_place(LocationId("norway/oslo"))
+        templates = list(service._templates.values())
+        service.current_time_for_place(LocationId("usa/anchorage"))
+
+        self.assertEqual(len(templates), 1)
+        self.assertEqual(list(service._templates.values()), templates)
+
+    def test_invalidation(self):
+        transport = FakeTransport()
+        service = HolidaysService("accessKey", "secretKey", transport)
+        service.holidays_for_country("no", 2021)
+        service.language = "de"
+        service.holidays_for_country("no", 2021)
+
+        languages = [parse_qs(urlsplit(url).query)["lang"][0] for url in transport.requests]
+        self.assertEqual(languages, ["en", "de"])
+
+    def test_invalidation_in_place(self):
+        for service_type, call in ((BusinessDateService, "get_business_date_for_place"), (BusinessDurationService, "get_business_duration_for_place")):
+            transport = FakeTransport()
+            service = service_type("accessKey", "secretKey", transport)
+            service.filter = [BusinessDaysFilterType.Tue]
+            getattr(service, call)(LocationId("norway/oslo"), TADDateTime(2021, 1, 1), TADDateTime(2021, 2, 1) if service_type is BusinessDurationService else 5)
+            service.filter.append(BusinessDaysFilterType.Wed)
+            getattr(service, call)(LocationId("norway/oslo"), TADDateTime(2021, 1, 1), TADDateTime(2021, 2, 1) if service_type is BusinessDurationService else 5)
+
+            filters = [parse_qs(urlsplit(url).query)["filter"][0] for url in transport.requests]
+            self.assertEqual(filters, ["tue", "tue,wed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+from libtad import HolidaysService, AsyncHolidaysService
+from libtad.common import RateLimiter, FakeTransport, AsyncFakeTransport
+import asyncio
+import time
+import unittest
+
+class TestRateLimiter(unittest.TestCase):
+    def test_unlimited(self):
+        limiter = RateLimiter()
+        self.assertEqual([limiter.reserve() for _ in range(100)], [0.0] * 100)
+        self.assertEqual(limiter.delayed, 0)
+
+    def test_burst_then_rate(self):
+        limiter = RateLimiter(rate=10, burst=3)
+        delays = [limiter.reserve() for _ in range(5)]
+
+        self.assertEqual(delays[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(delays[3], 0.1, places=2)
+        self.assertAlmostEqual(delays[4], 0.2, places=2)
+        self.assertEqual(limiter.delayed, 2)
+
+    def test_shared(self):
+        self.assertIs(RateLimiter.shared(), RateLimiter.shared())
+        service = HolidaysService("accessKey", "secretKey", FakeTransport())
+        self.assertIs(service.rate_limiter, RateLimiter.shared())
+
+    def test_service(self):
+        service = HolidaysService("accessKey", "secretKey", FakeTransport())
+        service.rate_limiter = RateLimiter(rate=20, burst=1)
+        queries = [("no", year) for year in range(2000, 2010)]
+
+        start = time.monotonic()
+        service.holidays_for_countries(queries)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.4)
+        self.assertEqual(service.rate_limiter.delayed, 9)
+
+    def test_async_service(self):
+        service = AsyncHolidaysService("accessKey", "secretKey", AsyncFakeTransport())
+        service.rate_limiter = RateLimiter(rate=20, burst=5)
+        queries = [("no", year) for year in range(2000, 2010)]
+
+        start = time.monotonic()
+        asyncio.run(service.holidays_for_countries(queries))
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+        self.assertEqual(service.rate_limiter.delayed, 5)
+
+if __name__ == "__main__":
+    unittest.main()
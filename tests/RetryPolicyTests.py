@@ -0,0 +1,85 @@
+from libtad import HolidaysService, AsyncHolidaysService
+from libtad.common import RetryPolicy, FakeTransport, AsyncFakeTransport
+from libtad.common.exceptions import ServerSideException
+from urllib.error import HTTPError
+from email.message import Message
+import asyncio
+import time
+import unittest
+
+def failing(failures, error):
+    remaining = [failures]
+
+    def respond(query):
+        if remaining[0] > 0:
+            remaining[0] -= 1
+            raise error()
+        return '<?xml version="1.0" encoding="UTF-8"?><data version="3"><holidays/></data>'
+
+    return respond
+
+def http_error(status, headers=None):
+    message = Message()
+    for name, value in (headers or {}).items():
+        message[name] = value
+    return lambda: HTTPError("https://api.xmltime.com/holidays", status, "Error", message, None)
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_is_retryable(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable(ConnectionResetError()))
+        self.assertTrue(policy.is_retryable(http_error(503)()))
+        self.assertFalse(policy.is_retryable(http_error(404)()))
+        self.assertFalse(policy.is_retryable(ServerSideException("Invalid argument")))
+
+    def test_get_delay(self):
+        policy = RetryPolicy(backoff=0.5, max_backoff=3.0, jitter=False)
+        self.assertEqual([policy.get_delay(attempt) for attempt in range(1, 5)], [0.5, 1.0, 2.0, 3.0])
+        self.assertEqual(policy.get_delay(1, http_error(429, {"Retry-After": "2"})()), 2.0)
+
+    def test_retry(self):
+        transport = FakeTransport(responses={"holidays": failing(2, http_error(503))})
+        service = HolidaysService("accessKey", "secretKey", transport)
+        service.retry_policy = RetryPolicy(backoff=0.01)
+
+        self.assertEqual(service.holidays_for_country("us", 2021), [])
+        self.assertEqual(len(transport.requests), 3)
+
+    def test_max_attempts(self):
+        transport = FakeTransport(responses={"holidays": failing(5, ConnectionResetError)})
+        service = HolidaysService("accessKey", "secretKey", transport)
+        service.retry_policy = RetryPolicy(max_attempts=4, backoff=0.01)
+
+        with self.assertRaises(ConnectionResetError):
+            service.holidays_for_country("us", 2021)
+        self.assertEqual(len(transport.requests), 4)
+
+    def test_not_retryable(self):
+        transport = FakeTransport(responses={"holidays": failing(1, http_error(403))})
+        service = HolidaysService("accessKey", "secretKey", transport)
+
+        with self.assertRaises(HTTPError):
+            service.holidays_for_country("us", 2021)
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_deadline(self):
+        transport = FakeTransport(responses={"holidays": failing(100, ConnectionResetError)})
+        service = HolidaysService("accessKey", "secretKey", transport)
+        service.retry_policy = RetryPolicy(max_attempts=100, backoff=0.05, jitter=False, deadline=0.3)
+
+        start = time.monotonic()
+        with self.assertRaises(ConnectionResetError):
+            service.holidays_for_country("us", 2021)
+        self.assertLess(time.monotonic() - start, 0.3)
+        self.assertEqual(len(transport.requests), 3)
+
+    def test_async_retry(self):
+        transport = AsyncFakeTransport(responses={"holidays": failing(2, ConnectionResetError)})
+        service = AsyncHolidaysService("accessKey", "secretKey", transport)
+        service.retry_policy = RetryPolicy(backoff=0.01)
+
+        self.assertEqual(asyncio.run(service.holidays_for_country("us", 2021)), [])
+        self.assertEqual(len(transport.requests), 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+from libtad import TimeService, AsyncTimeService, HolidaysService, AsyncHolidaysService
+from libtad.common import FakeTransport, AsyncFakeTransport, SingleFlight, AsyncSingleFlight, PooledTransport, AsyncPooledTransport
+from libtad.common.exceptions import DeadlineExceededException
+from libtad.datatypes.places import LocationId
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+import time
+import unittest
+
+class TestSingleFlight(unittest.TestCase):
+    def test_threads(self):
+        transport = FakeTransport(latency=0.2)
+        service = TimeService("accessKey", "secretKey", transport)
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            results = list(executor.map(lambda _: service.current_time_for_place(LocationId(187)), range(20)))
+
+        self.assertEqual(len(transport.requests), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_default_transport(self):
+        services = [TimeService("accessKey", "secretKey") for _ in range(2)]
+        arguments = {"accesskey": "accessKey", "placeid": "187"}
+
+        self.assertIs(services[0].transport, PooledTransport.shared())
+        self.assertIs(services[1].transport, services[0].transport)
+        self.assertEqual(services[0]._get_flight_key(arguments), services[1]._get_flight_key(arguments))
+        self.assertIs(AsyncTimeService("accessKey", "secretKey").transport, AsyncPooledTransport.shared())
+
+    def test_deadlines(self):
+        transport = FakeTransport(latency=0.5)
+        service = HolidaysService("accessKey", "secretKey", transport)
+
+        def impatient():
+            with self.assertRaises(DeadlineExceededException):
+                service.holidays_for_country("us", 2021, deadline=0.2)
+
+        def patient():
+            time.sleep(0.05)
+            return service.holidays_for_country("us", 2021)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(impatient)
+            second = executor.submit(patient)
+            first.result()
+            self.assertEqual(len(second.result()), 10)
+
+        # Requests that time out are not recorded by the fake transport.
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_async_deadlines(self):
+        transport = AsyncFakeTransport(latency=0.5)
+        service = AsyncHolidaysService("accessKey", "secretKey", transport)
+
+        async def patient():
+            await asyncio.sleep(0.05)
+            return await service.holidays_for_country("us", 2021)
+
+        async def run():
+            return await asyncio.gather(service.holidays_for_country("us", 2021, deadline=0.2), patient(), return_exceptions=True)
+
+        impatient, result = asyncio.run(run())
+        self.assertIsInstance(impatient, DeadlineExceededException)
+        self.assertEqual(len(result), 10)
+        # Requests that time out are not recorded by the fake transport.
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_different_arguments(self):
+        transport = FakeTransport(latency=0.1)
+        service = TimeService("accessKey", "secretKey", transport)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda lid: service.current_time_for_place(LocationId(lid)), [1, 2, 1, 2]))
+
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_disabled(self):
+        transport = FakeTransport(latency=0.1)
+        service = TimeService("accessKey", "secretKey", transport)
+        service.coalesce_requests = False
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: service.current_time_for_place(LocationId(187)), range(4)))
+
+        self.assertEqual(len(transport.requests), 4)
+
+    def test_exceptions(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def fail():
+            started.set()
+            release.wait()
+            raise RuntimeError("failed")
+
+        def call():
+            try:
+                flight.do("key", fail)
+            except RuntimeError as exception:
+                errors.append(exception)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=call)
+        follower.start()
+        release.set()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(len(errors), 2)
+
+    def test_async(self):
+        transport = AsyncFakeTransport(latency=0.1)
+        service = AsyncTimeService("accessKey", "secretKey", transport)
+
+        async def fetch_all():
+            return await asyncio.gather(*[service.current_time_for_place(LocationId(187)) for _ in range(20)])
+
+        results = asyncio.run(fetch_all())
+        self.assertEqual(len(transport.requests), 1)
+        self.assertEqual(len(results), 20)
+
+    def test_async_closed_loops(self):
+        flight = AsyncSingleFlight()
+
+        async def call():
+            return await flight.do("key", lambda: asyncio.sleep(10))
+
+        async def abandon():
+            asyncio.ensure_future(call())
+            await asyncio.sleep(0)
+
+        for _ in range(3):
+            asyncio.run(abandon())
+
+        self.assertEqual(len(flight._AsyncSingleFlight__loops), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+from libtad import PlacesService, AsyncPlacesService, DSTService
+from libtad.common import FakeTransport, AsyncFakeTransport
+from libtad.common.exceptions import ServerSideException
+import asyncio
+import tracemalloc
+import unittest
+
+class TestStreaming(unittest.TestCase):
+    def test_iter_places(self):
+        service = PlacesService("accessKey", "secretKey", FakeTransport(size=100))
+        places = list(service.iter_places())
+
+        self.assertEqual(len(places), 100)
+        self.assertEqual([place.id for place in places], [place.id for place in service.get_places()])
+        self.assertEqual(places[0].geography.name, "Place 1")
+
+    def test_iter_places_memory(self):
+        transport = FakeTransport(size=20000)
+        transport.responses["places"] = transport.get("https://api.xmltime.com/places")
+        service = PlacesService("accessKey", "secretKey", transport)
+
+        tracemalloc.start()
+        for _ in service.iter_places():
+            pass
+        _, streamed = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        service.get_places()
+        _, loaded = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertLess(streamed * 10, loaded)
+
+    def test_iter_places_error(self):
+        transport = FakeTransport({"places": '<data version="3"><error>Access denied</error></data>'})
+        service = PlacesService("accessKey", "secretKey", transport)
+
+        with self.assertRaises(ServerSideException):
+            list(service.iter_places())
+
+    def test_iter_daylight_saving_time(self):
+        service = DSTService("accessKey", "secretKey", FakeTransport(size=50))
+        service.include_time_changes = True
+        entries = list(service.iter_daylight_saving_time(year=2021))
+
+        self.assertEqual(len(entries), 50)
+        self.assertEqual(entries[0].region.country.id, "c0")
+        self.assertEqual(len(entries[0].region.locations), 10)
+        self.assertEqual(len(entries[0].time_changes), 2)
+        self.assertEqual(entries[-1].dst_end.year, 2021)
+
+    def test_async_iter_places(self):
+        service = AsyncPlacesService("accessKey", "secretKey", AsyncFakeTransport(size=5))
+
+        async def collect():
+            return [place.id async for place in service.iter_places()]
+
+        self.assertEqual(asyncio.run(collect()), ["1", "2", "3", "4", "5"])
+
+
+if __name__ == "__main__":
+    unittest.main()
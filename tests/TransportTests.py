@@ -0,0 +1,44 @@
+from libtad import TimeService, HolidaysService, PlacesService
+from libtad.common import FakeTransport, PooledTransport, ConnectionPool
+from libtad.common.exceptions import ServerSideException
+from libtad.datatypes.places import LocationId
+from urllib.parse import urlsplit, parse_qs
+import unittest
+
+class TestTransport(unittest.TestCase):
+    def test_default_transport(self):
+        service = TimeService("accessKey", "secretKey")
+        self.assertIsInstance(service.transport, PooledTransport)
+        self.assertIs(service.transport.pool, ConnectionPool.shared())
+
+    def test_fake_transport(self):
+        transport = FakeTransport()
+        service = TimeService("accessKey", "secretKey", transport)
+        result = service.current_time_for_place([LocationId(lid) for lid in range(1, 6)])
+
+        self.assertEqual([location.id for location in result], ["1", "2", "3", "4", "5"])
+        self.assertEqual(len(transport.requests), 1)
+
+        url = urlsplit(transport.requests[0])
+        self.assertEqual(url.path, "/timeservice")
+        self.assertEqual(parse_qs(url.query)["placeid"], ["1,2,3,4,5"])
+
+    def test_size(self):
+        service = PlacesService("accessKey", "secretKey", FakeTransport(size=25))
+        self.assertEqual(len(service.get_places()), 25)
+
+    def test_custom_response(self):
+        transport = FakeTransport({"holidays": '<data version="3"><error>Invalid country</error></data>'})
+        service = HolidaysService("accessKey", "secretKey", transport)
+
+        with self.assertRaises(ServerSideException):
+            service.holidays_for_country("xx", 2021)
+
+    def test_transport_setter(self):
+        service = TimeService("accessKey", "secretKey", FakeTransport())
+        service.transport = None
+        self.assertIsInstance(service.transport, PooledTransport)
+
+
+if __name__ == "__main__":
+    unittest.main()